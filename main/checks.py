@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.core.checks import Error, register
+
+PROCESS_LOCAL_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+@register(deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    """
+    ✅ 운영 배포(manage.py check --deploy)에서는 기본 캐시가 프로세스끼리 공유되어야 함
+    세대 번호(main.utils.cache)로 블로그 캐시 / 검색 결과 캐시 / 자동완성 색인의 변경을 다른 프로세스에 알리기 때문
+    (프로세스 하나로만 운영한다면 SILENCED_SYSTEM_CHECKS에 'main.E001'을 추가)
+    """
+    backend = settings.CACHES.get('default', {}).get('BACKEND')
+    if backend not in PROCESS_LOCAL_CACHES:
+        return []
+    return [Error(
+        f"기본 캐시({backend})가 프로세스마다 따로라서 다른 프로세스의 캐시 무효화/자동완성 변경이 반영되지 않습니다.",
+        hint="settings.CACHES['default']를 Redis/Memcached 같은 공유 캐시로 설정하세요.",
+        id='main.E001',
+    )]
@@ -0,0 +1,203 @@
+import json
+import math
+import time
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+from main.models import CustomUser, Profile
+from main.search.cache import invalidate_search_cache, POSTS, PROFILES
+from main.search.corpus import CorpusGenerator
+from main.utils.hangul import chosung_key
+from main.views.search import (
+    BlogPostSearchView, GlobalBlogSearchView, GlobalNickAndIdSearchView, GlobalPostSearchView,
+    SearchAutocompleteView,
+)
+
+# ✅ 엔드포인트별 (경로, 뷰, 요청 비율)
+ENDPOINTS = {
+    "global_post": ('/search/global-post/', GlobalPostSearchView, 0.3),
+    "blog_post": ('/search/blog/', BlogPostSearchView, 0.2),
+    "global_blog": ('/search/global-blog/', GlobalBlogSearchView, 0.1),
+    "profile_exact": ('/search/global-nickandid/', GlobalNickAndIdSearchView, 0.1),
+    "profile_fuzzy": ('/search/global-nickandid/', GlobalNickAndIdSearchView, 0.1),
+    "profile_chosung": ('/search/global-nickandid/', GlobalNickAndIdSearchView, 0.1),
+    "autocomplete": ('/search/autocomplete/', SearchAutocompleteView, 0.1),
+}
+SAMPLE_PROFILES = 1000  # ✅ 검색어/블로그를 고를 프로필 표본 수
+
+
+def percentile(values, p):
+    """ 정렬된 값 목록의 p 백분위수 (nearest-rank) """
+    if not values:
+        return None
+    return values[max(math.ceil(p / 100 * len(values)) - 1, 0)]
+
+
+def rows_read():
+    """ MySQL 세션의 Handler_read_* 합계 (인덱스/테이블에서 읽은 행 수), MySQL이 아니면 None """
+    if connection.vendor != 'mysql':
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute("SHOW SESSION STATUS LIKE 'Handler_read%'")
+        return sum(int(value) for _, value in cursor.fetchall())
+
+
+class Command(BaseCommand):
+    help = (
+        "고정 seed 검색어 묶음을 검색 API(블로그 내 검색, 전체 글 검색, 블로그/사용자 검색, 자동완성)에 재생해서 "
+        "p50/p95/p99 응답 시간, 요청당 쿼리 수, 읽은 행 수(MySQL)를 측정하고 JSON 기준값으로 저장/비교합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=500, help="보낼 요청 수 (기본 500)")
+        parser.add_argument('--seed', type=int, default=7, help="검색어 seed (기본 7)")
+        parser.add_argument('--cached', action='store_true', help="검색 결과 캐시를 유지 (기본은 요청마다 캐시 무효화)")
+        parser.add_argument('--output', default='search_benchmark.json', help="결과 JSON 경로 (기본 search_benchmark.json)")
+        parser.add_argument('--baseline', help="비교할 이전 결과 JSON 경로")
+        parser.add_argument('--tolerance', type=float, default=0.2,
+                            help="기준값 대비 p95/쿼리 수가 이 비율보다 늘면 실패 (기본 0.2 = 20%%)")
+
+    def handle(self, *args, **options):
+        if options['requests'] < 1:
+            raise CommandError("--requests는 1 이상이어야 합니다.")
+
+        # ✅ APIRequestFactory의 호스트('testserver')가 ALLOWED_HOSTS에 없으면 DisallowedHost로 실패하므로 측정 중에만 허용
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+            self.benchmark(options)
+
+    def benchmark(self, options):
+        profiles = list(Profile.objects.order_by('id').values('user_id', 'urlname', 'username', 'blog_name'))
+        if not profiles:
+            raise CommandError("프로필이 없습니다. generate_search_corpus로 말뭉치를 먼저 만드세요.")
+
+        generator = CorpusGenerator(options['seed'])
+        rng = generator.random
+        profiles = rng.sample(profiles, min(SAMPLE_PROFILES, len(profiles)))
+        owners = CustomUser.objects.in_bulk([profile['user_id'] for profile in profiles])
+        names = list(ENDPOINTS)
+        weights = [ENDPOINTS[name][2] for name in names]
+        factory = APIRequestFactory()
+        views = {view: view.as_view() for _, view, _ in ENDPOINTS.values()}
+
+        samples = {name: {"latency": [], "queries": [], "rows": [], "errors": 0} for name in names}
+        for _ in range(options['requests']):
+            name = rng.choices(names, weights)[0]
+            path, view, _ = ENDPOINTS[name]
+            profile = rng.choice(profiles)
+            request = factory.get(path, self.params(name, generator, profile))
+            if name == "blog_post" and rng.random() < 0.5:
+                force_authenticate(request, user=owners[profile['user_id']])  # ✅ 절반은 블로그 주인이 검색
+            else:
+                force_authenticate(request, user=AnonymousUser())
+
+            if not options['cached']:
+                invalidate_search_cache(POSTS)
+                invalidate_search_cache(PROFILES)
+
+            rows_before = rows_read()
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                response = views[view](request)
+                response.render()
+                elapsed = time.perf_counter() - started
+            rows_after = rows_read()
+
+            sample = samples[name]
+            if response.status_code != 200:
+                sample["errors"] += 1
+                continue
+            sample["latency"].append(elapsed * 1000)
+            sample["queries"].append(len(queries.captured_queries))
+            if rows_before is not None:
+                sample["rows"].append(rows_after - rows_before)
+
+        report = {
+            "created_at": timezone.now().isoformat(),
+            "database": connection.vendor,
+            "seed": options['seed'],
+            "requests": options['requests'],
+            "cached": options['cached'],
+            "profiles": Profile.objects.count(),
+            "endpoints": {name: self.summarize(sample) for name, sample in samples.items() if sample["latency"]},
+        }
+        self.print_report(report)
+
+        with open(options['output'], 'w', encoding='utf-8') as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+        self.stdout.write(f"결과를 {options['output']}에 저장했습니다.")
+
+        if options['baseline']:
+            self.compare(report, options['baseline'], options['tolerance'])
+
+    @staticmethod
+    def params(name, generator, profile):
+        """ 엔드포인트별 검색어 파라미터 """
+        if name == "global_post":
+            return {'q': generator.post_query()}
+        if name == "blog_post":
+            return {'q': generator.post_query(), 'urlname': profile['urlname']}
+        if name == "global_blog":
+            return {'q': profile['blog_name'][:2]}
+        if name == "profile_exact":
+            return {'q': profile['username'][:2]}
+        if name == "profile_fuzzy":
+            return {'q': generator.typo(profile['username']), 'mode': 'fuzzy'}
+        if name == "profile_chosung":
+            return {'q': chosung_key(profile['username'])[:2], 'mode': 'chosung'}
+        return {'q': profile['username'][:generator.random.randint(1, 3)]}
+
+    @staticmethod
+    def summarize(sample):
+        latency = sorted(sample["latency"])
+        rows = sample["rows"]
+        return {
+            "count": len(latency),
+            "errors": sample["errors"],
+            "p50_ms": round(percentile(latency, 50), 3),
+            "p95_ms": round(percentile(latency, 95), 3),
+            "p99_ms": round(percentile(latency, 99), 3),
+            "mean_queries": round(sum(sample["queries"]) / len(latency), 2),
+            "max_queries": max(sample["queries"]),
+            "mean_rows_read": round(sum(rows) / len(rows), 1) if rows else None,
+            "max_rows_read": max(rows) if rows else None,
+        }
+
+    def print_report(self, report):
+        self.stdout.write(
+            f"{'endpoint':<16}{'count':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'queries':>9}{'rows read':>11}"
+        )
+        for name, stats in report["endpoints"].items():
+            rows = "-" if stats["mean_rows_read"] is None else f"{stats['mean_rows_read']:.0f}"
+            self.stdout.write(
+                f"{name:<16}{stats['count']:>7}{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}"
+                f"{stats['p99_ms']:>10.2f}{stats['mean_queries']:>9.1f}{rows:>11}"
+                + (f"  (오류 {stats['errors']}건)" if stats["errors"] else "")
+            )
+
+    def compare(self, report, baseline_path, tolerance):
+        """ ✅ 기준 JSON과 엔드포인트별 p95 / 평균 쿼리 수 비교, tolerance보다 나빠지면 CommandError """
+        try:
+            with open(baseline_path, encoding='utf-8') as file:
+                baseline = json.load(file)
+        except (OSError, ValueError) as error:
+            raise CommandError(f"기준 파일을 읽을 수 없습니다: {error}")
+
+        regressions = []
+        for name, stats in report["endpoints"].items():
+            base = baseline.get("endpoints", {}).get(name)
+            if not base:
+                continue
+            for metric in ("p95_ms", "mean_queries"):
+                before, after = base[metric], stats[metric]
+                change = (after - before) / before if before else 0
+                self.stdout.write(f"{name:<16}{metric:<14}{before:>10}{after:>10}  {change:+.1%}")
+                if change > tolerance:
+                    regressions.append(f"{name} {metric} {change:+.1%}")
+
+        if regressions:
+            raise CommandError("기준값보다 느려졌습니다: " + ", ".join(regressions))
+        self.stdout.write(self.style.SUCCESS("기준값 대비 성능 저하가 없습니다."))
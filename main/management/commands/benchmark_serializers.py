@@ -0,0 +1,66 @@
+import timeit
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth.models import AnonymousUser
+from rest_framework.test import APIRequestFactory
+from rest_framework.request import Request
+from main.models import Post, Comment, Neighbor
+from main.serializers import PostSerializer, CommentSerializer, NeighborSerializer
+from main.serializers.fast import serialize_posts, serialize_comments, serialize_neighbors
+
+
+class Command(BaseCommand):
+    help = "기존 DRF 시리얼라이저와 빠른 직렬화(main.serializers.fast)의 출력 일치 여부와 속도를 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=200, help="비교할 객체 수 (기본 200)")
+        parser.add_argument('--repeat', type=int, default=5, help="측정 반복 횟수 (기본 5, 최솟값 사용)")
+
+    def handle(self, *args, **options):
+        limit = options['limit']
+        repeat = options['repeat']
+
+        post = Post.objects.order_by('-id').first()
+        viewer = post.author if post else AnonymousUser()
+        request = Request(APIRequestFactory().get('/'))
+        request.user = viewer
+        context = {'request': request}
+
+        posts = Post.objects.order_by('-id')[:limit]
+        comments = Comment.objects.filter(post=post, parent__isnull=True) if post else Comment.objects.none()
+        neighbors = Neighbor.objects.order_by('-id')[:limit]
+
+        cases = [
+            (
+                "posts",
+                lambda: PostSerializer(posts, many=True, context=context).data,
+                lambda: serialize_posts(posts, request),
+            ),
+            (
+                "comments",
+                lambda: CommentSerializer(comments, many=True, context=context).data,
+                lambda: serialize_comments(comments, viewer),
+            ),
+            (
+                "neighbors",
+                lambda: NeighborSerializer(neighbors, many=True).data,
+                lambda: serialize_neighbors(neighbors),
+            ),
+        ]
+
+        mismatched = []
+        for name, drf, fast in cases:
+            expected = [dict(item) for item in drf()]
+            actual = fast()
+            if expected != actual:
+                mismatched.append(name)
+
+            drf_time = min(timeit.repeat(drf, number=1, repeat=repeat))
+            fast_time = min(timeit.repeat(fast, number=1, repeat=repeat))
+            self.stdout.write(
+                f"{name:<10} {len(actual):>5}개  drf {drf_time * 1000:8.2f}ms  "
+                f"fast {fast_time * 1000:8.2f}ms  x{drf_time / fast_time if fast_time else 0:5.1f}  "
+                f"{'일치' if name not in mismatched else '불일치'}"
+            )
+
+        if mismatched:
+            raise CommandError(f"출력이 기존 시리얼라이저와 다릅니다: {', '.join(mismatched)}")
@@ -0,0 +1,101 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Count
+from main.models import CustomUser, Post, Heart, Neighbor
+from main.models.blogRecommendation import BlogRecommendation
+
+# ✅ 주제 분포에서 제외하는 기본값 (선택하지 않은 글은 취향 정보가 없음)
+NO_SUBJECT = "주제 선택 안 함"
+
+
+class Command(BaseCommand):
+    help = "서로이웃 그래프(친구의 친구)와 주제 선호도를 희소 행렬 곱으로 계산해서 사용자별 추천 블로그를 다시 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top-n', type=int, default=20, help="사용자마다 저장할 추천 블로그 수 (기본 20)")
+        parser.add_argument('--batch-size', type=int, default=512, help="한 번에 계산할 사용자 수 (기본 512)")
+        parser.add_argument('--neighbor-weight', type=float, default=0.6, help="친구의 친구 점수 가중치 (기본 0.6)")
+        parser.add_argument('--subject-weight', type=float, default=0.4, help="주제 선호도 점수 가중치 (기본 0.4)")
+
+    def handle(self, *args, **options):
+        try:
+            import numpy as np
+            from scipy import sparse
+            from main.utils.similarity import normalize_rows, top_k_rows
+        except ImportError:
+            raise CommandError("추천 계산에는 numpy, scipy가 필요합니다. (pip install numpy scipy)")
+
+        top_n, batch_size = options['top_n'], options['batch_size']
+        if top_n < 1 or batch_size < 1:
+            raise CommandError("--top-n, --batch-size는 1 이상이어야 합니다.")
+
+        user_ids = list(CustomUser.objects.filter(profile__isnull=False).order_by('id').values_list('id', flat=True))
+        if not user_ids:
+            self.stdout.write("계산할 사용자가 없습니다.")
+            return
+        user_index = {user_id: i for i, user_id in enumerate(user_ids)}
+        subject_index = {subject: i for i, (subject, _) in enumerate(Post.SUBJECT_CHOICES) if subject != NO_SUBJECT}
+        size = len(user_ids)
+
+        def matrix(entries, shape):
+            """ (행, 열, 값) 목록 → CSR 행렬 (같은 칸의 값은 합산) """
+            rows, cols, values = zip(*entries) if entries else ((), (), ())
+            return sparse.csr_matrix((np.asarray(values, dtype=np.float32), (rows, cols)), shape=shape)
+
+        # ✅ 1. 서로이웃 인접 행렬 (양방향, 값은 1)
+        edges = []
+        for from_id, to_id in Neighbor.objects.filter(status="accepted").values_list('from_user_id', 'to_user_id'):
+            if from_id in user_index and to_id in user_index and from_id != to_id:
+                edges.append((user_index[from_id], user_index[to_id], 1))
+                edges.append((user_index[to_id], user_index[from_id], 1))
+        adjacency = matrix(edges, (size, size))
+        adjacency.data[:] = 1
+
+        # ✅ 2. 주제 분포: 블로그가 쓰는 주제(내 글) / 사용자가 좋아하는 주제(내 글 + 좋아요 누른 글)
+        written = [
+            (user_index[row['author_id']], subject_index[row['subject']], row['count'])
+            for row in Post.objects.filter(is_complete=True).values('author_id', 'subject').annotate(count=Count('id'))
+            if row['author_id'] in user_index and row['subject'] in subject_index
+        ]
+        hearted = [
+            (user_index[row['user_id']], subject_index[row['post__subject']], row['count'])
+            for row in Heart.objects.values('user_id', 'post__subject').annotate(count=Count('id'))
+            if row['user_id'] in user_index and row['post__subject'] in subject_index
+        ]
+        blog_subjects = normalize_rows(matrix(written, (size, len(subject_index))))
+        user_interests = normalize_rows(matrix(written + hearted, (size, len(subject_index))))
+        blog_subjects_t = blog_subjects.T.tocsr()
+
+        # ✅ 3. 사용자 batch_size명씩: 함께 아는 서로이웃 수(A @ A) + 주제 코사인 유사도, 본인/기존 서로이웃 제외
+        identity = sparse.identity(size, dtype=np.float32, format='csr')
+        saved = 0
+        for start in range(0, size, batch_size):
+            end = min(start + batch_size, size)
+            mutual = (adjacency[start:end] @ adjacency).tocsr()
+
+            row_max = np.asarray(mutual.max(axis=1).todense()).ravel()
+            row_max[row_max == 0] = 1
+            neighbor_score = sparse.diags(1 / row_max).astype(np.float32) @ mutual
+            subject_score = user_interests[start:end] @ blog_subjects_t
+
+            scores = (options['neighbor_weight'] * neighbor_score + options['subject_weight'] * subject_score).tocsr()
+            blocked = ((adjacency[start:end] + identity[start:end]) > 0).astype(np.float32)
+            scores = (scores - scores.multiply(blocked)).tocsr()
+            scores.eliminate_zeros()
+
+            entries = []
+            for offset, recommended in enumerate(top_k_rows(scores, top_n)):
+                entries.extend(
+                    BlogRecommendation(
+                        user_id=user_ids[start + offset], recommended_id=user_ids[col],
+                        score=score, mutual_count=int(mutual[offset, col]), rank=rank,
+                    )
+                    for rank, (col, score) in enumerate(recommended)
+                )
+
+            with transaction.atomic():
+                BlogRecommendation.objects.filter(user_id__in=user_ids[start:end]).delete()
+                BlogRecommendation.objects.bulk_create(entries, batch_size=1000)
+            saved += len(entries)
+
+        self.stdout.write(self.style.SUCCESS(f"사용자 {size}명 → 추천 블로그 {saved}개를 저장했습니다."))
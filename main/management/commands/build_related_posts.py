@@ -0,0 +1,70 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from main.models.post import Post, PostText
+from main.models.relatedPost import RelatedPost
+
+
+def load_documents(batch_size=1000):
+    """ 작성 완료된 게시물의 (ID 목록, 제목 + 본문 텍스트 목록), body 문서가 없는 글만 PostText에서 읽음 """
+    post_ids, documents = [], []
+    rows = Post.objects.filter(is_complete=True).order_by('id').values_list('id', 'title', 'body')
+    for start in range(0, rows.count(), batch_size):
+        batch = list(rows[start:start + batch_size])
+
+        legacy = {post_id: [] for post_id, _, body in batch if body is None}
+        for post_id, content in PostText.objects.filter(post_id__in=list(legacy)).order_by('id').values_list(
+                'post_id', 'content'):
+            legacy[post_id].append(content)
+
+        for post_id, title, body in batch:
+            contents = legacy[post_id] if body is None else [block['content'] for block in body]
+            post_ids.append(post_id)
+            documents.append(" ".join([title, *contents]))
+    return post_ids, documents
+
+
+class Command(BaseCommand):
+    help = "게시물 제목/본문의 문자 n-gram TF-IDF 코사인 유사도로 관련 글(RelatedPost)을 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top-k', type=int, default=10, help="게시물마다 저장할 관련 글 수 (기본 10)")
+        parser.add_argument('--batch-size', type=int, default=256, help="한 번에 유사도를 계산할 게시물 수 (기본 256)")
+        parser.add_argument('--min-df', type=int, default=2, help="이 개수 미만의 글에만 나오는 n-gram은 제외 (기본 2)")
+
+    def handle(self, *args, **options):
+        try:
+            from main.utils.similarity import tfidf_matrix, cosine_top_k
+        except ImportError:
+            raise CommandError("관련 글 계산에는 numpy, scipy가 필요합니다. (pip install numpy scipy)")
+
+        top_k, batch_size = options['top_k'], options['batch_size']
+        if top_k < 1 or batch_size < 1:
+            raise CommandError("--top-k, --batch-size는 1 이상이어야 합니다.")
+
+        post_ids, documents = load_documents()
+        if not post_ids:
+            self.stdout.write("계산할 게시물이 없습니다.")
+            return
+        matrix = tfidf_matrix(documents, min_df=options['min_df'])
+
+        # ✅ batch_size 게시물씩 유사도를 계산하고, 해당 게시물들의 관련 글만 교체
+        saved, entries, batch_posts = 0, [], []
+        for row, neighbors in cosine_top_k(matrix, top_k, batch_size=batch_size):
+            batch_posts.append(post_ids[row])
+            entries.extend(
+                RelatedPost(post_id=post_ids[row], related_id=post_ids[col], score=score, rank=rank)
+                for rank, (col, score) in enumerate(neighbors)
+            )
+            if len(batch_posts) == batch_size or row == len(post_ids) - 1:
+                with transaction.atomic():
+                    RelatedPost.objects.filter(post_id__in=batch_posts).delete()
+                    RelatedPost.objects.bulk_create(entries, batch_size=1000)
+                saved += len(entries)
+                entries, batch_posts = [], []
+
+        # ✅ 더 이상 대상이 아닌 게시물(임시 저장으로 바뀐 글 등)의 이전 결과 정리
+        RelatedPost.objects.exclude(post_id__in=Post.objects.filter(is_complete=True).values('id')).delete()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"게시물 {len(post_ids)}개, 어휘 {matrix.shape[1]}개 → 관련 글 {saved}개를 저장했습니다."
+        ))
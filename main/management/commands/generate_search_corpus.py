@@ -0,0 +1,140 @@
+from datetime import timedelta
+from django.contrib.auth.hashers import make_password, UNUSABLE_PASSWORD_PREFIX
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from main.models import CustomUser, Profile, Post, PostText, PostImage
+from main.search.autocomplete import GENERATION_NAME as AUTOCOMPLETE_GENERATION
+from main.search.cache import invalidate_search_cache, POSTS, PROFILES
+from main.search.corpus import CorpusGenerator
+from main.search.index import index_posts
+from main.search.trigrams import index_profiles
+from main.utils.cache import bump_generation
+from main.utils.hangul import chosung_key
+
+USER_PREFIX = "bench"  # ✅ 생성한 사용자 ID 접두사 (bench0000001 형식)
+USER_ID_PATTERN = rf"^{USER_PREFIX}[0-9]{{7}}$"
+
+
+def corpus_users():
+    """
+    ✅ 이 명령어로 만든 사용자만 (--clear 삭제 / 중복 생성 확인용)
+    ID가 정확히 bench + 숫자 7자리이고 비밀번호가 사용 불가('!'로 시작)인 사용자
+    → 회원가입은 항상 사용 가능한 비밀번호로 저장하므로 "benchmark_fan", "bench0000001" 같은 실제 계정은 제외됨
+    """
+    return CustomUser.objects.filter(id__regex=USER_ID_PATTERN, password__startswith=UNUSABLE_PASSWORD_PREFIX)
+
+VISIBILITY_WEIGHTS = (('everyone', 0.8), ('mutual', 0.15), ('me', 0.05))
+
+
+class Command(BaseCommand):
+    help = (
+        "검색 성능 측정용 한국어 말뭉치(사용자/프로필, 게시물, 본문 블록, 이미지 설명)를 고정 seed로 생성합니다. "
+        "예: --users 10000 --posts-per-user 20 --blocks-per-post 5 → 본문 블록 100만 개"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000, help="생성할 사용자 수 (기본 1000)")
+        parser.add_argument('--posts-per-user', type=int, default=20, help="사용자당 게시물 수 (기본 20)")
+        parser.add_argument('--blocks-per-post', type=int, default=5, help="게시물당 본문 블록 수 (기본 5)")
+        parser.add_argument('--images-per-post', type=int, default=1, help="게시물당 이미지(설명 포함) 수 (기본 1)")
+        parser.add_argument('--days', type=int, default=365, help="작성일을 흩뿌릴 기간 (기본 최근 365일)")
+        parser.add_argument('--seed', type=int, default=42, help="난수 seed (기본 42)")
+        parser.add_argument('--batch-size', type=int, default=200, help="한 번에 만들 사용자 수 (기본 200)")
+        parser.add_argument('--clear', action='store_true', help="이전에 생성한 말뭉치 사용자와 글을 먼저 삭제")
+
+    def handle(self, *args, **options):
+        for name in ('users', 'posts_per_user', 'batch_size', 'days'):
+            if options[name] < 1:
+                raise CommandError(f"--{name.replace('_', '-')}는 1 이상이어야 합니다.")
+
+        if options['clear']:
+            deleted, _ = corpus_users().delete()
+            self.stdout.write(f"기존 말뭉치 {deleted}행을 삭제했습니다.")
+        elif corpus_users().exists():
+            raise CommandError("이미 생성한 말뭉치 사용자가 있습니다. --clear로 먼저 삭제하세요.")
+
+        generator = CorpusGenerator(options['seed'])
+        password = make_password(None)  # ✅ 로그인할 수 없는 비밀번호 (해싱 1번)
+        now = timezone.now()
+        counts = {"users": 0, "posts": 0, "texts": 0, "images": 0}
+
+        for start in range(0, options['users'], options['batch_size']):
+            end = min(start + options['batch_size'], options['users'])
+            with transaction.atomic():
+                self.create_batch(generator, range(start, end), password, now, options, counts)
+            self.stdout.write(f"사용자 {counts['users']}명, 게시물 {counts['posts']}개, 본문 블록 {counts['texts']}개 생성")
+
+        # ✅ bulk_create는 시그널을 보내지 않으므로 검색 결과 캐시/자동완성 색인을 직접 무효화
+        invalidate_search_cache(POSTS)
+        invalidate_search_cache(PROFILES)
+        bump_generation(AUTOCOMPLETE_GENERATION)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"사용자 {counts['users']}명, 게시물 {counts['posts']}개, 본문 블록 {counts['texts']}개, "
+            f"이미지 {counts['images']}개를 만들었습니다. (seed={options['seed']})"
+        ))
+
+    def create_batch(self, generator, numbers, password, now, options, counts):
+        """ 사용자 묶음 하나의 사용자/프로필/게시물/본문/이미지를 만들고 검색 색인까지 채움 """
+        rng = generator.random
+        users = [CustomUser(id=f"{USER_PREFIX}{number:07d}", password=password) for number in numbers]
+        CustomUser.objects.bulk_create(users)
+
+        profiles = []
+        for user in users:
+            name = generator.person_name()
+            blog_name = generator.blog_name(name)
+            profiles.append(Profile(
+                user=user, username=name, blog_name=blog_name, urlname=user.id,
+                username_chosung=chosung_key(name), blog_name_chosung=chosung_key(blog_name),
+            ))
+        Profile.objects.bulk_create(profiles)
+
+        posts, created_at = [], []
+        subjects = [subject for subject, _ in Post.SUBJECT_CHOICES]
+        visibilities, weights = zip(*VISIBILITY_WEIGHTS)
+        for user in users:
+            for _ in range(options['posts_per_user']):
+                subject = rng.choice(subjects)
+                posts.append(Post(
+                    author=user, title=generator.title(), subject=subject,
+                    keyword=Post.keyword_for_subject(subject),
+                    visibility=rng.choices(visibilities, weights)[0], is_complete=True,
+                ))
+                created_at.append(now - timedelta(seconds=rng.randrange(options['days'] * 86400)))
+        Post.objects.bulk_create(posts)
+
+        # ✅ MySQL은 bulk_create 후 pk를 채워 주지 않으므로 작성자 기준으로 다시 읽어서 순서대로 맞춤
+        posts = list(Post.objects.filter(author__in=users).order_by('author_id', 'id'))
+        for post, created in zip(posts, created_at):
+            post.created_at = created
+        Post.objects.bulk_update(posts, ['created_at'], batch_size=1000)
+
+        texts = [
+            PostText(post=post, content=generator.paragraph())
+            for post in posts for _ in range(options['blocks_per_post'])
+        ]
+        PostText.objects.bulk_create(texts, batch_size=1000)
+        images = [
+            PostImage(post=post, image="default/bench.jpg", caption=generator.caption(), is_representative=i == 0)
+            for post in posts for i in range(options['images_per_post'])
+        ]
+        PostImage.objects.bulk_create(images, batch_size=1000)
+
+        # ✅ body 문서(이중 읽기) 채우기
+        blocks = {post.id: [] for post in posts}
+        for text in PostText.objects.filter(post__in=posts).order_by('id'):
+            blocks[text.post_id].append(text.to_block())
+        for post in posts:
+            post.body = blocks[post.id]
+        Post.objects.bulk_update(posts, ['body'], batch_size=500)
+
+        # ✅ 검색 색인 (게시물 역색인 + 프로필 trigram)
+        index_posts([post.id for post in posts])
+        index_profiles(list(Profile.objects.filter(user__in=users).values_list('id', flat=True)))
+
+        counts["users"] += len(users)
+        counts["posts"] += len(posts)
+        counts["texts"] += len(texts)
+        counts["images"] += len(images)
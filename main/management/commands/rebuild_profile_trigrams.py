@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand, CommandError
+from main.models.profile import Profile
+from main.search.trigrams import index_profiles
+
+
+class Command(BaseCommand):
+    help = "프로필 오타 검색 trigram 색인(ProfileTrigram)을 처음부터 다시 만듭니다. (프로필 chunk-size개씩)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=1000, help="한 번에 색인할 프로필 수 (기본 1000)")
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        if chunk_size < 1:
+            raise CommandError("--chunk-size는 1 이상이어야 합니다.")
+
+        profile_count, trigram_count, last_id = 0, 0, 0
+        while True:
+            profile_ids = list(
+                Profile.objects.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:chunk_size]
+            )
+            if not profile_ids:
+                break
+            trigram_count += index_profiles(profile_ids)
+            profile_count += len(profile_ids)
+            last_id = profile_ids[-1]
+            self.stdout.write(f"프로필 {profile_count}개 색인 완료")
+
+        self.stdout.write(self.style.SUCCESS(f"프로필 {profile_count}개, 색인 행 {trigram_count}개를 만들었습니다."))
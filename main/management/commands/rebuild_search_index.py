@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+from main.models.post import Post
+from main.models.searchPosting import SearchPosting
+from main.search.index import index_posts, rebuild_documents
+
+
+class Command(BaseCommand):
+    help = "게시물 검색 역색인(SearchPosting)을 처음부터 다시 만듭니다. (게시물 chunk-size개씩)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=500, help="한 번에 색인할 게시물 수 (기본 500)")
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        if chunk_size < 1:
+            raise CommandError("--chunk-size는 1 이상이어야 합니다.")
+
+        # ✅ 삭제된 게시물의 행은 CASCADE로 지워지므로, 남은 게시물만 ID 순서대로 묶어서 교체
+        SearchPosting.objects.exclude(post_id__in=Post.objects.values('id')).delete()
+
+        post_count, posting_count, last_id = 0, 0, 0
+        while True:
+            post_ids = list(
+                Post.objects.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:chunk_size]
+            )
+            if not post_ids:
+                break
+            posting_count += index_posts(post_ids)
+            post_count += len(post_ids)
+            last_id = post_ids[-1]
+            self.stdout.write(f"게시물 {post_count}개 색인 완료")
+
+        # ✅ 묶음마다 증감한 토큰별 문서 수를 전체 색인 기준으로 한 번 더 맞춤
+        rebuild_documents()
+        self.stdout.write(self.style.SUCCESS(f"게시물 {post_count}개, 색인 행 {posting_count}개를 만들었습니다."))
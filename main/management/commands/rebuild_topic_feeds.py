@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from main.models.topicFeed import TopicFeedEntry, TOPIC_FEED_LIMIT
+
+
+class Command(BaseCommand):
+    help = "주제(keyword/subject)별 최신 글 피드(TopicFeedEntry)를 게시물 테이블 기준으로 다시 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=TOPIC_FEED_LIMIT,
+                            help=f"주제별로 유지할 최신 글 수 (기본 {TOPIC_FEED_LIMIT})")
+
+    def handle(self, *args, **options):
+        created = TopicFeedEntry.rebuild(limit=options['limit'])
+        self.stdout.write(self.style.SUCCESS(f"주제 피드 항목 {created}개를 만들었습니다."))
@@ -0,0 +1,44 @@
+# Generated by Django 5.1 on 2026-10-19 10:12
+
+from django.db import migrations, models
+
+
+BATCH_SIZE = 500
+
+
+def fill_post_body(apps, schema_editor):
+    """ ✅ 기존 PostText 행을 게시물별 body 문서로 옮긴다 (BATCH_SIZE 단위) """
+    Post = apps.get_model('main', 'Post')
+    PostText = apps.get_model('main', 'PostText')
+
+    post_ids = list(Post.objects.filter(body__isnull=True).order_by('id').values_list('id', flat=True))
+    for start in range(0, len(post_ids), BATCH_SIZE):
+        batch_ids = post_ids[start:start + BATCH_SIZE]
+        blocks = {post_id: [] for post_id in batch_ids}
+
+        texts = PostText.objects.filter(post_id__in=batch_ids).order_by('post_id', 'id').values(
+            'id', 'post_id', 'content', 'font', 'font_size', 'is_bold'
+        )
+        for text in texts:
+            blocks[text.pop('post_id')].append(text)
+
+        posts = list(Post.objects.filter(id__in=batch_ids).only('id'))
+        for post in posts:
+            post.body = blocks[post.id]
+        Post.objects.bulk_update(posts, ['body'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0020_heart_is_read'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='body',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.RunPython(fill_post_body, migrations.RunPython.noop),
+    ]
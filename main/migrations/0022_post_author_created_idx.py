@@ -0,0 +1,17 @@
+# Generated by Django 5.1 on 2026-10-19 10:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0021_post_body'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['author', 'is_complete', 'created_at'], name='post_author_created_idx'),
+        ),
+    ]
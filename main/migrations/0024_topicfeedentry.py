@@ -0,0 +1,53 @@
+# Generated by Django 5.1 on 2026-10-19 11:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+TOPIC_FEED_LIMIT = 1000
+
+
+def fill_topic_feeds(apps, schema_editor):
+    """ ✅ 기존 전체 공개 글로 주제별 피드를 채운다 (주제별 최신 TOPIC_FEED_LIMIT개) """
+    Post = apps.get_model('main', 'Post')
+    TopicFeedEntry = apps.get_model('main', 'TopicFeedEntry')
+
+    public_posts = Post.objects.filter(is_complete=True, visibility='everyone')
+    for kind in ('keyword', 'subject'):
+        topics = public_posts.values_list(kind, flat=True).distinct()
+        for topic in list(topics):
+            rows = public_posts.filter(**{kind: topic}).order_by('-created_at', '-id').values_list(
+                'id', 'author_id', 'created_at')[:TOPIC_FEED_LIMIT]
+            TopicFeedEntry.objects.bulk_create(
+                [TopicFeedEntry(kind=kind, topic=topic, post_id=post_id, author_id=author_id, created_at=created_at)
+                 for post_id, author_id, created_at in rows],
+                batch_size=1000,
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0023_readreceipt'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TopicFeedEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('keyword', '키워드'), ('subject', '주제')], max_length=10)),
+                ('topic', models.CharField(max_length=50)),
+                ('created_at', models.DateTimeField()),
+                ('author', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='topic_feed_entries', to='main.post')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['kind', 'topic', 'created_at', 'post'], name='topic_feed_recent_idx')],
+                'unique_together': {('kind', 'post')},
+            },
+        ),
+        migrations.RunPython(fill_topic_feeds, migrations.RunPython.noop),
+    ]
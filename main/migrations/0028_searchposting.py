@@ -0,0 +1,76 @@
+# Generated by Django 5.1 on 2026-10-19 13:40
+
+import re
+import unicodedata
+from collections import Counter
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+BATCH_SIZE = 500
+_word = re.compile(r"\w+")
+
+
+def token_counts(*texts):
+    """
+    이 시점의 main.search.tokens.token_counts 복사본 (단어 안의 문자 bigram, 한 글자 단어는 그대로)
+    → 이후 토큰 규칙이 바뀌어도 이 마이그레이션 결과는 그대로 유지 (새 규칙으로의 재색인은 0034)
+    """
+    counts = Counter()
+    for text in texts:
+        for word in _word.findall(unicodedata.normalize('NFKC', text or '').lower()):
+            counts.update([word] if len(word) < 2 else [word[i:i + 2] for i in range(len(word) - 1)])
+    return counts
+
+
+def fill_search_index(apps, schema_editor):
+    """ ✅ 기존 게시물의 제목/본문/이미지 설명을 색인 (BATCH_SIZE 단위) """
+    Post = apps.get_model('main', 'Post')
+    PostText = apps.get_model('main', 'PostText')
+    PostImage = apps.get_model('main', 'PostImage')
+    SearchPosting = apps.get_model('main', 'SearchPosting')
+
+    post_ids = list(Post.objects.order_by('id').values_list('id', flat=True))
+    for start in range(0, len(post_ids), BATCH_SIZE):
+        batch_ids = post_ids[start:start + BATCH_SIZE]
+        sources = {
+            'title': Post.objects.filter(id__in=batch_ids).values_list('id', 'title'),
+            'text': PostText.objects.filter(post_id__in=batch_ids).values_list('post_id', 'content'),
+            'caption': PostImage.objects.filter(post_id__in=batch_ids, caption__isnull=False).values_list(
+                'post_id', 'caption'),
+        }
+        postings = []
+        for field, rows in sources.items():
+            texts = {}
+            for post_id, text in rows:
+                texts.setdefault(post_id, []).append(text)
+            for post_id, values in texts.items():
+                postings.extend(
+                    SearchPosting(token=token, post_id=post_id, field=field, frequency=frequency)
+                    for token, frequency in token_counts(*values).items()
+                )
+        SearchPosting.objects.bulk_create(postings, batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0027_tag_posttag'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchPosting',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=4)),
+                ('field', models.CharField(choices=[('title', '제목'), ('text', '본문'), ('caption', '이미지 설명')], max_length=10)),
+                ('frequency', models.PositiveIntegerField(default=1)),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_postings', to='main.post')),
+            ],
+            options={
+                'unique_together': {('token', 'post', 'field')},
+            },
+        ),
+        migrations.RunPython(fill_search_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 5.1 on 2026-10-19 14:20
+
+import unicodedata
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+BATCH_SIZE = 1000
+FIELDS = ('username', 'blog_name', 'urlname')
+
+
+def trigrams(text):
+    """ main.search.trigrams.trigrams와 같은 규칙 (마이그레이션은 현재 코드에 의존하지 않도록 정규화까지 복사) """
+    value = "".join(unicodedata.normalize('NFKC', text or '').lower().split())
+    if not value:
+        return set()
+    padded = f"  {value} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def fill_profile_trigrams(apps, schema_editor):
+    """ ✅ 기존 프로필의 사용자명/블로그 이름/블로그 ID를 색인 (BATCH_SIZE 단위) """
+    Profile = apps.get_model('main', 'Profile')
+    ProfileTrigram = apps.get_model('main', 'ProfileTrigram')
+
+    profiles = list(Profile.objects.order_by('id').values('id', *FIELDS))
+    for start in range(0, len(profiles), BATCH_SIZE):
+        rows = []
+        for values in profiles[start:start + BATCH_SIZE]:
+            for field in FIELDS:
+                grams = trigrams(values[field])
+                rows.extend(
+                    ProfileTrigram(trigram=gram, profile_id=values['id'], field=field, size=len(grams))
+                    for gram in grams
+                )
+        ProfileTrigram.objects.bulk_create(rows, batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0028_searchposting'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProfileTrigram',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('trigram', models.CharField(max_length=3)),
+                ('field', models.CharField(choices=[('username', '사용자명'), ('blog_name', '블로그 이름'), ('urlname', '블로그 ID')], max_length=10)),
+                ('size', models.PositiveSmallIntegerField()),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='trigrams', to='main.profile')),
+            ],
+            options={
+                'unique_together': {('trigram', 'profile', 'field')},
+            },
+        ),
+        migrations.RunPython(fill_profile_trigrams, migrations.RunPython.noop),
+    ]
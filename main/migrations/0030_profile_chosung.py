@@ -0,0 +1,57 @@
+# Generated by Django 5.1 on 2026-10-19 15:10
+
+import unicodedata
+from django.db import migrations, models
+
+
+BATCH_SIZE = 1000
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+
+
+def chosung_key(text):
+    """ main.utils.hangul.chosung_key 복사본 (이후 규칙이 바뀌어도 이 마이그레이션 결과는 그대로 유지) """
+    key = []
+    for char in unicodedata.normalize('NFC', text or '').lower():
+        code = ord(char)
+        if ord('가') <= code <= ord('힣'):
+            key.append(CHOSUNG[(code - ord('가')) // (21 * 28)])
+        elif not char.isspace():
+            key.append(char)
+    return "".join(key)
+
+
+def fill_chosung(apps, schema_editor):
+    """ ✅ 기존 프로필의 초성 검색 키 채우기 (ID 순으로 BATCH_SIZE개씩 읽고 저장) """
+    Profile = apps.get_model('main', 'Profile')
+
+    last_id = 0
+    while True:
+        batch = list(Profile.objects.filter(id__gt=last_id).order_by('id').only('id', 'username', 'blog_name')[:BATCH_SIZE])
+        if not batch:
+            break
+        for profile in batch:
+            profile.username_chosung = chosung_key(profile.username)
+            profile.blog_name_chosung = chosung_key(profile.blog_name)
+        Profile.objects.bulk_update(batch, ['username_chosung', 'blog_name_chosung'])
+        last_id = batch[-1].id
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0029_profiletrigram'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='username_chosung',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=15),
+        ),
+        migrations.AddField(
+            model_name='profile',
+            name='blog_name_chosung',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=20),
+        ),
+        migrations.RunPython(fill_chosung, migrations.RunPython.noop),
+    ]
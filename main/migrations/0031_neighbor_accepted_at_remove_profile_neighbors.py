@@ -0,0 +1,61 @@
+# Generated by Django 5.1 on 2026-10-19 16:05
+
+from django.db import migrations, models
+
+
+def to_directed_edges(apps, schema_editor):
+    """
+    ✅ 서로이웃 관계를 Neighbor 양방향 accepted 행으로 통일
+    - 기존 accepted 행: accepted_at = created_at, 반대 방향 행이 없거나 pending이면 accepted로 맞춤
+    - Profile.neighbors(M2M)에만 있던 관계: 양방향 accepted 행 생성
+    """
+    Neighbor = apps.get_model('main', 'Neighbor')
+    Profile = apps.get_model('main', 'Profile')
+
+    rows = {
+        (row.from_user_id, row.to_user_id): row
+        for row in Neighbor.objects.all()
+    }
+    pairs = {key for key, row in rows.items() if row.status == 'accepted'}
+    pairs.update(
+        Profile.neighbors.through.objects.values_list('from_profile__user_id', 'to_profile__user_id')
+    )
+
+    for from_id, to_id in pairs:
+        if from_id == to_id:
+            continue
+        accepted_at = next(
+            (rows[key].created_at for key in ((from_id, to_id), (to_id, from_id))
+             if key in rows and rows[key].status == 'accepted'),
+            None
+        )
+        for key in ((from_id, to_id), (to_id, from_id)):
+            row = rows.get(key)
+            if row is None:
+                rows[key] = Neighbor.objects.create(
+                    from_user_id=key[0], to_user_id=key[1], status='accepted', accepted_at=accepted_at
+                )
+            elif row.status != 'accepted' or row.accepted_at is None:
+                row.status = 'accepted'
+                row.accepted_at = accepted_at or row.created_at
+                row.save(update_fields=['status', 'accepted_at'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0030_profile_chosung'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='neighbor',
+            name='accepted_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(to_directed_edges, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='profile',
+            name='neighbors',
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.1 on 2026-10-19 16:40
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def fill_accepted_at(apps, schema_editor):
+    """ ✅ 수락 시각을 모르는 기존 서로이웃 행은 신청 시각으로 채움 (목록 커서 정렬 기준이 NULL이 되지 않도록) """
+    Neighbor = apps.get_model('main', 'Neighbor')
+    Neighbor.objects.filter(status='accepted', accepted_at__isnull=True).update(accepted_at=F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0031_neighbor_accepted_at_remove_profile_neighbors'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_accepted_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='neighbor',
+            index=models.Index(fields=['from_user', 'status', 'accepted_at'], name='neighbor_accepted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='neighbor',
+            index=models.Index(fields=['to_user', 'status', 'created_at'], name='neighbor_received_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='heart',
+            index=models.Index(fields=['post', 'created_at'], name='heart_post_created_idx'),
+        ),
+    ]
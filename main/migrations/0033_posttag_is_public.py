@@ -0,0 +1,37 @@
+# Generated by Django 5.1 on 2026-10-19 17:20
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def fill_is_public(apps, schema_editor):
+    """ ✅ 기존 태그 연결의 공개 여부를 채우고, Tag.post_count를 공개 게시물 수로 다시 계산 """
+    Tag = apps.get_model('main', 'Tag')
+    PostTag = apps.get_model('main', 'PostTag')
+
+    PostTag.objects.filter(post__is_complete=True, post__visibility='everyone').update(is_public=True)
+
+    public_counts = (
+        PostTag.objects.filter(tag=OuterRef('pk'), is_public=True)
+        .values('tag').annotate(count=Count('id')).values('count')
+    )
+    Tag.objects.update(
+        post_count=Coalesce(Subquery(public_counts, output_field=IntegerField()), Value(0))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0032_neighbor_heart_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='posttag',
+            name='is_public',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.RunPython(fill_is_public, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 5.1 on 2026-10-19 17:40
+
+import re
+import unicodedata
+from collections import Counter
+from django.db import migrations
+
+
+BATCH_SIZE = 500
+_non_word = re.compile(r"\W+")
+
+
+def tokenize(text):
+    """ main.search.tokens.tokenize 복사본 (이후 토큰 규칙이 바뀌어도 이 마이그레이션 결과는 그대로 유지) """
+    text = _non_word.sub(' ', unicodedata.normalize('NFKC', text or '').lower()).strip()
+    if not text:
+        return []
+    text = f" {text} "
+    return [text[i:i + 2] for i in range(len(text) - 1)]
+
+
+def use_binary_collation(apps, schema_editor):
+    """
+    ✅ MySQL: 토큰/trigram 열을 utf8mb4_bin으로 변경
+    - 기본 collation은 대소문자/전각·반각을 같은 값으로 보므로, 서로 다른 토큰이 unique_together에서 충돌함
+    """
+    if schema_editor.connection.vendor != 'mysql':
+        return
+    quote = schema_editor.quote_name
+    for model_name, column, length in (('SearchPosting', 'token', 4), ('ProfileTrigram', 'trigram', 3)):
+        table = apps.get_model('main', model_name)._meta.db_table
+        schema_editor.execute(
+            f"ALTER TABLE {quote(table)} MODIFY {quote(column)} "
+            f"varchar({length}) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin NOT NULL"
+        )
+
+
+def rebuild_postings(apps, schema_editor):
+    """ ✅ 띄어쓰기를 걸친 bigram을 포함하도록 검색 색인을 게시물 BATCH_SIZE개씩 다시 만듦 """
+    Post = apps.get_model('main', 'Post')
+    PostText = apps.get_model('main', 'PostText')
+    PostImage = apps.get_model('main', 'PostImage')
+    SearchPosting = apps.get_model('main', 'SearchPosting')
+
+    last_id = 0
+    while True:
+        posts = list(Post.objects.filter(id__gt=last_id).order_by('id').values_list('id', 'title')[:BATCH_SIZE])
+        if not posts:
+            break
+        post_ids = [post_id for post_id, _ in posts]
+        last_id = post_ids[-1]
+
+        counts = {}
+        for post_id, title in posts:
+            counts.setdefault((post_id, 'title'), Counter()).update(tokenize(title))
+        for post_id, content in PostText.objects.filter(post_id__in=post_ids).values_list('post_id', 'content'):
+            counts.setdefault((post_id, 'text'), Counter()).update(tokenize(content))
+        for post_id, caption in PostImage.objects.filter(
+                post_id__in=post_ids, caption__isnull=False).values_list('post_id', 'caption'):
+            counts.setdefault((post_id, 'caption'), Counter()).update(tokenize(caption))
+
+        SearchPosting.objects.filter(post_id__in=post_ids).delete()
+        SearchPosting.objects.bulk_create([
+            SearchPosting(token=token, post_id=post_id, field=field, frequency=frequency)
+            for (post_id, field), tokens in counts.items()
+            for token, frequency in tokens.items()
+        ], batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0033_posttag_is_public'),
+    ]
+
+    operations = [
+        migrations.RunPython(use_binary_collation, migrations.RunPython.noop),
+        migrations.RunPython(rebuild_postings, migrations.RunPython.noop),
+    ]
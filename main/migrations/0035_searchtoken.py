@@ -0,0 +1,58 @@
+# Generated by Django 5.1 on 2026-10-19 18:20
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+BATCH_SIZE = 2000
+
+
+def use_binary_collation(apps, schema_editor):
+    """ ✅ MySQL: token 열을 utf8mb4_bin으로 변경 (0034 마이그레이션과 같은 이유) """
+    if schema_editor.connection.vendor != 'mysql':
+        return
+    quote = schema_editor.quote_name
+    table = apps.get_model('main', 'SearchToken')._meta.db_table
+    schema_editor.execute(
+        f"ALTER TABLE {quote(table)} MODIFY {quote('token')} "
+        f"varchar(4) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin NOT NULL"
+    )
+
+
+def fill_documents(apps, schema_editor):
+    """ ✅ 기존 검색 색인에서 토큰별 문서 수 채우기 (BATCH_SIZE개씩 저장) """
+    SearchPosting = apps.get_model('main', 'SearchPosting')
+    SearchToken = apps.get_model('main', 'SearchToken')
+
+    counts = (
+        SearchPosting.objects.values('token')
+        .annotate(documents=Count('post_id', distinct=True))
+        .values_list('token', 'documents')
+    )
+    batch = []
+    for token, documents in counts.iterator():
+        batch.append(SearchToken(token=token, documents=documents))
+        if len(batch) >= BATCH_SIZE:
+            SearchToken.objects.bulk_create(batch)
+            batch = []
+    SearchToken.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0034_search_token_bigrams'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=4, unique=True)),
+                ('documents', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(use_binary_collation, migrations.RunPython.noop),
+        migrations.RunPython(fill_documents, migrations.RunPython.noop),
+    ]
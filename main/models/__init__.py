@@ -4,4 +4,12 @@ from .post import Post,PostText,PostImage
 from .comment import Comment
 from .heart import Heart
 from .commentHeart import CommentHeart
-from .neighbor import Neighbor
\ No newline at end of file
+from .neighbor import Neighbor
+from .readReceipt import ReadReceipt
+from .topicFeed import TopicFeedEntry
+from .relatedPost import RelatedPost
+from .blogRecommendation import BlogRecommendation
+from .tag import Tag, PostTag
+from .searchPosting import SearchPosting
+from .profileTrigram import ProfileTrigram
+from .searchToken import SearchToken
@@ -0,0 +1,25 @@
+from django.db import models
+from django.conf import settings
+
+
+class BlogRecommendation(models.Model):
+    """
+    사용자별 추천 블로그 (상위 N개)
+    - `python manage.py build_blog_recommendations` 배치 작업이 서로이웃 그래프(친구의 친구)와
+      주제 선호도(내 글 + 좋아요 누른 글의 주제 분포)를 합쳐서 주기적으로 다시 계산
+    - 조회 시에는 (user, rank) 인덱스로 한 번에 읽음
+    """
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="blog_recommendations")
+    recommended = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+")
+    score = models.FloatField()  # ✅ 최종 추천 점수 (0 ~ 1)
+    mutual_count = models.PositiveIntegerField(default=0)  # ✅ 함께 아는 서로이웃 수
+    rank = models.PositiveSmallIntegerField()  # ✅ 0부터 시작하는 추천 순위
+
+    class Meta:
+        unique_together = ('user', 'recommended')
+        indexes = [
+            models.Index(fields=['user', 'rank'], name='blog_recommendation_rank_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} → {self.recommended_id} ({self.score:.3f})"
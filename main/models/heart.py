@@ -9,6 +9,9 @@ class Heart(models.Model):
     is_read=models.BooleanField(default=False)
     class Meta:
         unique_together = ('post', 'user')  # ✅ 한 사용자가 같은 게시글에 여러 번 누를 수 없도록 설정
+        indexes = [
+            models.Index(fields=['post', 'created_at'], name='heart_post_created_idx'),  # ✅ 좋아요 유저 목록 (최신순)
+        ]
 
     def __str__(self):
         return f"{self.user.username} ❤️ {self.post.title}"
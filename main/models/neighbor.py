@@ -1,8 +1,15 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Q
 from django.conf import settings
-from main.models.profile import Profile  # Profile 모델 import
+from django.utils import timezone
+
 
 class Neighbor(models.Model):
+    """
+    ✅ 서로이웃 관계의 유일한 저장소 (방향 있는 간선)
+    - pending: from_user → to_user 신청 1행
+    - accepted: 양쪽 방향 2행 (A → B, B → A) → "A의 서로이웃"은 from_user=A 한 방향만 조회하면 됨
+    """
     from_user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -15,6 +22,7 @@ class Neighbor(models.Model):
     )
     request_message = models.TextField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    accepted_at = models.DateTimeField(null=True, blank=True)
     status = models.CharField(
         max_length=20,
         choices=[
@@ -27,26 +35,59 @@ class Neighbor(models.Model):
 
     class Meta:
         unique_together = ('from_user', 'to_user')  # ✅ 중복 신청 방지
+        indexes = [
+            models.Index(fields=['from_user', 'status', 'accepted_at'], name='neighbor_accepted_idx'),  # ✅ 서로이웃 목록 (수락 순)
+            models.Index(fields=['to_user', 'status', 'created_at'], name='neighbor_received_idx'),  # ✅ 받은 신청 목록 (신청 순)
+        ]
 
     def save(self, *args, **kwargs):
         """
-        ✅ 서로이웃 요청이 `accepted`로 변경되면 Profile의 neighbors 관계에 반영.
         ✅ 서로이웃 요청이 `rejected`면 신청 내역을 자동으로 삭제.
         """
         super().save(*args, **kwargs)
 
-        if self.status == 'accepted':
-            # ✅ Profile이 없는 경우 자동 생성
-            from_profile, _ = Profile.objects.get_or_create(user=self.from_user)
-            to_profile, _ = Profile.objects.get_or_create(user=self.to_user)
+        if self.status == 'rejected':  # ✅ 거절된 요청 자동 삭제
+            self.delete()
+
+    @classmethod
+    def accept(cls, user, other):
+        """
+        ✅ other가 user에게 보낸 신청(other → user)을 수락해서 양방향 accepted 2행으로 만듦
+        - 두 행을 id 순서로 잠그고(select_for_update) 한 트랜잭션에서 처리 → 동시에 수락해도 한 번만 반영
+        - 이미 서로이웃이면 아무것도 바꾸지 않고 False, 새로 수락했으면 True
+        - 받은 신청이 없으면 Neighbor.DoesNotExist (user가 보낸 신청은 user가 수락할 수 없음)
+        """
+        with transaction.atomic():
+            rows = {
+                (row.from_user_id, row.to_user_id): row
+                for row in cls.objects.select_for_update().filter(
+                    Q(from_user=user, to_user=other) | Q(from_user=other, to_user=user)
+                ).order_by('id')
+            }
+            if (other.pk, user.pk) not in rows:
+                raise cls.DoesNotExist("서로이웃 요청이 존재하지 않습니다.")
+            if len(rows) == 2 and all(row.status == 'accepted' for row in rows.values()):
+                return False
 
-            # ✅ 중복 추가 방지
-            if not from_profile.neighbors.filter(id=to_profile.id).exists():
-                from_profile.neighbors.add(to_profile)
-                to_profile.neighbors.add(from_profile)
+            now = timezone.now()
+            for from_user, to_user in ((other, user), (user, other)):
+                row = rows.get((from_user.pk, to_user.pk)) or cls(from_user=from_user, to_user=to_user)
+                if row.status != 'accepted':
+                    row.status = 'accepted'
+                    row.accepted_at = now
+                    row.save()
+            return True
 
-        elif self.status == 'rejected':  # ✅ 거절된 요청 자동 삭제
-            self.delete()
+    @classmethod
+    def remove(cls, user, other):
+        """
+        ✅ 서로이웃 관계(양방향 2행)를 한 번에 삭제, 삭제한 관계가 있으면 True (다시 호출해도 안전)
+        """
+        deleted, _ = cls.objects.filter(
+            Q(from_user=user, to_user=other) | Q(from_user=other, to_user=user),
+            status='accepted'
+        ).delete()
+        return deleted > 0
 
     def __str__(self):
         return f"{self.from_user} → {self.to_user} ({self.status})"
\ No newline at end of file
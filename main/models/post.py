@@ -3,6 +3,10 @@ from django.conf import settings
 from slugify import slugify
 
 
+# ✅ body 문서를 우선 읽을지 여부 (이중 읽기 기간 동안 False로 바꾸면 PostText 행만 사용)
+POST_BODY_DOCUMENT_READ = getattr(settings, 'POST_BODY_DOCUMENT_READ', True)
+
+
 def image_upload_path(instance, filename):
     """
     이미지 업로드 경로 설정.
@@ -42,6 +46,15 @@ class Post(models.Model):
         ("비즈니스/경제", "비즈니스/경제"), ("어학/외국어", "어학/외국어"), ("교육/학문", "교육/학문"),
     ]
 
+    # ✅ keyword별 subject 목록 (save() 시 subject로 keyword 자동 설정)
+    KEYWORD_MAPPING = {
+        "엔터테인먼트/예술": ["문학·책", "영화", "미술·디자인", "공연·전시", "음악", "드라마", "스타·연예인", "만화·애니", "방송"],
+        "생활/노하우/쇼핑": ["일상·생각", "육아·결혼", "반려동물", "좋은글·이미지", "패션·미용", "인테리어/DIY", "요리·레시피", "상품리뷰", "원예/재배"],
+        "취미/여가/여행": ["게임", "스포츠", "사진", "자동차", "취미", "국내여행", "세계여행", "맛집"],
+        "지식/동향": ["IT/컴퓨터", "사회/정치", "건강/의학", "비즈니스/경제", "어학/외국어", "교육/학문"],
+        "default": ["주제 선택 안 함"],
+    }
+
     COMPLETE_CHOICES = [
         ('true', '작성 완료'),
         ('false', '임시 저장'),
@@ -67,6 +80,13 @@ class Post(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     is_read = models.BooleanField(default=False)  # 읽음 상태 필드 추가
+    body = models.JSONField(null=True, blank=True)  # ✅ 본문 블록 문서 (PostText 행 목록을 하나의 컬럼에 저장)
+
+    class Meta:
+        indexes = [
+            # ✅ 블로그별 작성일 기준 조회/집계 (월별 아카이브, 최신 글 목록)
+            models.Index(fields=['author', 'is_complete', 'created_at'], name='post_author_created_idx'),
+        ]
 
     def save(self, *args, **kwargs):
         # category가 None인 경우 기본값으로 '게시판'을 설정
@@ -74,20 +94,44 @@ class Post(models.Model):
             self.category = '게시판'
 
         """ subject 값에 따라 keyword 자동 설정 """
-        keyword_mapping = {
-            "엔터테인먼트/예술": ["문학·책", "영화", "미술·디자인", "공연·전시", "음악", "드라마", "스타·연예인", "만화·애니", "방송"],
-            "생활/노하우/쇼핑": ["일상·생각", "육아·결혼", "반려동물", "좋은글·이미지", "패션·미용", "인테리어/DIY", "요리·레시피", "상품리뷰", "원예/재배"],
-            "취미/여가/여행": ["게임", "스포츠", "사진", "자동차", "취미", "국내여행", "세계여행", "맛집"],
-            "지식/동향": ["IT/컴퓨터", "사회/정치", "건강/의학", "비즈니스/경제", "어학/외국어", "교육/학문"],
-            "default": ["주제 선택 안 함"],
-        }
-        self.keyword = next((key for key, values in keyword_mapping.items() if self.subject in values),
-                                     "default")
+        self.keyword = self.keyword_for_subject(self.subject)
         super().save(*args, **kwargs)
 
+    @classmethod
+    def keyword_for_subject(cls, subject):
+        """ ✅ subject → keyword (save()를 거치지 않는 bulk_create에서도 같은 규칙 사용) """
+        return next((key for key, values in cls.KEYWORD_MAPPING.items() if subject in values), "default")
+
     def __str__(self):
         return f"{self.category} / {self.title} / {dict(self.COMPLETE_CHOICES).get(self.is_complete)}"
 
+    @property
+    def text_blocks(self):
+        """
+        본문 블록 목록 반환 (이중 읽기)
+        - body 문서가 있으면 컬럼 하나만 읽어서 반환
+        - 아직 body가 채워지지 않은 게시물은 기존 PostText 행으로 대체
+        """
+        if POST_BODY_DOCUMENT_READ and self.body is not None:
+            return self.body
+        return self.texts.all()
+
+    @property
+    def tag_names(self):
+        """ 게시물에 달린 태그 이름 목록 (단 순서대로) """
+        return list(self.post_tags.order_by('id').values_list('tag__name', flat=True))
+
+    def sync_body(self, texts=None, save=True):
+        """
+        PostText 행을 기준으로 body 문서를 다시 만든다.
+        texts를 넘기면 추가 조회 없이 해당 목록으로 문서를 구성한다.
+        """
+        if texts is None:
+            texts = self.texts.order_by('id')
+        self.body = [text.to_block() for text in texts]
+        if save:
+            self.save(update_fields=['body'])
+
 
 class PostText(models.Model):
     FONT_CHOICES = [
@@ -108,6 +152,16 @@ class PostText(models.Model):
     def __str__(self):
         return f"Text for {self.post.title}"
 
+    def to_block(self):
+        """ ✅ body 문서에 저장되는 블록 형태 (PostTextSerializer 출력과 동일한 키) """
+        return {
+            "id": self.id,
+            "content": self.content,
+            "font": self.font,
+            "font_size": self.font_size,
+            "is_bold": self.is_bold,
+        }
+
 
 class PostImage(models.Model):
     post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="images")
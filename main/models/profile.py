@@ -1,5 +1,6 @@
 from django.db import models
 from django.conf import settings
+from main.utils.hangul import chosung_key
 import os
 
 
@@ -26,12 +27,15 @@ class Profile(models.Model):
                                  default='default/user_default.jpg')
     intro = models.CharField(max_length=100, null=True, blank=True, help_text="간단한 자기소개를 입력해주세요 (최대 100자)")
 
+    # ✅ 초성 검색 키 (저장 시 username / blog_name에서 자동 생성, 접두어 검색용 인덱스)
+    username_chosung = models.CharField(max_length=15, blank=True, default='', editable=False, db_index=True)
+    blog_name_chosung = models.CharField(max_length=20, blank=True, default='', editable=False, db_index=True)
+
     # ✅ URL 이름 (한 번만 변경 가능)
     urlname = models.CharField(max_length=30, unique=True, null=False, blank=False)
     urlname_edit_count = models.PositiveIntegerField(default=0, help_text="urlname 변경 횟수 (0: 변경 가능, 1: 변경 불가)")
 
-    # ✅ 서로이웃 관계
-    neighbors = models.ManyToManyField("self", symmetrical=True, blank=True)
+    # ✅ 서로이웃 관계는 Neighbor(양방향 accepted 행)에만 저장
     neighbor_visibility = models.BooleanField(default=True, help_text="서로이웃 목록을 공개할지 여부")
 
     def __str__(self):
@@ -56,6 +60,18 @@ class Profile(models.Model):
                     if os.path.isfile(old_instance.user_pic.path):
                         os.remove(old_instance.user_pic.path)
 
+        # ✅ 초성 검색 키 갱신 (update_fields로 이름만 저장하는 경우에도 함께 저장)
+        self.username_chosung = chosung_key(self.username)
+        self.blog_name_chosung = chosung_key(self.blog_name)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            if 'username' in update_fields:
+                update_fields.add('username_chosung')
+            if 'blog_name' in update_fields:
+                update_fields.add('blog_name_chosung')
+            kwargs['update_fields'] = update_fields
+
         super().save(*args, **kwargs)
 
     def delete(self, *args, **kwargs):
@@ -0,0 +1,31 @@
+from django.db import models
+from main.models.profile import Profile
+
+
+class ProfileTrigram(models.Model):
+    """
+    사용자명 / 블로그 이름 / 블로그 ID 오타 검색용 trigram 색인 (trigram → 프로필)
+    - 공백을 뺀 값의 앞뒤를 채워서 만든 3글자 조각 → main.search.trigrams 참고
+    - (trigram, 프로필, 필드)마다 한 행, size는 그 필드 값의 trigram 개수 (유사도 계산용 복사본)
+    - 프로필 저장 시 시그널로 갱신 (main.signals.search)
+    - MySQL에서는 trigram 열을 utf8mb4_bin으로 비교 (0034 마이그레이션, SearchPosting.token과 같은 이유)
+    """
+    FIELD_USERNAME = 'username'
+    FIELD_BLOG_NAME = 'blog_name'
+    FIELD_URLNAME = 'urlname'
+    FIELD_CHOICES = [
+        (FIELD_USERNAME, '사용자명'),
+        (FIELD_BLOG_NAME, '블로그 이름'),
+        (FIELD_URLNAME, '블로그 ID'),
+    ]
+
+    trigram = models.CharField(max_length=3)
+    profile = models.ForeignKey(Profile, on_delete=models.CASCADE, related_name="trigrams")
+    field = models.CharField(max_length=10, choices=FIELD_CHOICES)
+    size = models.PositiveSmallIntegerField()
+
+    class Meta:
+        unique_together = ('trigram', 'profile', 'field')  # ✅ (trigram, profile, field) 인덱스로 trigram 조회
+
+    def __str__(self):
+        return f"{self.trigram} → {self.profile_id} ({self.field})"
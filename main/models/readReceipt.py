@@ -0,0 +1,61 @@
+from django.db import connection, models, transaction
+from django.conf import settings
+from main.utils.bitmap import PostIdBitmap, decode_chunk, encode_chunk, chunk_masks
+
+
+class ReadReceipt(models.Model):
+    """
+    사용자별 게시물 읽음 기록
+    (사용자, 게시물 ID 구간) 마다 압축 비트맵 한 행만 저장 → (사용자, 게시물) 마다 행을 만들지 않음
+    """
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="read_receipts")
+    chunk = models.PositiveIntegerField()  # ✅ 게시물 ID // CHUNK_SIZE
+    bits = models.BinaryField(default=b'')  # ✅ 청크 안에서 읽은 게시물 위치 (배열 또는 비트맵)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('user', 'chunk')  # ✅ 사용자별 청크는 한 행
+
+    def __str__(self):
+        return f"{self.user_id} 읽음 기록 (chunk {self.chunk})"
+
+    @classmethod
+    def load(cls, user, post_ids):
+        """ ✅ 주어진 게시물들이 속한 청크만 한 번에 읽어서 메모리 비트맵으로 반환 """
+        chunks = list(chunk_masks(post_ids))
+        if not chunks:
+            return PostIdBitmap()
+
+        rows = cls.objects.filter(user=user, chunk__in=chunks).values_list('chunk', 'bits')
+        return PostIdBitmap({chunk: decode_chunk(bits) for chunk, bits in rows})
+
+    @classmethod
+    def mark_read(cls, user, post_ids):
+        """
+        ✅ 여러 게시물을 한 번에 읽음 처리
+        바뀐 청크만 upsert 하고, 새로 읽음 처리된 게시물 수를 반환
+        """
+        post_ids = set(post_ids)
+        if not post_ids:
+            return 0
+
+        with transaction.atomic():
+            rows = cls.objects.select_for_update().filter(user=user, chunk__in=list(chunk_masks(post_ids)))
+            bitmap = PostIdBitmap({row.chunk: decode_chunk(row.bits) for row in rows})
+            newly_read = bitmap.count_missing(post_ids)
+
+            changed = bitmap.add_many(post_ids)
+            if changed:
+                # ✅ MySQL(ON DUPLICATE KEY UPDATE)은 충돌 기준 컬럼을 지정할 수 없으므로 지원하는 DB에서만 넘김
+                conflict_target = (
+                    {'unique_fields': ['user', 'chunk']}
+                    if connection.features.supports_update_conflicts_with_target else {}
+                )
+                cls.objects.bulk_create(
+                    [cls(user=user, chunk=chunk, bits=encode_chunk(bitmap.chunks[chunk])) for chunk in changed],
+                    update_conflicts=True,
+                    update_fields=['bits', 'updated_at'],
+                    **conflict_target,
+                )
+
+        return newly_read
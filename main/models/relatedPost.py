@@ -0,0 +1,23 @@
+from django.db import models
+from main.models.post import Post
+
+
+class RelatedPost(models.Model):
+    """
+    게시물별 관련 글 (본문 TF-IDF 코사인 유사도 상위 k개)
+    - `python manage.py build_related_posts` 배치 작업이 주기적으로 다시 계산해서 저장
+    - 조회 시에는 (post, rank) 인덱스로 한 번에 읽고, 공개 범위는 조회자 기준으로 걸러냄
+    """
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="related_entries")
+    related = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="+")
+    score = models.FloatField()  # ✅ 코사인 유사도 (0 ~ 1)
+    rank = models.PositiveSmallIntegerField()  # ✅ 0부터 시작하는 유사도 순위
+
+    class Meta:
+        unique_together = ('post', 'related')
+        indexes = [
+            models.Index(fields=['post', 'rank'], name='related_post_rank_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.post_id} → {self.related_id} ({self.score:.3f})"
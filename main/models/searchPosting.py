@@ -0,0 +1,32 @@
+from django.db import models
+from main.models.post import Post
+
+
+class SearchPosting(models.Model):
+    """
+    게시물 검색 역색인 (토큰 → 게시물)
+    - 토큰은 앞뒤 공백을 붙인 문자 bigram (띄어쓰기를 걸친 bigram 포함, 항상 두 글자) → main.search.tokens 참고
+    - MySQL에서는 token 열을 utf8mb4_bin으로 비교 (0034 마이그레이션)
+      → 기본 collation은 대소문자/전각·반각을 같게 보므로 서로 다른 토큰이 unique_together에서 충돌함
+    - (토큰, 게시물, 필드)마다 한 행, frequency는 해당 필드 안에서 토큰이 나온 횟수
+    - 게시물/본문/이미지 저장·삭제 시 시그널로 갱신 (main.signals.search)
+    """
+    FIELD_TITLE = 'title'
+    FIELD_TEXT = 'text'
+    FIELD_CAPTION = 'caption'
+    FIELD_CHOICES = [
+        (FIELD_TITLE, '제목'),
+        (FIELD_TEXT, '본문'),
+        (FIELD_CAPTION, '이미지 설명'),
+    ]
+
+    token = models.CharField(max_length=4)
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="search_postings")
+    field = models.CharField(max_length=10, choices=FIELD_CHOICES)
+    frequency = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        unique_together = ('token', 'post', 'field')  # ✅ (token, post, field) 인덱스로 토큰 조회
+
+    def __str__(self):
+        return f"{self.token} → {self.post_id} ({self.field}, {self.frequency})"
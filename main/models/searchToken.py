@@ -0,0 +1,15 @@
+from django.db import models
+
+
+class SearchToken(models.Model):
+    """
+    검색 토큰별 문서 수 (검색어 평가 순서를 정할 때 사용)
+    - documents: 이 토큰이 제목/본문/이미지 설명 중 한 곳이라도 있는 게시물 수
+    - 검색 색인(SearchPosting)을 고칠 때 게시물의 토큰 집합이 바뀐 만큼만 더하고 뺌 → main.search.index
+    - MySQL에서는 token 열을 utf8mb4_bin으로 비교 (SearchPosting.token과 같은 이유, 0035 마이그레이션)
+    """
+    token = models.CharField(max_length=4, unique=True)
+    documents = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.token} ({self.documents})"
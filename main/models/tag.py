@@ -0,0 +1,130 @@
+import json
+import re
+from django.db import models, transaction
+from django.db.models import F
+from rest_framework.exceptions import ValidationError
+from main.models.post import Post
+
+TAG_MAX_LENGTH = 30
+MAX_TAGS_PER_POST = 10
+_tag_separator = re.compile(r"[\s,#]+")
+
+
+def normalize_tag(name):
+    """ ✅ 태그 이름 정규화: 앞의 '#'과 공백 제거, 소문자 변환 (빈 문자열이면 None) """
+    name = re.sub(r"\s+", "", str(name)).lstrip('#').lower()
+    return name[:TAG_MAX_LENGTH] or None
+
+
+def parse_tags(value):
+    """
+    ✅ 요청 값 → 정규화된 태그 이름 목록 (입력 순서 유지, 중복 제거)
+    JSON 배열 문자열('["여행", "제주"]'), JSON 문자열, 리스트, '#여행 #제주' / '여행,제주' 형태 허용
+    그 밖의 JSON 값(숫자, true, 객체 등)이나 문자열이 아닌 항목은 ValidationError
+    """
+    if value is None:
+        return []
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError:
+            value = _tag_separator.split(value)
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ValidationError({"tags": "태그는 문자열 또는 문자열 배열이어야 합니다."})
+
+    names = []
+    for item in value:
+        name = normalize_tag(item)
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+class Tag(models.Model):
+    """
+    해시태그
+    post_count는 태그가 달린 공개 게시물(작성 완료 + 전체 공개) 수로, 태그를 달고 떼거나
+    게시물의 공개 여부가 바뀔 때 증감해서 유지 (집계 쿼리 없음)
+    """
+    name = models.CharField(max_length=TAG_MAX_LENGTH, unique=True)
+    post_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['post_count'], name='tag_post_count_idx'),  # ✅ 인기 태그 목록
+        ]
+
+    def __str__(self):
+        return f"#{self.name} ({self.post_count})"
+
+
+class PostTag(models.Model):
+    """
+    게시물-태그 연결 (역색인)
+    (tag, created_at, post) 인덱스로 태그별 최신 글을 인덱스 범위 조회
+    """
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE, related_name="post_tags")
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="post_tags")
+    created_at = models.DateTimeField()  # ✅ 게시물 작성일 복사본 (태그 피드 정렬/커서 기준)
+    is_public = models.BooleanField(default=False)  # ✅ 게시물이 작성 완료 + 전체 공개인지 (Tag.post_count 집계 대상)
+
+    class Meta:
+        unique_together = ('tag', 'post')
+        indexes = [
+            models.Index(fields=['tag', 'created_at', 'post'], name='post_tag_feed_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.post_id} #{self.tag_id}"
+
+    @staticmethod
+    def is_public_post(post):
+        return bool(post.is_complete) and post.visibility == 'everyone'
+
+    @classmethod
+    def set_for_post(cls, post, names):
+        """
+        ✅ 게시물의 태그를 names로 교체
+        새로 단 태그만 추가하고 뗀 태그만 삭제 (post_count 감소는 PostTag 삭제 시그널에서 처리)
+        임시 저장 / 비공개 게시물의 태그는 저장만 하고 post_count에는 세지 않음
+        """
+        is_public = cls.is_public_post(post)
+        with transaction.atomic():
+            current = dict(cls.objects.filter(post=post).values_list('tag__name', 'id'))
+            added = [name for name in names if name not in current]
+            removed = [row_id for name, row_id in current.items() if name not in names]
+
+            if removed:
+                cls.objects.filter(id__in=removed).delete()
+
+            if added:
+                Tag.objects.bulk_create([Tag(name=name) for name in added], ignore_conflicts=True)
+                tags = sorted(Tag.objects.filter(name__in=added), key=lambda tag: added.index(tag.name))
+                cls.objects.bulk_create([
+                    cls(tag=tag, post=post, created_at=post.created_at, is_public=is_public) for tag in tags
+                ])
+                if is_public:
+                    Tag.objects.filter(id__in=[tag.id for tag in tags]).update(post_count=F('post_count') + 1)
+
+    @classmethod
+    def sync_visibility(cls, post):
+        """
+        ✅ 게시물의 작성 완료 / 공개 범위가 바뀐 경우 태그 연결의 is_public과 Tag.post_count를 맞춤
+        바뀐 행이 없으면 UPDATE 한 번으로 끝남
+        """
+        is_public = cls.is_public_post(post)
+        with transaction.atomic():
+            tag_ids = list(
+                cls.objects.select_for_update().filter(post=post).exclude(is_public=is_public).values_list('tag_id', flat=True)
+            )
+            if not tag_ids:
+                return
+            cls.objects.filter(post=post, tag_id__in=tag_ids).update(is_public=is_public)
+            tags = Tag.objects.filter(id__in=tag_ids)
+            if is_public:
+                tags.update(post_count=F('post_count') + 1)
+            else:
+                tags.filter(post_count__gt=0).update(post_count=F('post_count') - 1)
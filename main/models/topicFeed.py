@@ -0,0 +1,92 @@
+from django.db import models, transaction
+from django.conf import settings
+from main.models.post import Post
+
+# ✅ 주제(keyword/subject)별로 유지하는 최신 글 개수 (이보다 오래된 항목은 잘라냄)
+TOPIC_FEED_LIMIT = getattr(settings, 'TOPIC_FEED_LIMIT', 1000)
+
+
+class TopicFeedEntry(models.Model):
+    """
+    주제별 최신 글 피드 (미리 계산해 둔 목록)
+    - 작성 완료된 '전체 공개' 글만 keyword 피드와 subject 피드에 한 행씩 들어감
+    - 게시물 저장/삭제 시 시그널로 해당 글의 행만 갱신 (main.signals.topicFeed)
+    - 주제마다 TOPIC_FEED_LIMIT개까지만 유지
+    """
+    KIND_KEYWORD = 'keyword'
+    KIND_SUBJECT = 'subject'
+    KIND_CHOICES = [
+        (KIND_KEYWORD, '키워드'),
+        (KIND_SUBJECT, '주제'),
+    ]
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    topic = models.CharField(max_length=50)
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="topic_feed_entries")
+    author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+")
+    created_at = models.DateTimeField()  # ✅ 게시물 작성일 복사본 (피드 정렬/커서 기준)
+
+    class Meta:
+        unique_together = ('kind', 'post')  # ✅ 게시물은 종류별로 한 주제에만 속함
+        indexes = [
+            models.Index(fields=['kind', 'topic', 'created_at', 'post'], name='topic_feed_recent_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind}:{self.topic} - {self.post_id}"
+
+    @staticmethod
+    def is_listed(post):
+        """ ✅ 주제 피드에 노출되는 게시물인지 여부 """
+        return post.is_complete and post.visibility == 'everyone'
+
+    @classmethod
+    def refresh_post(cls, post):
+        """
+        ✅ 게시물 하나의 피드 항목을 현재 상태에 맞게 갱신
+        공개 글이면 keyword/subject 피드에 넣거나 주제를 옮기고, 아니면 피드에서 뺀다
+        """
+        if not cls.is_listed(post):
+            cls.objects.filter(post_id=post.id).delete()
+            return
+
+        with transaction.atomic():
+            for kind, topic in ((cls.KIND_KEYWORD, post.keyword), (cls.KIND_SUBJECT, post.subject)):
+                cls.objects.update_or_create(
+                    kind=kind, post_id=post.id,
+                    defaults={'topic': topic, 'author_id': post.author_id, 'created_at': post.created_at},
+                )
+                cls.trim(kind, topic)
+
+    @classmethod
+    def trim(cls, kind, topic, limit=None):
+        """ ✅ 주제 피드를 최신 limit개로 자름 (보통 새 글 하나가 들어올 때 한 행만 삭제됨) """
+        limit = TOPIC_FEED_LIMIT if limit is None else limit
+        stale_ids = list(
+            cls.objects.filter(kind=kind, topic=topic)
+            .order_by('-created_at', '-post_id')
+            .values_list('id', flat=True)[limit:]
+        )
+        if stale_ids:
+            cls.objects.filter(id__in=stale_ids).delete()
+
+    @classmethod
+    def rebuild(cls, limit=None):
+        """ ✅ 전체 피드를 게시물 테이블 기준으로 다시 만듦 (주제별 최신 limit개), 생성한 항목 수 반환 """
+        limit = TOPIC_FEED_LIMIT if limit is None else limit
+        public_posts = Post.objects.filter(is_complete=True, visibility='everyone')
+
+        entries = []
+        for kind, choices in ((cls.KIND_KEYWORD, Post.KEYWORD_CHOICES), (cls.KIND_SUBJECT, Post.SUBJECT_CHOICES)):
+            for topic, _ in choices:
+                rows = public_posts.filter(**{kind: topic}).order_by('-created_at', '-id').values_list(
+                    'id', 'author_id', 'created_at')[:limit]
+                entries.extend(
+                    cls(kind=kind, topic=topic, post_id=post_id, author_id=author_id, created_at=created_at)
+                    for post_id, author_id, created_at in rows
+                )
+
+        with transaction.atomic():
+            cls.objects.all().delete()
+            cls.objects.bulk_create(entries, batch_size=1000)
+        return len(entries)
@@ -0,0 +1,171 @@
+"""
+블로그 이름 / 사용자 이름 / urlname 자동완성 (프로세스 메모리 색인)
+
+- 정렬된 (키, 프로필 ID) 배열 두 개를 bisect로 조회
+  · prefixes: 필드 값 전체 → 접두어 일치
+  · suffixes: 필드 값의 모든 접미사 → 접미사의 접두어 = 부분 문자열 일치
+- 순위: urlname 정확히 일치 > 접두어 일치 > 부분 문자열 일치, 상위 limit개만 반환
+- Profile 저장/삭제 시그널로 현재 프로세스의 색인을 바로 수정하고, 세대 번호(autocomplete)를 올려서
+  다른 프로세스는 다음 조회 때(최대 GENERATION_CHECK_INTERVAL초 뒤) 전체를 다시 만든다
+  (세대 번호는 캐시에 있으므로 여러 프로세스로 운영할 때는 공유 캐시가 필요 → settings.CACHES, main/checks.py)
+- 색인 수정(patch_profile)과 조회(autocomplete)는 같은 잠금 안에서 실행
+"""
+import threading
+import time
+from bisect import bisect_left, insort
+from main.models.profile import Profile
+from main.search.tokens import normalize
+from main.utils.cache import get_generation, bump_generation
+
+GENERATION_NAME = 'autocomplete'
+GENERATION_CHECK_INTERVAL = 5  # ✅ 다른 프로세스의 변경 여부를 확인하는 주기 (초)
+INDEXED_FIELDS = ('urlname', 'username', 'blog_name')
+PROFILE_VALUE_FIELDS = ('id', 'urlname', 'username', 'blog_name', 'user_pic')
+
+MATCH_EXACT = 'exact'
+MATCH_PREFIX = 'prefix'
+MATCH_SUBSTRING = 'substring'
+
+
+def profile_keys(row):
+    """ 프로필 한 명의 색인 키 (필드 값을 정규화, 중복 제거) """
+    return {normalize(row[field]).strip() for field in INDEXED_FIELDS if row[field]} - {''}
+
+
+class AutocompleteIndex:
+    def __init__(self, rows=()):
+        self.profiles = {}
+        self.prefixes = []
+        self.suffixes = []
+        for row in rows:
+            self.profiles[row['id']] = row
+            for key in profile_keys(row):
+                self.prefixes.append((key, row['id']))
+                self.suffixes.extend((key[i:], row['id']) for i in range(1, len(key)))
+        self.prefixes.sort()
+        self.suffixes.sort()
+
+    def add(self, row):
+        self.remove(row['id'])
+        self.profiles[row['id']] = row
+        for key in profile_keys(row):
+            insort(self.prefixes, (key, row['id']))
+            for i in range(1, len(key)):
+                insort(self.suffixes, (key[i:], row['id']))
+
+    def remove(self, profile_id):
+        row = self.profiles.get(profile_id)
+        if row is None:
+            return
+        for key in profile_keys(row):
+            self._discard(self.prefixes, (key, profile_id))
+            for i in range(1, len(key)):
+                self._discard(self.suffixes, (key[i:], profile_id))
+        self.profiles.pop(profile_id, None)
+
+    @staticmethod
+    def _discard(entries, entry):
+        i = bisect_left(entries, entry)
+        if i < len(entries) and entries[i] == entry:
+            del entries[i]
+
+    @staticmethod
+    def _scan(entries, prefix, seen, limit):
+        """ prefix로 시작하는 항목의 프로필 ID를 (이미 찾은 ID 제외) limit개까지 """
+        found = []
+        i = bisect_left(entries, (prefix,))
+        while i < len(entries) and len(found) < limit and entries[i][0].startswith(prefix):
+            profile_id = entries[i][1]
+            if profile_id not in seen:
+                seen.add(profile_id)
+                found.append(profile_id)
+            i += 1
+        return found
+
+    def search(self, query, limit=10):
+        """ ✅ [(프로필 값 dict, 일치 종류)] 상위 limit개 """
+        query = normalize(query).strip()
+        if not query:
+            return []
+
+        seen = set()
+        results = []
+        for profile_id in self._exact_urlname(query)[:limit]:
+            seen.add(profile_id)
+            results.append((self.profiles[profile_id], MATCH_EXACT))
+
+        for match, entries in ((MATCH_PREFIX, self.prefixes), (MATCH_SUBSTRING, self.suffixes)):
+            if len(results) >= limit:
+                break
+            for profile_id in self._scan(entries, query, seen, limit - len(results)):
+                results.append((self.profiles[profile_id], match))
+        return results
+
+    def _exact_urlname(self, query):
+        """ 색인 키가 query와 같고, 그 키가 urlname인 프로필 ID 목록 """
+        found = []
+        i = bisect_left(self.prefixes, (query,))
+        while i < len(self.prefixes) and self.prefixes[i][0] == query:
+            profile_id = self.prefixes[i][1]
+            if normalize(self.profiles[profile_id]['urlname']).strip() == query:
+                found.append(profile_id)
+            i += 1
+        return found
+
+
+_index = None
+_index_generation = None
+_checked_at = 0.0
+_lock = threading.Lock()
+
+
+def _load_rows(profile_ids=None):
+    queryset = Profile.objects.all() if profile_ids is None else Profile.objects.filter(id__in=profile_ids)
+    return list(queryset.values(*PROFILE_VALUE_FIELDS))
+
+
+def get_index():
+    """ ✅ 현재 프로세스의 색인 반환 (처음 호출 시 또는 다른 프로세스에서 프로필이 바뀐 경우 다시 만듦) """
+    global _index, _index_generation, _checked_at
+    now = time.monotonic()
+    if _index is not None and now - _checked_at < GENERATION_CHECK_INTERVAL:
+        return _index
+
+    with _lock:
+        generation = get_generation(GENERATION_NAME)
+        if _index is None or generation != _index_generation:
+            _index = AutocompleteIndex(_load_rows())
+            _index_generation = generation
+        _checked_at = now
+        return _index
+
+
+def patch_profile(profile_id, deleted=False):
+    """
+    ✅ 프로필 한 명의 변경을 현재 프로세스 색인에 반영하고, 다른 프로세스에는 세대 번호로 알림
+    - 올리기 전 세대가 이 색인의 세대이고 이번에 정확히 1만 올랐을 때만 새 세대를 이 색인의 세대로 기록
+    - 그 사이 다른 프로세스가 올린 적이 있으면 그 변경은 이 색인에 없으므로, 다음 조회 때 전체를 다시 만들도록 표시
+    """
+    global _index_generation, _checked_at
+    with _lock:
+        before = get_generation(GENERATION_NAME)
+        after = bump_generation(GENERATION_NAME)
+        if _index is None:
+            return
+        if deleted:
+            _index.remove(profile_id)
+        else:
+            for row in _load_rows([profile_id]):
+                _index.add(row)
+        if before == _index_generation and after == before + 1:
+            _index_generation = after
+        else:
+            _index_generation = None
+            _checked_at = 0.0
+
+
+def autocomplete(query, limit=10):
+    """ ✅ 조회도 같은 잠금 안에서 (patch_profile이 정렬 배열을 고치는 도중에 훑으면 항목을 건너뛰거나 중복으로 읽음) """
+    index = get_index()
+    with _lock:
+        return index.search(query, limit)
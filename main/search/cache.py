@@ -0,0 +1,41 @@
+"""
+검색 결과 캐시
+
+- 키: (검색 범위, 정규화한 검색어, 필터 등 추가 구분값) → 앞뒤 공백 제거, NFC 정규화(한글 자모 조합 통일), casefold
+  · 정규화한 값은 캐시 키에만 쓰고, 실제 검색은 원래 검색어(앞뒤 공백만 제거)로 한다
+- 값: 결과 ID 목록 (+ 게시물 검색은 미리보기) → 상세 정보는 조회할 때마다 ID 목록으로 한 번에 가져옴
+- 무효화: 게시물/프로필이 바뀔 때 해당 세대 번호를 올림 (main.signals.search)
+  → 세대 번호가 캐시 버전이므로 이전 결과는 키를 하나씩 지우지 않아도 더 이상 조회되지 않음
+"""
+import hashlib
+import unicodedata
+from django.core.cache import cache
+from main.utils.cache import get_generation, bump_generation
+
+SEARCH_CACHE_TIMEOUT = 60 * 5  # ✅ 검색 결과 캐시 유지 시간 (5분)
+POSTS = 'search:posts'  # ✅ 게시물 제목/본문/이미지 설명/공개 범위가 바뀌면 올라가는 세대
+PROFILES = 'search:profiles'  # ✅ 사용자명/블로그 이름/블로그 ID가 바뀌면 올라가는 세대
+
+
+def normalize_query(query):
+    """ ✅ 캐시 키용 검색어 정규화 (표기만 다른 같은 검색어가 같은 키를 쓰도록) """
+    return unicodedata.normalize('NFC', query or '').strip().casefold()
+
+
+def get_or_set_search_cache(generation_name, scope, query, compute, variant='', timeout=SEARCH_CACHE_TIMEOUT):
+    """
+    (검색 범위, 정규화한 검색어, variant) 단위로 캐시된 결과를 반환하고, 없으면 compute()로 계산해서 저장
+    query는 원래 검색어 (키를 만들 때만 normalize_query()를 거침), variant는 필터/페이지 등 그대로 쓰는 구분값
+    """
+    key = f"{normalize_query(query)}\n{variant}"
+    digest = hashlib.sha1(key.encode()).hexdigest()  # ✅ 검색어 길이/문자와 관계없이 안전한 키
+    return cache.get_or_set(
+        f"search:{scope}:{digest}",
+        compute,
+        timeout,
+        version=get_generation(generation_name),
+    )
+
+
+def invalidate_search_cache(generation_name):
+    bump_generation(generation_name)
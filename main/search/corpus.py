@@ -0,0 +1,92 @@
+"""
+검색 성능 측정용 한국어 말뭉치 / 검색어 생성 (generate_search_corpus, benchmark_search 명령어에서 사용)
+
+- 같은 seed면 항상 같은 데이터와 같은 검색어 순서가 나옴
+- 단어는 순위에 반비례하는 확률(Zipf 분포)로 뽑아서, 실제 글처럼 흔한 단어와 드문 단어가 섞이게 함
+- 명사 뒤에 조사를 붙여서 bigram 색인/부분 문자열 검색이 실제 문장과 비슷한 조건에서 동작하도록 함
+"""
+import random
+from itertools import accumulate
+
+NOUNS = [
+    "여행", "맛집", "제주", "서울", "부산", "카페", "커피", "일상", "사진", "바다", "산책", "공원", "영화", "음악",
+    "책", "독서", "요리", "레시피", "운동", "헬스", "캠핑", "등산", "강아지", "고양이", "육아", "아이", "주말",
+    "하루", "생각", "가족", "친구", "회사", "출근", "점심", "저녁", "디저트", "빵", "케이크", "라면", "김치찌개",
+    "후기", "리뷰", "추천", "정보", "공부", "시험", "영어", "코딩", "개발", "프로젝트", "게임", "축구", "야구",
+    "드라마", "전시", "공연", "미술관", "박물관", "꽃", "봄", "여름", "가을", "겨울", "벚꽃", "단풍", "눈",
+    "비", "날씨", "호텔", "숙소", "기차", "비행기", "공항", "바닷가", "해변", "노을", "야경", "시장", "골목",
+    "인테리어", "가구", "화분", "식물", "패션", "옷", "신발", "화장품", "건강", "병원", "다이어트", "경제", "주식",
+    "부동산", "자동차", "드라이브", "자전거", "기록", "일기", "계획", "목표", "취미", "그림", "글씨", "편지",
+]
+PARTICLES = ["", "", "", "은", "는", "이", "가", "을", "를", "에", "에서", "와", "과", "의", "도", "로"]
+ENDINGS = ["했다", "좋았다", "다녀왔다", "추천합니다", "기록해 둔다", "정리해 봤다", "먹었다", "봤다", "즐거웠다", "생각난다"]
+PLACES = ["제주", "서울", "부산", "강릉", "전주", "경주", "여수", "속초", "대구", "인천"]
+FAMILY_NAMES = ["김", "이", "박", "최", "정", "강", "조", "윤", "장", "임", "한", "오", "서", "신", "권", "황"]
+GIVEN_SYLLABLES = ["민", "서", "지", "현", "우", "준", "하", "윤", "도", "예", "은", "수", "영", "진", "호", "연"]
+BLOG_SUFFIXES = ["의 블로그", "의 일상", "네 하루", "의 기록", "의 여행일기", "의 맛집노트", "의 책장", "의 취미생활"]
+
+# ✅ 순위 r인 단어의 가중치 1/r (Zipf)
+_NOUN_WEIGHTS = list(accumulate(1 / rank for rank in range(1, len(NOUNS) + 1)))
+
+
+class CorpusGenerator:
+    """ seed 고정 난수로 이름 / 블로그 이름 / 제목 / 본문 문장 / 이미지 설명 / 검색어를 생성 """
+
+    def __init__(self, seed):
+        self.random = random.Random(seed)
+
+    def noun(self):
+        return self.random.choices(NOUNS, cum_weights=_NOUN_WEIGHTS)[0]
+
+    def query_noun(self):
+        """ 검색어용 단어 (검색어는 2글자 이상이어야 하므로 한 글자 단어는 다시 뽑음) """
+        word = self.noun()
+        while len(word) < 2:
+            word = self.noun()
+        return word
+
+    def rare_noun(self):
+        """ 분포와 관계없이 고르게 뽑은 두 글자 이상 단어 (드문 검색어 역할) """
+        return self.random.choice([word for word in NOUNS[len(NOUNS) // 2:] if len(word) >= 2])
+
+    def person_name(self):
+        return self.random.choice(FAMILY_NAMES) + "".join(self.random.choices(GIVEN_SYLLABLES, k=2))
+
+    def blog_name(self, name):
+        return (name + self.random.choice(BLOG_SUFFIXES))[:20]
+
+    def title(self):
+        words = [self.noun() for _ in range(self.random.randint(2, 4))]
+        if self.random.random() < 0.3:
+            words.insert(0, self.random.choice(PLACES))
+        return " ".join(words)[:100]
+
+    def sentence(self):
+        words = [self.noun() + self.random.choice(PARTICLES) for _ in range(self.random.randint(4, 10))]
+        return " ".join(words) + " " + self.random.choice(ENDINGS) + "."
+
+    def paragraph(self):
+        return " ".join(self.sentence() for _ in range(self.random.randint(1, 4)))
+
+    def caption(self):
+        return f"{self.random.choice(PLACES)}에서 찍은 {self.noun()} 사진"
+
+    def post_query(self):
+        """ 게시물 검색어: 흔한 단어 하나 / 두 단어 AND / 드문 단어 / 구문 / 제외 / OR 조합 """
+        kind = self.random.random()
+        if kind < 0.35:
+            return self.query_noun()
+        if kind < 0.6:
+            return f"{self.query_noun()} {self.query_noun()}"
+        if kind < 0.75:
+            return self.rare_noun()
+        if kind < 0.85:
+            return f'"{self.random.choice(PLACES)} {self.query_noun()}"'
+        if kind < 0.95:
+            return f"{self.query_noun()} -{self.query_noun()}"
+        return f"{self.query_noun()} OR {self.rare_noun()}"
+
+    def typo(self, name):
+        """ 이름에서 한 글자를 다른 글자로 바꾼 오타 (오타 허용 검색어 역할) """
+        position = self.random.randrange(len(name))
+        return name[:position] + self.random.choice(GIVEN_SYLLABLES) + name[position + 1:]
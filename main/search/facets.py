@@ -0,0 +1,109 @@
+"""
+검색 결과 패싯(주제 키워드 / 주제 / 작성 월별 개수)과 패싯 필터
+
+- 작성일 범위 필터(date_from, date_to)는 검색 조건(post__ 접두사 Q)에 더해져 SQL에서 적용됨
+- 패싯 필터(keyword, subject, month)는 검색된 게시물의 (keyword, subject, 작성일)을 쿼리 1번으로 읽은 뒤 메모리에서 적용
+  → 패싯마다 자기 필터만 빼고 개수를 세므로, 하나를 골라도 같은 패싯의 다른 값 개수가 그대로 보임
+"""
+from datetime import date, datetime, time, timedelta
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from main.models.post import Post
+
+FILTER_PARAMS = ('keyword', 'subject', 'month', 'date_from', 'date_to')
+FACETS = ('keyword', 'subject', 'month')
+MIN_YEAR, MAX_YEAR = 1900, 2100  # ✅ 날짜 필터 연도 범위 (9999-12-31 등은 하루/한 달 뒤 계산에서 범위를 넘음)
+KEYWORDS = {choice[0] for choice in Post.KEYWORD_CHOICES}
+SUBJECTS = {choice[0] for choice in Post.SUBJECT_CHOICES}
+
+
+def _parse_date(value, name):
+    try:
+        day = date.fromisoformat(value)
+    except ValueError:
+        raise ValidationError(f"{name}는 YYYY-MM-DD 형식이어야 합니다.")
+    _check_year(day.year, name)
+    return day
+
+
+def _check_year(year, name):
+    if not MIN_YEAR <= year <= MAX_YEAR:
+        raise ValidationError(f"{name}의 연도는 {MIN_YEAR}~{MAX_YEAR} 사이여야 합니다.")
+
+
+def parse_facet_filters(params):
+    """ ✅ 쿼리 파라미터 → 패싯 필터 dict (값이 없는 필터는 제외), 잘못된 값이면 ValidationError """
+    filters = {name: params[name].strip() for name in FILTER_PARAMS if params.get(name, '').strip()}
+
+    if 'keyword' in filters and filters['keyword'] not in KEYWORDS:
+        raise ValidationError("keyword 값이 올바르지 않습니다.")
+    if 'subject' in filters and filters['subject'] not in SUBJECTS:
+        raise ValidationError("subject 값이 올바르지 않습니다.")
+    if 'month' in filters:
+        try:
+            month = datetime.strptime(filters['month'], "%Y-%m")
+        except ValueError:
+            raise ValidationError("month는 YYYY-MM 형식이어야 합니다.")
+        _check_year(month.year, 'month')
+    for name in ('date_from', 'date_to'):
+        if name in filters:
+            _parse_date(filters[name], name)
+    return filters
+
+
+def filters_key(filters):
+    """ 패싯 필터 dict → 캐시 키에 붙일 문자열 (순서 무관) """
+    return "&".join(f"{name}={value}" for name, value in sorted(filters.items()))
+
+
+def _local_start(day):
+    """ 날짜 → 해당 날짜 0시 (현재 시간대 기준 aware datetime) """
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def date_filter(filters, prefix=''):
+    """
+    ✅ 작성일 범위 필터(date_from, date_to) → 게시물 조건(Q)
+    범위 비교로 만들어서 created_at 인덱스를 그대로 사용 (패싯이 아니므로 검색 단계에서 SQL로 적용)
+    """
+    condition = Q()
+    if 'date_from' in filters:
+        condition &= Q(**{f"{prefix}created_at__gte": _local_start(_parse_date(filters['date_from'], 'date_from'))})
+    if 'date_to' in filters:
+        end = _parse_date(filters['date_to'], 'date_to') + timedelta(days=1)
+        condition &= Q(**{f"{prefix}created_at__lt": _local_start(end)})
+    return condition
+
+
+def apply_facets(post_ids, filters):
+    """
+    ✅ 게시물 ID 집합 + 패싯 필터 → (패싯 필터를 모두 통과한 ID 집합, 패싯 개수)
+    - 패싯 개수: {"keyword": [{"value", "count"}], "subject": [...], "month": [...]}
+      keyword/subject는 개수 내림차순, month(YYYY-MM)는 최신순
+    - 각 패싯의 개수는 그 패싯 자신의 필터만 빼고 계산 (keyword=X로 골라도 다른 keyword 개수가 보임)
+    - 작성 월은 DB의 시간대 변환(TruncMonth) 대신 현재 시간대로 변환해서 계산
+      → MySQL에 시간대 테이블이 없어도 NULL이 되지 않음
+    """
+    totals = {facet: {} for facet in FACETS}
+    matched = set()
+    post_ids = list(post_ids)
+    rows = Post.objects.filter(id__in=post_ids).values_list('id', 'keyword', 'subject', 'created_at') if post_ids else ()
+    for post_id, keyword, subject, created_at in rows:
+        values = {"keyword": keyword, "subject": subject, "month": timezone.localtime(created_at).strftime("%Y-%m")}
+        failed = [facet for facet in FACETS if facet in filters and values[facet] != filters[facet]]
+        if not failed:
+            matched.add(post_id)
+        for facet, value in values.items():
+            # ✅ 이 패싯 외의 필터를 모두 통과한 게시물만 셈
+            if not set(failed) - {facet}:
+                totals[facet][value] = totals[facet].get(value, 0) + 1
+
+    facets = {}
+    for facet, counts in totals.items():
+        if facet == "month":
+            ordered = sorted(counts.items(), reverse=True)
+        else:
+            ordered = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        facets[facet] = [{"value": value, "count": count} for value, count in ordered]
+    return matched, facets
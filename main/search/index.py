@@ -0,0 +1,166 @@
+"""
+게시물 검색 역색인(SearchPosting) 갱신/조회
+
+- 제목(title), 본문(text), 이미지 설명(caption) 필드별로 토큰 → 게시물 행을 유지
+- 본문 블록이 새로 추가될 때는 해당 블록의 토큰만 더하고, 수정/삭제될 때는 그 게시물의 필드 하나만 다시 만든다
+- 검색은 토큰 교집합으로 후보 게시물을 고른 뒤, 후보 안에서만 원문 icontains로 확인한다
+  (토큰을 만들 수 없는 검색어는 후보를 좁히지 않음 → main.search.query에서 원문을 직접 확인)
+- 색인을 고칠 때 게시물의 토큰 집합이 바뀐 만큼 토큰별 문서 수(SearchToken)도 같이 더하고 뺀다
+  → 검색어 평가 순서를 정할 때 색인 전체를 세지 않고 검색어 토큰 수만큼만 조회
+"""
+from collections import Counter
+from django.db import transaction
+from django.db.models import Count, F, Q
+from main.models.post import Post, PostText, PostImage
+from main.models.searchPosting import SearchPosting
+from main.models.searchToken import SearchToken
+from main.search.tokens import token_counts, query_tokens
+
+TITLE, TEXT, CAPTION = SearchPosting.FIELD_TITLE, SearchPosting.FIELD_TEXT, SearchPosting.FIELD_CAPTION
+
+
+def field_texts(post_ids, field):
+    """ 게시물 ID 목록 → {게시물 ID: 해당 필드의 원문 목록} (필드마다 쿼리 1번) """
+    texts = {post_id: [] for post_id in post_ids}
+    if field == TITLE:
+        rows = Post.objects.filter(id__in=post_ids).values_list('id', 'title')
+    elif field == TEXT:
+        rows = PostText.objects.filter(post_id__in=post_ids).order_by('id').values_list('post_id', 'content')
+    else:
+        rows = PostImage.objects.filter(post_id__in=post_ids, caption__isnull=False).order_by('id').values_list(
+            'post_id', 'caption')
+    for post_id, text in rows:
+        texts[post_id].append(text)
+    return texts
+
+
+def build_postings(post_id, field, texts):
+    return [
+        SearchPosting(token=token, post_id=post_id, field=field, frequency=frequency)
+        for token, frequency in token_counts(*texts).items()
+    ]
+
+
+def post_tokens(postings):
+    """ (게시물 ID, 토큰) 쌍 목록 → {게시물 ID: 토큰 집합} """
+    tokens = {}
+    for post_id, token in postings:
+        tokens.setdefault(post_id, set()).add(token)
+    return tokens
+
+
+def adjust_documents(before, after):
+    """
+    ✅ 게시물별 토큰 집합이 before → after로 바뀐 만큼 토큰별 문서 수 갱신
+    (같은 증감량의 토큰끼리 UPDATE 1번, 새 토큰은 0으로 먼저 만들어 둠)
+    """
+    deltas = Counter()
+    for post_id in before.keys() | after.keys():
+        old, new = before.get(post_id, set()), after.get(post_id, set())
+        deltas.update({token: 1 for token in new - old})
+        deltas.subtract({token: 1 for token in old - new})
+
+    by_delta = {}
+    for token, delta in deltas.items():
+        if delta:
+            by_delta.setdefault(delta, []).append(token)
+    if not by_delta:
+        return
+    SearchToken.objects.bulk_create(
+        [SearchToken(token=token) for delta, tokens in by_delta.items() if delta > 0 for token in tokens],
+        ignore_conflicts=True,
+    )
+    for delta, tokens in by_delta.items():
+        SearchToken.objects.filter(token__in=tokens).update(documents=F('documents') + delta)
+
+
+def index_field(post_id, field):
+    """ ✅ 게시물 하나의 필드 하나를 원문 기준으로 다시 색인 """
+    postings = build_postings(post_id, field, field_texts([post_id], field)[post_id])
+    with transaction.atomic():
+        current = list(
+            SearchPosting.objects.select_for_update().filter(post_id=post_id).values_list('field', 'token')
+        )
+        others = {token for posting_field, token in current if posting_field != field}
+        SearchPosting.objects.filter(post_id=post_id, field=field).delete()
+        SearchPosting.objects.bulk_create(postings)
+        adjust_documents(
+            {post_id: {token for _, token in current}},
+            {post_id: others | {posting.token for posting in postings}},
+        )
+
+
+def add_to_field(post_id, field, text):
+    """ ✅ 새로 추가된 원문(본문 블록 등)의 토큰만 기존 색인에 더함 (필드 전체를 다시 읽지 않음) """
+    counts = token_counts(text)
+    if not counts:
+        return
+    with transaction.atomic():
+        rows = list(SearchPosting.objects.select_for_update().filter(post_id=post_id, token__in=list(counts)))
+        existing = {posting.token: posting for posting in rows if posting.field == field}
+        for token, posting in existing.items():
+            posting.frequency += counts[token]
+        SearchPosting.objects.bulk_update(existing.values(), ['frequency'])
+        SearchPosting.objects.bulk_create([
+            SearchPosting(token=token, post_id=post_id, field=field, frequency=frequency)
+            for token, frequency in counts.items() if token not in existing
+        ])
+        # ✅ 다른 필드에도 없던 토큰만 이 게시물의 새 토큰
+        present = {posting.token for posting in rows}
+        adjust_documents({}, {post_id: set(counts) - present})
+
+
+def unindex_post(post_id):
+    """ ✅ 삭제되는 게시물의 토큰을 문서 수에서 뺌 (색인 행은 CASCADE로 지워짐) """
+    with transaction.atomic():
+        before = post_tokens(SearchPosting.objects.filter(post_id=post_id).values_list('post_id', 'token'))
+        adjust_documents(before, {})
+
+
+def index_posts(post_ids):
+    """ ✅ 여러 게시물의 모든 필드를 다시 색인 (재색인 명령어에서 묶음 단위로 사용) """
+    postings = []
+    for field in (TITLE, TEXT, CAPTION):
+        for post_id, texts in field_texts(post_ids, field).items():
+            postings.extend(build_postings(post_id, field, texts))
+    with transaction.atomic():
+        before = post_tokens(
+            SearchPosting.objects.select_for_update().filter(post_id__in=post_ids).values_list('post_id', 'token')
+        )
+        SearchPosting.objects.filter(post_id__in=post_ids).delete()
+        SearchPosting.objects.bulk_create(postings, batch_size=2000)
+        adjust_documents(before, post_tokens((posting.post_id, posting.token) for posting in postings))
+    return len(postings)
+
+
+def rebuild_documents():
+    """ ✅ 토큰별 문서 수를 색인 전체에서 다시 계산 (재색인 명령어 마지막에 한 번) """
+    counts = (
+        SearchPosting.objects.values('token')
+        .annotate(documents=Count('post_id', distinct=True))
+        .values_list('token', 'documents')
+    )
+    with transaction.atomic():
+        SearchToken.objects.all().delete()
+        SearchToken.objects.bulk_create(
+            [SearchToken(token=token, documents=documents) for token, documents in counts.iterator()],
+            batch_size=2000,
+        )
+
+
+def candidate_post_ids(query, post_filter=Q()):
+    """
+    ✅ 검색어의 토큰을 모두 가진 게시물 ID 서브쿼리 (필드는 구분하지 않음)
+    post_filter는 post__ 접두사가 붙은 조건 (예: Q(post__author=user))
+    토큰이 없는 검색어(한 글자 등)는 색인으로 후보를 좁힐 수 없으므로 None
+    """
+    tokens = query_tokens(query)
+    if not tokens:
+        return None
+    return (
+        SearchPosting.objects.filter(post_filter, token__in=tokens)
+        .values('post_id')
+        .annotate(matched=Count('token', distinct=True))
+        .filter(matched=len(tokens))
+        .values('post_id')
+    )
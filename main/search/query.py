@@ -0,0 +1,147 @@
+"""
+여러 검색어 조합(AND / OR / 제외 / 구문) 검색
+
+문법 (공백으로 구분)
+- 제주 맛집        → 두 검색어를 모두 포함 (AND)
+- 제주 OR 부산     → 둘 중 하나 이상 포함 (OR, '|'도 가능)
+- "제주 여행"      → 따옴표 안의 구문을 그대로 포함
+- -광고 / -"광고 글" → 포함한 게시물 제외
+검색어는 각각 제목, 본문, 이미지 설명 중 한 곳에만 있으면 일치로 본다.
+
+실행 계획
+- 검색어별 문서 수(해당 검색어 토큰들의 문서 수 중 최솟값, SearchToken)를 한 번에 조회해서 예상 결과가 적은 AND 묶음부터 평가
+  (토큰이 없는 한 글자 검색어는 원문을 직접 확인해야 하므로 가장 나중에 평가)
+- 앞 묶음에서 찾은 게시물 ID 안에서만 다음 묶음을 찾고(메모리에서 교집합), 비는 순간 중단
+  → 작업량이 가장 드문 검색어의 결과 수에 비례
+- 제외 검색어는 마지막에 남은 게시물 안에서만 확인
+"""
+import math
+import re
+from django.db.models import Q
+from main.models.post import Post, PostText, PostImage
+from main.models.searchToken import SearchToken
+from main.search.index import candidate_post_ids
+from main.search.tokens import normalize, query_tokens
+
+_query_part = re.compile(r'(-?)"([^"]*)"|(\S+)')
+OR_OPERATORS = ('or', '|')
+
+
+class ParsedQuery:
+    """ groups: OR 묶음들의 AND 목록 ([[검색어, ...], ...]), excluded: 제외 검색어 목록 """
+
+    def __init__(self, groups, excluded):
+        self.groups = groups
+        self.excluded = excluded
+
+    @property
+    def terms(self):
+        """ 포함해야 하는 검색어 목록 (중복 제거, 미리보기 강조에 사용) """
+        return list(dict.fromkeys(term for group in self.groups for term in group))
+
+
+def parse_query(query):
+    """ ✅ 검색어 문자열 → ParsedQuery (검색어는 정규화, 빈 구문은 무시) """
+    groups, excluded = [], []
+    join_next = last_positive = False
+    for match in _query_part.finditer(normalize(query)):
+        negative, phrase, word = match.groups()
+        if word is not None and word in OR_OPERATORS:
+            join_next = last_positive  # ✅ OR은 바로 앞의 포함 검색어와 묶음 (맨 앞/제외 검색어 뒤의 OR은 무시)
+            continue
+        if word is not None and word.startswith('-') and len(word) > 1:
+            negative, word = '-', word[1:]
+        term = " ".join((phrase if word is None else word).split())
+        if not term:
+            continue
+
+        if negative:
+            excluded.append(term)
+        elif join_next:
+            groups[-1].append(term)
+        else:
+            groups.append([term])
+        join_next, last_positive = False, not negative
+    return ParsedQuery(groups, excluded)
+
+
+def document_frequencies(terms):
+    """
+    ✅ 검색어별 예상 문서 수 (토큰별 문서 수 테이블에서 검색어 토큰만 조회, 쿼리 1번)
+    검색어가 있는 게시물은 검색어의 모든 토큰을 가지므로, 토큰별 문서 수 중 최솟값이 상한
+    """
+    tokens_by_term = {term: query_tokens(term) for term in terms}
+    tokens = {token for term_tokens in tokens_by_term.values() for token in term_tokens}
+    counts = dict(
+        SearchToken.objects.filter(token__in=tokens).values_list('token', 'documents')
+    ) if tokens else {}
+    return {
+        term: min((counts.get(token, 0) for token in term_tokens), default=math.inf)
+        for term, term_tokens in tokens_by_term.items()
+    }
+
+
+def _post_lookups(condition):
+    """ post__ 접두사가 붙은 조건(Q)을 Post 모델 기준 조건으로 변환 (post__author → author, post_id → id) """
+    converted = Q()
+    converted.connector, converted.negated = condition.connector, condition.negated
+    for child in condition.children:
+        if isinstance(child, Q):
+            converted.children.append(_post_lookups(child))
+            continue
+        lookup, value = child
+        if lookup.startswith('post__'):
+            lookup = lookup[len('post__'):]
+        elif lookup == 'post_id' or lookup.startswith('post_id__'):
+            lookup = 'id' + lookup[len('post_id'):]
+        converted.children.append((lookup, value))
+    return converted
+
+
+def term_post_ids(term, post_filter=Q(), within=None):
+    """
+    검색어 하나를 제목/본문/이미지 설명 중 한 곳에라도 포함한 게시물 ID 집합
+    within이 있으면 그 게시물 ID 안에서만 찾음
+    """
+    if within is not None:
+        post_filter = post_filter & Q(post_id__in=within)
+    candidates = candidate_post_ids(term, post_filter)
+    if candidates is None:
+        # ✅ 색인으로 후보를 좁힐 수 없는 검색어는 조건에 맞는 게시물의 원문을 직접 확인
+        candidates = Post.objects.filter(_post_lookups(post_filter)).values('id')
+    return (
+        set(Post.objects.filter(id__in=candidates, title__icontains=term).values_list('id', flat=True))
+        | set(PostText.objects.filter(post_id__in=candidates, content__icontains=term).values_list('post_id', flat=True))
+        | set(PostImage.objects.filter(post_id__in=candidates, caption__icontains=term).values_list('post_id', flat=True))
+    )
+
+
+def match_posts(query, post_filter=Q()):
+    """
+    ✅ 검색어 조합에 맞는 게시물 ID 집합
+    post_filter는 post__ 접두사가 붙은 조건 (candidate_post_ids와 동일)
+    """
+    parsed = parse_query(query)
+    if not parsed.groups:
+        return set()
+
+    frequencies = document_frequencies(parsed.terms + parsed.excluded)
+    groups = sorted(
+        (sorted(group, key=frequencies.get) for group in parsed.groups),
+        key=lambda group: sum(frequencies[term] for term in group),
+    )
+
+    matched = None
+    for group in groups:
+        found = set()
+        for term in group:
+            found |= term_post_ids(term, post_filter, matched)
+        matched = found
+        if not matched:
+            return matched
+
+    for term in sorted(parsed.excluded, key=frequencies.get):
+        matched -= term_post_ids(term, post_filter, matched)
+        if not matched:
+            break
+    return matched
@@ -0,0 +1,72 @@
+"""
+게시물 검색 결과 순위
+
+- 점수 = Σ 필드 가중치 × log(1 + 필드 안 검색어 토큰 등장 횟수) + 최신 글 가산점
+  · 필드 가중치: 제목 > 본문 > 이미지 설명
+  · 최신 글 가산점: 기준 시각(RECENCY_EPOCH) 이후 RECENCY_DAYS일마다 RECENCY_WEIGHT점
+    → 현재 시각이 아니라 작성일로만 정해지므로 점수가 시간이 지나도 바뀌지 않음 ((점수, ID) 커서가 계속 유효)
+- 등장 횟수/작성일은 검색 색인(SearchPosting)에서 쿼리 1번으로 집계
+  (토큰이 없는 한 글자 검색어로만 일치한 게시물은 작성일만 따로 조회)
+- 페이지는 (점수, ID) 커서 다음 항목 중 상위 limit개만 크기 제한 힙(heapq.nlargest)으로 선택
+  → 전체 결과를 정렬하지 않음
+"""
+import heapq
+import math
+from datetime import datetime, timezone as dt_timezone
+from django.db.models import Sum
+from main.models.post import Post
+from main.models.searchPosting import SearchPosting
+from main.search.tokens import query_tokens
+
+FIELD_WEIGHTS = {
+    SearchPosting.FIELD_TITLE: 3.0,
+    SearchPosting.FIELD_TEXT: 1.0,
+    SearchPosting.FIELD_CAPTION: 0.5,
+}
+RECENCY_EPOCH = datetime(2024, 1, 1, tzinfo=dt_timezone.utc)
+RECENCY_WEIGHT = 1.0  # ✅ RECENCY_DAYS일 더 최근 글이 받는 가산점 차이 (제목 한 번 일치 ≈ 2.1)
+RECENCY_DAYS = 180
+
+
+def recency_boost(created_at):
+    """ 작성일 → 가산점 (작성일에 비례, 두 글의 차이는 작성일 차이로만 정해짐) """
+    return RECENCY_WEIGHT * (created_at - RECENCY_EPOCH).total_seconds() / 86400 / RECENCY_DAYS
+
+
+def score_posts(post_ids, terms):
+    """ ✅ 게시물 ID 목록 → [(점수, 게시물 ID)] (순서 없음) """
+    post_ids = list(post_ids)
+    tokens = {token for term in terms for token in query_tokens(term)}
+    if not post_ids:
+        return []
+
+    scores, created = {}, {}
+    rows = (
+        SearchPosting.objects.filter(post_id__in=post_ids, token__in=tokens)
+        .values('post_id', 'field', 'post__created_at')
+        .annotate(hits=Sum('frequency'))
+        .values_list('post_id', 'field', 'post__created_at', 'hits')
+    ) if tokens else []
+    for post_id, field, created_at, hits in rows:
+        scores[post_id] = scores.get(post_id, 0.0) + FIELD_WEIGHTS[field] * math.log1p(hits)
+        created[post_id] = created_at
+
+    missing = set(post_ids) - created.keys()
+    if missing:
+        for post_id, created_at in Post.objects.filter(id__in=missing).values_list('id', 'created_at'):
+            scores[post_id] = 0.0
+            created[post_id] = created_at
+
+    for post_id, created_at in created.items():
+        scores[post_id] += recency_boost(created_at)
+    return [(score, post_id) for post_id, score in scores.items()]
+
+
+def top_page(ranking, limit, after=None):
+    """
+    ✅ [(점수, 게시물 ID)] 중 (점수, ID) 내림차순으로 after 다음 limit개
+    다음 페이지가 있는지 알 수 있도록 limit + 1개까지 반환
+    """
+    if after is not None:
+        ranking = (entry for entry in ranking if entry < after)
+    return heapq.nlargest(limit + 1, ranking)
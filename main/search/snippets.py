@@ -0,0 +1,101 @@
+"""
+검색 결과 미리보기(snippet) + 강조(highlight) 위치 계산
+
+- 게시물마다 검색어가 처음 나오는 본문 블록 하나만 윈도우 함수(ROW_NUMBER)로 골라서 한 번에 조회
+- 블록 전체가 아니라 검색어 주변 SNIPPET_MAX_CHARS 글자만 SQL(SUBSTR)에서 잘라서 읽음
+  → 글이 아무리 길어도 게시물당 읽는 양이 일정
+- 본문에 없으면 이미지 설명에서 같은 방식으로 찾고, 둘 다 없으면 빈 미리보기
+"""
+import re
+from django.db.models import Case, F, IntegerField, Q, Value, When, Window
+from django.db.models.functions import Greatest, Least, Lower, RowNumber, StrIndex, Substr
+from main.models.post import PostText, PostImage
+from main.search.query import parse_query
+
+SNIPPET_CONTEXT = 30  # ✅ 검색어 앞뒤로 보여줄 글자 수
+SNIPPET_MAX_CHARS = 200  # ✅ 블록 하나에서 읽는 최대 글자 수
+_NOT_FOUND = 10 ** 9
+
+
+def split_terms(query):
+    """ 검색어 → 강조할 검색어 목록 (구문은 한 덩어리, 제외 검색어와 OR 연산자는 빼고 중복 제거) """
+    return parse_query(query).terms
+
+
+def highlight_offsets(text, terms):
+    """ 미리보기 문자열 안에서 검색어가 나오는 [시작, 끝) 위치 목록 (겹치는 구간은 합침) """
+    lowered = text.lower()
+    spans = sorted(
+        (match.start(), match.end())
+        for term in terms
+        for match in re.finditer(re.escape(term), lowered)
+    )
+    merged = []
+    for start, end in spans:
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def _first_blocks(model, text_field, post_ids, terms):
+    """
+    게시물마다 검색어가 들어 있는 첫 블록(ID 순)의 검색어 주변 구간만 조회
+    반환: {게시물 ID: (잘라낸 문자열, 잘린 앞부분 여부, 잘린 뒷부분 여부)}
+    """
+    matches = Q()
+    for term in terms:
+        matches |= Q(**{f"{text_field}__icontains": term})
+
+    # ✅ 검색어별 첫 등장 위치(1부터, 없으면 0) 중 가장 앞선 위치
+    positions = {f"pos_{i}": StrIndex(Lower(text_field), Value(term)) for i, term in enumerate(terms)}
+    found_positions = [
+        Case(When(**{name: 0}, then=Value(_NOT_FOUND)), default=name, output_field=IntegerField())
+        for name in positions
+    ]
+    first_position = found_positions[0] if len(found_positions) == 1 else Least(*found_positions)
+    window = min(SNIPPET_MAX_CHARS, 2 * SNIPPET_CONTEXT + max(len(term) for term in terms))
+
+    rows = (
+        model.objects.filter(matches, post_id__in=post_ids)
+        .annotate(**positions)
+        .annotate(start=Greatest(Value(1), first_position - SNIPPET_CONTEXT))
+        .annotate(
+            row=Window(RowNumber(), partition_by=['post_id'], order_by='id'),
+            # ✅ 뒤에 잘린 내용이 있는지 알 수 있도록 window + 1 글자만 읽음
+            snippet=Substr(text_field, F('start'), window + 1),
+        )
+        .filter(row=1)
+        .values_list('post_id', 'snippet', 'start')
+    )
+    return {
+        post_id: (snippet[:window], start > 1, len(snippet) > window)
+        for post_id, snippet, start in rows
+    }
+
+
+def build_snippets(post_ids, query):
+    """
+    ✅ 게시물 ID 목록 → {게시물 ID: {"excerpt": 미리보기, "highlights": [[시작, 끝], ...]}}
+    본문 블록 조회 1번 + (본문에서 못 찾은 게시물이 있으면) 이미지 설명 조회 1번
+    """
+    post_ids = list(post_ids)
+    terms = split_terms(query)
+    if not post_ids or not terms:
+        return {}
+
+    found = _first_blocks(PostText, 'content', post_ids, terms)
+    missing = [post_id for post_id in post_ids if post_id not in found]
+    if missing:
+        found.update(_first_blocks(PostImage, 'caption', missing, terms))
+
+    snippets = {}
+    for post_id, (text, cut_start, cut_end) in found.items():
+        excerpt = text + ("..." if cut_end else "")
+        snippets[post_id] = {
+            "excerpt": excerpt,
+            "highlights": highlight_offsets(text, terms),
+            "truncated_start": cut_start,
+        }
+    return snippets
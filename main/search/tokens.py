@@ -0,0 +1,51 @@
+"""
+검색용 토큰화
+
+- 한국어는 조사/어미가 붙어서 단어 단위 일치가 어려우므로 문자 bigram을 토큰으로 사용
+- 글자가 아닌 문자(공백, 기호)가 이어진 구간은 공백 한 칸으로 바꾸고 앞뒤에 공백을 붙인 뒤 bigram을 만든다
+  (예: "제주 여행을" → " 제", 제주, "주 ", " 여", 여행, 행을, "을 ")
+  → 띄어쓰기를 걸친 검색어("주 여")나 한 글자 단어도 색인된 bigram으로 찾을 수 있음
+- 검색어는 앞뒤 공백 없이 같은 규칙으로 bigram을 만들고, bigram이 모두 있는 게시물만 후보로 본다
+  (bigram이 모두 있어도 연속된 문자열이 아닐 수 있으므로 후보는 원문으로 한 번 더 확인)
+- 한 글자 검색어처럼 bigram이 없는 검색어는 색인을 쓰지 않고 원문을 직접 확인한다 (main.search.query)
+"""
+import re
+import unicodedata
+from collections import Counter
+
+_non_word = re.compile(r"\W+")
+
+
+def normalize(text):
+    """ 유니코드 정규화(NFKC) + 소문자 변환 """
+    return unicodedata.normalize('NFKC', text or '').lower()
+
+
+def collapse(text):
+    """ 정규화 후 글자가 아닌 문자 구간을 공백 한 칸으로 바꿈 """
+    return _non_word.sub(' ', normalize(text))
+
+
+def bigrams(text):
+    return [text[i:i + 2] for i in range(len(text) - 1)]
+
+
+def tokenize(text):
+    """ 텍스트 → 토큰 목록 (중복 포함, 색인 frequency 계산용, 토큰은 항상 두 글자) """
+    text = collapse(text).strip()
+    if not text:
+        return []
+    return bigrams(f" {text} ")
+
+
+def token_counts(*texts):
+    """ 여러 텍스트를 합친 토큰별 등장 횟수 """
+    counts = Counter()
+    for text in texts:
+        counts.update(tokenize(text))
+    return counts
+
+
+def query_tokens(query):
+    """ 검색어 → 중복 없는 토큰 목록 (입력 순서 유지, 두 글자가 안 되면 빈 목록) """
+    return list(dict.fromkeys(bigrams(collapse(query))))
@@ -0,0 +1,79 @@
+"""
+프로필(사용자명 / 블로그 이름 / 블로그 ID) 오타 허용 검색
+
+- 값에서 공백을 모두 빼고 앞에 두 칸, 뒤에 한 칸을 채운 뒤 3글자씩 자른 조각(trigram)을 색인
+  (예: "홍 길동" → "  홍", " 홍길", "홍길동", "길동 ") → 띄어쓰기가 달라도 같은 조각
+- 유사도는 검색어와 필드 값의 trigram 집합 자카드 계수: 공통 / (검색어 + 필드 값 - 공통)
+- 검색어의 trigram으로 색인 행만 조회해서 (프로필, 필드)별 공통 개수를 집계하고,
+  유사도 SIMILARITY_THRESHOLD 이상이 될 수 없는 후보는 HAVING에서 미리 제외
+"""
+import math
+from django.db import transaction
+from django.db.models import Count, Max
+from main.models.profile import Profile
+from main.models.profileTrigram import ProfileTrigram
+from main.search.tokens import normalize
+
+FIELDS = (ProfileTrigram.FIELD_USERNAME, ProfileTrigram.FIELD_BLOG_NAME, ProfileTrigram.FIELD_URLNAME)
+SIMILARITY_THRESHOLD = 0.3  # ✅ 이보다 유사도가 낮으면 결과에서 제외
+CANDIDATE_LIMIT = 1000  # ✅ 공통 trigram이 많은 순으로 읽는 최대 (프로필, 필드) 수
+
+
+def trigrams(text):
+    """ 텍스트 → 중복 없는 trigram 집합 (정규화, 공백 제거) """
+    value = "".join(normalize(text).split())
+    if not value:
+        return set()
+    padded = f"  {value} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def build_trigrams(profile_id, values):
+    """ {필드: 값} → ProfileTrigram 목록 """
+    rows = []
+    for field, value in values.items():
+        grams = trigrams(value)
+        rows.extend(
+            ProfileTrigram(trigram=gram, profile_id=profile_id, field=field, size=len(grams))
+            for gram in grams
+        )
+    return rows
+
+
+def index_profiles(profile_ids):
+    """ ✅ 프로필들의 trigram 색인을 다시 만듦 (프로필 저장 시그널, 재색인 명령어에서 사용) """
+    rows = []
+    for values in Profile.objects.filter(id__in=profile_ids).values('id', *FIELDS):
+        rows.extend(build_trigrams(values.pop('id'), values))
+    with transaction.atomic():
+        ProfileTrigram.objects.filter(profile_id__in=profile_ids).delete()
+        ProfileTrigram.objects.bulk_create(rows, batch_size=2000)
+    return len(rows)
+
+
+def similar_profiles(query, threshold=SIMILARITY_THRESHOLD):
+    """
+    ✅ 검색어와 비슷한 프로필 [(프로필 ID, 유사도)] (유사도 내림차순)
+    프로필마다 세 필드 중 가장 비슷한 필드의 유사도를 사용
+    """
+    grams = trigrams(query)
+    if not grams:
+        return []
+
+    # ✅ 공통 / (검색어 + 값 - 공통) ≥ threshold 이려면 공통 ≥ threshold × 검색어 trigram 수 이어야 함
+    min_shared = max(1, math.ceil(threshold * len(grams)))
+    rows = (
+        ProfileTrigram.objects.filter(trigram__in=grams)
+        .values('profile_id', 'field')
+        .annotate(shared=Count('id'), size=Max('size'))
+        .filter(shared__gte=min_shared)
+        .order_by('-shared')
+        .values_list('profile_id', 'shared', 'size')[:CANDIDATE_LIMIT]
+    )
+
+    best = {}
+    for profile_id, shared, size in rows:
+        similarity = shared / (len(grams) + size - shared)
+        if similarity >= threshold and similarity > best.get(profile_id, 0):
+            best[profile_id] = similarity
+    return sorted(best.items(), key=lambda item: (-item[1], item[0]))
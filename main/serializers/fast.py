@@ -0,0 +1,179 @@
+"""
+읽기 전용 목록 API를 위한 빠른 직렬화
+
+- 모델 인스턴스를 만들지 않고 .values() 결과(dict)로 바로 응답을 구성
+- 필드 검증기/시리얼라이저 인스턴스 생성 없이 기존 시리얼라이저와 같은 JSON 형태를 만든다
+  (PostSerializer, CommentSerializer, NeighborSerializer와 출력이 같아야 함
+   → `python manage.py benchmark_serializers`로 일치 여부와 속도를 확인)
+"""
+from django.core.files.storage import default_storage
+from rest_framework import serializers
+from main.models.post import PostText, PostImage, POST_BODY_DOCUMENT_READ
+from main.models.comment import Comment
+from main.models.tag import PostTag
+
+# ✅ 날짜 변환만 기존 필드를 재사용 (타임존 처리/포맷을 DRF와 동일하게 유지)
+_datetime_field = serializers.DateTimeField()
+_neighbor_datetime_field = serializers.DateTimeField(format="%Y-%m-%d %H:%M")
+
+SECRET_COMMENT_CONTENT = "비밀 댓글입니다."
+
+
+def format_datetime(value):
+    """ DRF DateTimeField와 같은 형식으로 날짜 변환 (None은 그대로) """
+    return _datetime_field.to_representation(value) if value is not None else None
+
+
+def file_url(name, request=None):
+    """ ImageField 값(파일 이름) → URL (request가 있으면 절대 URL, DRF ImageField와 동일) """
+    if not name:
+        return None
+    url = default_storage.url(name)
+    return request.build_absolute_uri(url) if request is not None else url
+
+
+def _text_block(block):
+    return {
+        "id": block['id'],
+        "content": str(block['content']),
+        "font": str(block['font']),
+        "font_size": int(block['font_size']),
+        "is_bold": bool(block['is_bold']),
+    }
+
+
+POST_VALUE_FIELDS = (
+    'id', 'author__profile__username', 'title', 'category', 'subject', 'keyword', 'visibility',
+    'is_complete', 'created_at', 'updated_at', 'like_count', 'comment_count', 'body',
+)
+
+
+def serialize_posts(queryset, request=None):
+    """
+    PostSerializer(many=True)와 같은 형태로 게시물 목록 직렬화
+    게시물 1번 + (body 문서가 없는 게시물이 있을 때만) 텍스트 1번 + 태그 1번 + 이미지 1번 조회
+    """
+    rows = list(queryset.prefetch_related(None).values(*POST_VALUE_FIELDS))
+    post_ids = [row['id'] for row in rows]
+
+    legacy_ids = [row['id'] for row in rows if not POST_BODY_DOCUMENT_READ or row['body'] is None]
+    legacy_texts = {post_id: [] for post_id in legacy_ids}
+    if legacy_ids:
+        for text in PostText.objects.filter(post_id__in=legacy_ids).order_by('id').values(
+                'id', 'post_id', 'content', 'font', 'font_size', 'is_bold'):
+            legacy_texts[text['post_id']].append(text)
+
+    tags = {post_id: [] for post_id in post_ids}
+    images = {post_id: [] for post_id in post_ids}
+    if post_ids:
+        for post_id, name in PostTag.objects.filter(post_id__in=post_ids).order_by('id').values_list(
+                'post_id', 'tag__name'):
+            tags[post_id].append(name)
+        for image in PostImage.objects.filter(post_id__in=post_ids).order_by('id').values(
+                'id', 'post_id', 'image', 'caption', 'is_representative'):
+            images[image['post_id']].append({
+                "id": image['id'],
+                "image": file_url(image['image'], request),
+                "caption": image['caption'],
+                "is_representative": image['is_representative'],
+            })
+
+    return [
+        {
+            "id": row['id'],
+            "author_name": row['author__profile__username'],
+            "title": row['title'],
+            "category": row['category'],
+            "subject": row['subject'],
+            "keyword": row['keyword'],
+            "visibility": row['visibility'],
+            "is_complete": row['is_complete'],
+            "tags": tags[row['id']],
+            "texts": [_text_block(block) for block in legacy_texts.get(row['id'], row['body'] or [])],
+            "images": images[row['id']],
+            "created_at": format_datetime(row['created_at']),
+            "updated_at": format_datetime(row['updated_at']),
+            "total_likes": row['like_count'],
+            "total_comments": row['comment_count'],
+        }
+        for row in rows
+    ]
+
+
+COMMENT_VALUE_FIELDS = (
+    'id', 'author_id', 'author__username', 'content', 'is_private', 'is_parent', 'parent_id',
+    'parent__author_id', 'created_at', 'post__author__profile__id',
+)
+
+
+def serialize_comments(queryset, user):
+    """
+    CommentSerializer(many=True)와 같은 형태로 댓글 목록 직렬화 (대댓글 포함, 비밀 댓글 가림 처리 동일)
+    댓글 1번 + 대댓글 깊이마다 1번 조회
+    """
+    viewer_profile_id = user.profile.id if user.is_authenticated else None
+
+    def to_data(row, replies):
+        is_post_author = row['author_id'] == row['post__author__profile__id']
+        can_read = viewer_profile_id is not None and viewer_profile_id in (
+            row['author_id'], row['post__author__profile__id'], row['parent__author_id']
+        )
+        return {
+            "id": row['id'],
+            "author_name": row['author__username'],
+            "content": SECRET_COMMENT_CONTENT if row['is_private'] and not can_read else row['content'],
+            "is_private": row['is_private'],
+            "is_parent": row['is_parent'],
+            "is_post_author": is_post_author,
+            "parent": row['parent_id'],
+            "created_at": format_datetime(row['created_at']),
+            "replies": replies,
+        }
+
+    rows = list(queryset.prefetch_related(None).values(*COMMENT_VALUE_FIELDS))
+
+    # ✅ 대댓글은 깊이 단위로 한 번에 조회 (is_parent인 댓글만 하위 목록을 가짐, 기존 시리얼라이저와 동일)
+    children = {}
+    parent_ids = [row['id'] for row in rows if row['is_parent']]
+    while parent_ids:
+        level = list(Comment.objects.filter(parent_id__in=parent_ids).order_by('id').values(*COMMENT_VALUE_FIELDS))
+        for reply in level:
+            children.setdefault(reply['parent_id'], []).append(reply)
+        parent_ids = [reply['id'] for reply in level if reply['is_parent']]
+
+    def build(row):
+        replies = [build(reply) for reply in children.get(row['id'], [])] if row['is_parent'] else []
+        return to_data(row, replies)
+
+    return [build(row) for row in rows]
+
+
+NEIGHBOR_VALUE_FIELDS = (
+    'id', 'from_user_id', 'to_user_id', 'status', 'request_message', 'created_at',
+    'from_user__profile__urlname', 'to_user__profile__urlname',
+    'from_user__profile__username', 'to_user__profile__username',
+    'from_user__profile__user_pic', 'to_user__profile__user_pic',
+)
+
+
+def serialize_neighbors(queryset):
+    """
+    NeighborSerializer(many=True)와 같은 형태로 서로이웃 신청/관계 목록 직렬화 (조인 쿼리 1번)
+    """
+    return [
+        {
+            "id": row['id'],
+            "from_user": str(row['from_user_id']),
+            "to_user": str(row['to_user_id']),
+            "from_urlname": row['from_user__profile__urlname'],
+            "to_urlname": row['to_user__profile__urlname'],
+            "from_username": row['from_user__profile__username'],
+            "to_username": row['to_user__profile__username'],
+            "status": row['status'],
+            "request_message": row['request_message'],
+            "created_at": _neighbor_datetime_field.to_representation(row['created_at']),
+            "from_user_pic": file_url(row['from_user__profile__user_pic']),
+            "to_user_pic": file_url(row['to_user__profile__user_pic']),
+        }
+        for row in queryset.prefetch_related(None).values(*NEIGHBOR_VALUE_FIELDS)
+    ]
@@ -82,18 +82,14 @@ class NeighborSerializer(serializers.ModelSerializer):
 
     def update(self, instance, validated_data):
         """
-        ✅ 서로이웃 요청을 `accepted`로 변경하면 Profile 관계에도 반영
+        ✅ 서로이웃 요청을 `accepted`로 변경하면 Neighbor.accept로 양방향 관계를 함께 저장
         """
-        instance.status = validated_data.get("status", instance.status)
-        instance.save()
-
-        if instance.status == "accepted":
-            from_profile, _ = Profile.objects.get_or_create(user=instance.from_user)
-            to_profile, _ = Profile.objects.get_or_create(user=instance.to_user)
-
-            # ✅ 중복 추가 방지
-            if not from_profile.neighbors.filter(id=to_profile.id).exists():
-                from_profile.neighbors.add(to_profile)
-                to_profile.neighbors.add(from_profile)
+        new_status = validated_data.get("status", instance.status)
+        if new_status == "accepted":
+            Neighbor.accept(instance.to_user, instance.from_user)
+            instance.refresh_from_db()
+            return instance
 
+        instance.status = new_status
+        instance.save()
         return instance
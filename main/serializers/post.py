@@ -19,12 +19,14 @@ class PostImageSerializer(serializers.ModelSerializer):
 
 
 class PostSerializer(serializers.ModelSerializer):
-    texts = PostTextSerializer(many=True, read_only=True)
+    # ✅ body 문서가 있으면 문서 블록을, 없으면 PostText 행을 같은 형태로 직렬화
+    texts = PostTextSerializer(many=True, read_only=True, source='text_blocks')
     images = PostImageSerializer(many=True, read_only=True)
     author_name = serializers.CharField(source='author.profile.username', read_only=True)
     visibility = serializers.ChoiceField(choices=Post.VISIBILITY_CHOICES)
     keyword = serializers.CharField(read_only=True)
     subject = serializers.ChoiceField(choices=Post.SUBJECT_CHOICES, default="주제 선택 안 함")
+    tags = serializers.ListField(child=serializers.CharField(), source='tag_names', read_only=True)
 
     # ✅ "총 좋아요 개수" & "총 댓글 개수"
     total_likes = serializers.IntegerField(source="like_count", read_only=True)
@@ -34,7 +36,7 @@ class PostSerializer(serializers.ModelSerializer):
         model = Post
         fields = [
             'id', 'author_name', 'title', 'category', 'subject', 'keyword', 'visibility',
-            'is_complete', 'texts', 'images', 'created_at', 'updated_at',
+            'is_complete', 'tags', 'texts', 'images', 'created_at', 'updated_at',
             'total_likes', 'total_comments'
         ]
         read_only_fields = ['id', 'author_name', 'created_at', 'updated_at', 'keyword']
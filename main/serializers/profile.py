@@ -16,12 +16,6 @@ class ProfileSerializer(serializers.ModelSerializer):
             'urlname_edit_count': {'read_only': True},  # ✅ 변경 횟수는 클라이언트가 수정 불가
         }
 
-    def get_neighbors(self,obj):
-        return [
-            {"username": neighbor.username, "user_pic": neighbor.user_pic.url if neighbor.user_pic else None}
-            for neighbor in obj.neighsbors.all()
-        ]
-
     def validate_blog_name(self, value):
         if not value.strip():
             raise serializers.ValidationError("블로그 이름은 공백일 수 없습니다.")
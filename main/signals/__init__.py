@@ -1 +1,5 @@
-from .signals import create_profile
\ No newline at end of file
+from .signals import create_profile
+from . import blog
+from . import topicFeed
+from . import tag
+from . import search
@@ -0,0 +1,40 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from main.models.post import Post
+from main.models.profile import Profile
+from main.models.neighbor import Neighbor
+from main.utils.cache import invalidate_blog_cache
+
+
+# ✅ 블로그 캐시(카테고리 목록 등)에 영향을 주는 게시물 필드
+BLOG_CACHE_FIELDS = {'author', 'category', 'visibility', 'is_complete', 'created_at'}
+
+
+@receiver(post_save, sender=Post)
+def invalidate_blog_cache_on_post_save(sender, instance, update_fields=None, **kwargs):
+    """ ✅ 게시물 생성/수정 시 작성자의 블로그 캐시 무효화 (좋아요 수 등 일부 필드만 저장한 경우 제외) """
+    if update_fields is not None and not BLOG_CACHE_FIELDS.intersection(update_fields):
+        return
+    invalidate_blog_cache(instance.author_id)
+
+
+@receiver(post_delete, sender=Post)
+def invalidate_blog_cache_on_post_delete(sender, instance, **kwargs):
+    """ ✅ 게시물 삭제 시 작성자의 블로그 캐시 무효화 """
+    invalidate_blog_cache(instance.author_id)
+
+
+@receiver(post_save, sender=Profile)
+def invalidate_blog_cache_on_profile_save(sender, instance, **kwargs):
+    """ ✅ 블로그 이름/사진 등 프로필이 바뀌면 블로그 홈 캐시 무효화 """
+    invalidate_blog_cache(instance.user_id)
+
+
+@receiver(post_save, sender=Neighbor)
+@receiver(post_delete, sender=Neighbor)
+def invalidate_blog_cache_on_neighbor_change(sender, instance, **kwargs):
+    """ ✅ 서로이웃 관계가 바뀌면 양쪽 블로그의 캐시(서로이웃 수/목록) 무효화 """
+    if instance.status == 'accepted':
+        invalidate_blog_cache(instance.from_user_id)
+        invalidate_blog_cache(instance.to_user_id)
+
@@ -0,0 +1,111 @@
+from django.db.models.signals import post_save, post_delete, pre_delete
+from django.dispatch import receiver
+from main.models.post import Post, PostText, PostImage
+from main.models.profile import Profile
+from main.search.autocomplete import INDEXED_FIELDS, patch_profile
+from main.search.cache import invalidate_search_cache, POSTS, PROFILES
+from main.search.trigrams import index_profiles
+from main.search.index import index_field, add_to_field, unindex_post, TITLE, TEXT, CAPTION
+
+
+def deleted_directly(sender, origin):
+    """
+    ✅ 본문/이미지가 직접 삭제된 경우에만 True
+    게시물(또는 사용자) 삭제에 딸려서 지워지는 경우에는 색인도 CASCADE로 지워지므로 다시 만들지 않음
+    """
+    model = getattr(origin, 'model', type(origin))
+    return model is sender
+
+
+@receiver(post_save, sender=Post)
+def index_post_title(sender, instance, created, update_fields=None, **kwargs):
+    """ ✅ 제목이 저장될 수 있는 경우에만 제목 색인 갱신 (좋아요 수/body만 저장한 경우 제외) """
+    if update_fields is not None and 'title' not in update_fields:
+        return
+    index_field(instance.id, TITLE)
+
+
+@receiver(pre_delete, sender=Post)
+def unindex_post_tokens(sender, instance, **kwargs):
+    """ ✅ 게시물이 지워지기 전에 토큰별 문서 수에서 빼기 (색인 행은 CASCADE로 지워짐) """
+    unindex_post(instance.id)
+
+
+@receiver(post_save, sender=PostText)
+def index_post_text(sender, instance, created, **kwargs):
+    """ ✅ 새 본문 블록은 토큰만 추가, 수정된 경우 해당 게시물 본문 색인을 다시 만듦 """
+    if created:
+        add_to_field(instance.post_id, TEXT, instance.content)
+    else:
+        index_field(instance.post_id, TEXT)
+
+
+@receiver(post_delete, sender=PostText)
+def unindex_post_text(sender, instance, origin=None, **kwargs):
+    if deleted_directly(sender, origin):
+        index_field(instance.post_id, TEXT)
+
+
+@receiver(post_save, sender=PostImage)
+def index_post_caption(sender, instance, **kwargs):
+    """ ✅ 이미지 설명 색인 갱신 (게시물 하나의 설명은 많지 않으므로 필드 전체를 다시 만듦) """
+    index_field(instance.post_id, CAPTION)
+
+
+@receiver(post_delete, sender=PostImage)
+def unindex_post_caption(sender, instance, origin=None, **kwargs):
+    if deleted_directly(sender, origin):
+        index_field(instance.post_id, CAPTION)
+
+
+@receiver(post_save, sender=Profile)
+def index_profile_autocomplete(sender, instance, update_fields=None, **kwargs):
+    """ ✅ 자동완성 색인 갱신 (urlname/username/blog_name/프로필 사진이 저장될 수 있는 경우만) """
+    if update_fields is not None and not set(update_fields) & {*INDEXED_FIELDS, 'user_pic'}:
+        return
+    patch_profile(instance.id)
+
+
+@receiver(post_save, sender=Profile)
+def index_profile_trigrams(sender, instance, update_fields=None, **kwargs):
+    """ ✅ 오타 검색 trigram 색인 갱신 (urlname/username/blog_name이 저장될 수 있는 경우만) """
+    if update_fields is not None and not set(update_fields) & set(INDEXED_FIELDS):
+        return
+    index_profiles([instance.id])
+
+
+@receiver(post_delete, sender=Profile)
+def unindex_profile_autocomplete(sender, instance, **kwargs):
+    patch_profile(instance.id, deleted=True)
+
+
+# ✅ 검색 결과 캐시 무효화 (게시물 검색 결과에 영향을 주는 필드만)
+POST_SEARCH_FIELDS = {'title', 'visibility'}
+
+
+@receiver(post_save, sender=Post)
+def invalidate_post_search_on_save(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not set(update_fields) & POST_SEARCH_FIELDS:
+        return
+    invalidate_search_cache(POSTS)
+
+
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=PostText)
+@receiver(post_delete, sender=PostText)
+@receiver(post_save, sender=PostImage)
+@receiver(post_delete, sender=PostImage)
+def invalidate_post_search(sender, **kwargs):
+    invalidate_search_cache(POSTS)
+
+
+@receiver(post_save, sender=Profile)
+def invalidate_profile_search_on_save(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not set(update_fields) & set(INDEXED_FIELDS):
+        return
+    invalidate_search_cache(PROFILES)
+
+
+@receiver(post_delete, sender=Profile)
+def invalidate_profile_search(sender, **kwargs):
+    invalidate_search_cache(PROFILES)
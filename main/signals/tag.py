@@ -0,0 +1,20 @@
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from main.models.post import Post
+from main.models.tag import Tag, PostTag
+
+
+@receiver(post_delete, sender=PostTag)
+def decrease_tag_post_count(sender, instance, **kwargs):
+    """ ✅ 공개 게시물의 태그를 떼거나 게시물이 삭제되면(CASCADE 포함) 태그의 게시물 수 감소 """
+    if instance.is_public:
+        Tag.objects.filter(id=instance.tag_id, post_count__gt=0).update(post_count=F('post_count') - 1)
+
+
+@receiver(post_save, sender=Post)
+def sync_tag_visibility(sender, instance, created, update_fields=None, **kwargs):
+    """ ✅ 작성 완료 / 공개 범위가 바뀌면 태그의 공개 게시물 수 조정 (새 게시물은 태그가 아직 없음) """
+    if created or (update_fields is not None and not {'is_complete', 'visibility'}.intersection(update_fields)):
+        return
+    PostTag.sync_visibility(instance)
@@ -0,0 +1,16 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from main.models.post import Post
+from main.models.topicFeed import TopicFeedEntry
+
+
+# ✅ 주제 피드 포함 여부/위치에 영향을 주는 게시물 필드
+TOPIC_FEED_FIELDS = {'author', 'subject', 'keyword', 'visibility', 'is_complete', 'created_at'}
+
+
+@receiver(post_save, sender=Post)
+def refresh_topic_feed_on_post_save(sender, instance, update_fields=None, **kwargs):
+    """ ✅ 게시물 발행/수정 시 해당 글의 주제 피드 항목만 갱신 (삭제는 FK CASCADE로 함께 지워짐) """
+    if update_fields is not None and not TOPIC_FEED_FIELDS.intersection(update_fields):
+        return
+    TopicFeedEntry.refresh_post(instance)
@@ -0,0 +1,26 @@
+"""
+테스트용 사용자 / 게시물 / 서로이웃 생성 도우미
+"""
+from main.models import CustomUser, Neighbor, Post, PostText
+
+PASSWORD = 'pw12345!!'
+
+
+def make_user(user_id):
+    """ ✅ 사용자 생성 (Profile은 post_save 시그널로 자동 생성) """
+    return CustomUser.objects.create_user(id=user_id, password=PASSWORD)
+
+
+def make_post(author, title="제목", texts=("본문",), **fields):
+    """ ✅ 작성 완료된 게시물 + 본문 블록 생성 (body 문서까지 채움) """
+    fields.setdefault('is_complete', True)
+    post = Post.objects.create(author=author, title=title, **fields)
+    blocks = [PostText.objects.create(post=post, content=content) for content in texts]
+    post.sync_body(blocks)
+    return post
+
+
+def make_neighbors(user, other):
+    """ ✅ user → other 신청 후 other가 수락 (양방향 accepted 2행) """
+    Neighbor.objects.create(from_user=user, to_user=other, request_message="")
+    Neighbor.accept(other, user)
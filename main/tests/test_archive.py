@@ -0,0 +1,35 @@
+from datetime import datetime, timezone as dt_timezone
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+from main.models import Post
+from main.tests.factories import make_post, make_user
+
+
+class PostArchiveTests(TestCase):
+    """ ✅ 월별 아카이브는 현재 시간대(Asia/Seoul) 기준 월로 세고, 조회자가 볼 수 없는 글은 제외 """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = make_user('owner')
+
+    def post_at(self, created_at, **fields):
+        post = make_post(self.owner, **fields)
+        Post.objects.filter(id=post.id).update(created_at=created_at)
+
+    def test_counts_by_local_month(self):
+        self.post_at(datetime(2026, 1, 10, 3, tzinfo=dt_timezone.utc), visibility='everyone')
+        # ✅ UTC로는 1월 31일이지만 서울 시각으로는 2월 1일
+        self.post_at(datetime(2026, 1, 31, 16, tzinfo=dt_timezone.utc), visibility='everyone')
+        self.post_at(datetime(2026, 2, 3, tzinfo=dt_timezone.utc), visibility='everyone')
+        self.post_at(datetime(2025, 12, 24, tzinfo=dt_timezone.utc), visibility='everyone')
+        self.post_at(datetime(2026, 2, 5, tzinfo=dt_timezone.utc), visibility='mutual')
+        self.post_at(datetime(2026, 2, 6, tzinfo=dt_timezone.utc), visibility='everyone', is_complete=False)
+
+        response = APIClient().get('/posts/archive/owner/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['archive'], [
+            {"year": 2026, "month": 2, "post_count": 2},
+            {"year": 2026, "month": 1, "post_count": 1},
+            {"year": 2025, "month": 12, "post_count": 1},
+        ])
@@ -0,0 +1,39 @@
+from django.core.cache import cache
+from django.test import TestCase
+from main.models import Profile
+from main.search import autocomplete as autocomplete_module
+from main.search.autocomplete import GENERATION_NAME, autocomplete, get_index, patch_profile
+from main.tests.factories import make_user
+from main.utils.cache import bump_generation
+
+
+class AutocompleteGenerationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        autocomplete_module._index = None
+        self.alice = make_user('alice').profile
+        self.bob = make_user('bob').profile
+
+    def names(self, query):
+        return [row['urlname'] for row, _ in autocomplete(query)]
+
+    def test_own_change_keeps_index_in_sync(self):
+        get_index()
+        Profile.objects.filter(id=self.alice.id).update(blog_name="제주 일기")
+        patch_profile(self.alice.id)
+
+        self.assertEqual(autocomplete_module._index_generation, cache.get(f"generation:{GENERATION_NAME}"))
+        self.assertEqual(self.names("제주"), ['alice'])
+
+    def test_change_from_another_process_is_not_absorbed(self):
+        get_index()
+        # ✅ 다른 프로세스: bob의 블로그 이름을 바꾸고 세대 번호만 올림 (이 프로세스 색인에는 반영 안 됨)
+        Profile.objects.filter(id=self.bob.id).update(blog_name="부산 일기")
+        bump_generation(GENERATION_NAME)
+
+        Profile.objects.filter(id=self.alice.id).update(blog_name="제주 일기")
+        patch_profile(self.alice.id)
+
+        self.assertIsNone(autocomplete_module._index_generation)
+        self.assertEqual(self.names("부산"), ['bob'])
+        self.assertEqual(self.names("제주"), ['alice'])
@@ -0,0 +1,42 @@
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+from main.tests.factories import make_user, make_post, make_neighbors
+
+
+class BlogHomeQueryCountTests(TestCase):
+    """ ✅ 블로그 홈 묶음 API의 쿼리 수 (캐시 미적중 / 적중) """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = make_user('owner')
+        self.neighbor = make_user('neighbor')
+        self.other = make_user('other')
+        make_neighbors(self.neighbor, self.owner)
+        make_neighbors(self.other, self.owner)
+        for i in range(7):
+            make_post(self.owner, f"글 {i}", visibility='mutual' if i % 2 else 'everyone')
+        self.client = APIClient()
+        self.client.force_authenticate(self.neighbor)
+        self.url = '/blog/owner/home/?include_neighbors=true'
+
+    def test_cold_and_warm_cache(self):
+        # ✅ 미적중: 프로필 + 서로이웃 여부 + 글 개수 + 서로이웃 수 + 최근 글(게시물/이미지/태그) + 서로이웃 목록
+        with self.assertNumQueries(8):
+            cold = self.client.get(self.url)
+        self.assertEqual(cold.status_code, 200)
+        self.assertEqual(cold.data['post_count'], 7)
+        self.assertEqual(cold.data['neighbor_count'], 2)
+        self.assertEqual(len(cold.data['recent_posts']), 5)
+
+        # ✅ 적중: 프로필 + 서로이웃 여부만
+        with self.assertNumQueries(2):
+            warm = self.client.get(self.url)
+        self.assertEqual(warm.data, cold.data)
+
+    def test_anonymous_warm_cache_reads_profile_only(self):
+        client = APIClient()
+        client.get(self.url)
+        with self.assertNumQueries(1):
+            response = client.get(self.url)
+        self.assertEqual(response.data['post_count'], 4)
@@ -0,0 +1,57 @@
+from django.test import TestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from main.models import Comment, Heart, Neighbor, Post
+from main.serializers import PostSerializer, CommentSerializer, NeighborSerializer
+from main.serializers.fast import serialize_posts, serialize_comments, serialize_neighbors
+from main.tests.factories import make_user, make_post, make_neighbors
+
+
+class FastSerializerParityTests(TestCase):
+    """ ✅ main.serializers.fast 출력이 기존 DRF 시리얼라이저와 같은지 (같은 데이터로 비교) """
+
+    def setUp(self):
+        self.author = make_user('author')
+        self.viewer = make_user('viewer')
+        self.stranger = make_user('stranger')
+        make_neighbors(self.viewer, self.author)
+        Neighbor.objects.create(from_user=self.stranger, to_user=self.author, request_message="안녕하세요")
+
+        self.post = make_post(self.author, "첫 글", texts=("첫 문단", "둘째 문단"), category="여행", subject="국내여행")
+        make_post(self.author, "이웃 공개", visibility='mutual')
+        make_post(self.viewer, "임시 저장", is_complete=False)
+        Heart.objects.create(post=self.post, user=self.viewer)
+
+        author_profile, viewer_profile = self.author.profile, self.viewer.profile
+        parent = Comment.objects.create(post=self.post, author=viewer_profile, author_name="viewer", content="댓글")
+        Comment.objects.create(post=self.post, author=author_profile, author_name="author", content="답글",
+                               parent=parent, is_parent=False)
+        Comment.objects.create(post=self.post, author=viewer_profile, author_name="viewer", content="비밀",
+                               is_private=True)
+
+    def context(self, user):
+        request = Request(APIRequestFactory().get('/'))
+        request.user = user
+        return {'request': request}
+
+    def test_posts_match_post_serializer(self):
+        for user in (self.author, self.viewer):
+            context = self.context(user)
+            posts = Post.objects.order_by('id')
+            self.assertEqual(
+                serialize_posts(posts, context['request']),
+                [dict(item) for item in PostSerializer(posts, many=True, context=context).data],
+            )
+
+    def test_comments_match_comment_serializer(self):
+        comments = Comment.objects.filter(post=self.post, parent__isnull=True).order_by('id')
+        for user in (self.author, self.viewer, self.stranger):
+            expected = CommentSerializer(comments, many=True, context=self.context(user)).data
+            self.assertEqual(serialize_comments(comments, user), [dict(item) for item in expected])
+
+    def test_neighbors_match_neighbor_serializer(self):
+        neighbors = Neighbor.objects.order_by('id')
+        self.assertEqual(
+            serialize_neighbors(neighbors),
+            [dict(item) for item in NeighborSerializer(neighbors, many=True).data],
+        )
@@ -0,0 +1,39 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+from main.models import Neighbor
+from main.tests.factories import make_user
+
+
+class NeighborAcceptTests(TestCase):
+    """ ✅ 서로이웃 수락은 받은 신청(상대 → 나)만 가능, 수락하면 양방향 accepted 2행 """
+
+    def setUp(self):
+        self.sender = make_user('sender')
+        self.receiver = make_user('receiver')
+        Neighbor.objects.create(from_user=self.sender, to_user=self.receiver, request_message="")
+
+    def accept(self, user, from_urlname):
+        client = APIClient()
+        client.force_authenticate(user)
+        return client.put(f'/neighbors/accept/{from_urlname}/')
+
+    def edges(self):
+        return set(Neighbor.objects.values_list('from_user_id', 'to_user_id', 'status'))
+
+    def test_sender_cannot_accept_own_request(self):
+        self.assertEqual(self.accept(self.sender, 'receiver').status_code, 404)
+        with self.assertRaises(Neighbor.DoesNotExist):
+            Neighbor.accept(self.sender, self.receiver)
+        self.assertEqual(self.edges(), {('sender', 'receiver', 'pending')})
+
+    def test_receiver_accepts_once(self):
+        self.assertEqual(self.accept(self.receiver, 'sender').status_code, 200)
+        self.assertEqual(self.edges(), {('sender', 'receiver', 'accepted'), ('receiver', 'sender', 'accepted')})
+        self.assertEqual(self.accept(self.receiver, 'sender').status_code, 400)
+        self.assertFalse(Neighbor.accept(self.sender, self.receiver))
+
+    def test_remove_deletes_both_directions(self):
+        Neighbor.accept(self.receiver, self.sender)
+        self.assertTrue(Neighbor.remove(self.sender, self.receiver))
+        self.assertEqual(self.edges(), set())
+        self.assertFalse(Neighbor.remove(self.sender, self.receiver))
@@ -0,0 +1,59 @@
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+from main.models import Heart, Neighbor
+from main.tests.factories import make_neighbors, make_post, make_user
+
+
+class CursorPaginationTests(TestCase):
+    """ ✅ 서로이웃 / 받은 신청 / 좋아요 유저 목록은 시각이 같아도 ID로 이어서 빠짐없이, 중복 없이 페이지를 나눔 """
+
+    def setUp(self):
+        self.owner = make_user('owner')
+        self.others = [make_user(f'user{i}') for i in range(5)]
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def collect(self, path, key, field='urlname'):
+        """ limit=2로 마지막 페이지까지 따라가며 항목 목록 수집 """
+        items, cursor = [], None
+        while True:
+            params = {'limit': 2, **({'cursor': cursor} if cursor else {})}
+            response = self.client.get(path, params)
+            self.assertEqual(response.status_code, 200, response.content)
+            data = response.json()
+            self.assertLessEqual(len(data[key]), 2)
+            items += [row[field] for row in data[key]]
+            cursor = data['next_cursor']
+            if cursor is None:
+                return items
+
+    def test_neighbor_lists(self):
+        for other in self.others:
+            make_neighbors(other, self.owner)
+        Neighbor.objects.update(accepted_at=timezone.now())  # ✅ 같은 시각 → ID 순서로만 구분
+
+        expected = [other.id for other in reversed(self.others)]
+        self.assertEqual(self.collect('/profile/me/neighbors/', 'neighbors'), expected)
+        self.assertEqual(self.collect('/profile/owner/neighbors/', 'neighbors'), expected)
+
+    def test_received_requests(self):
+        for other in self.others:
+            Neighbor.objects.create(from_user=other, to_user=self.owner, request_message="")
+        Neighbor.objects.update(created_at=timezone.now())
+
+        self.assertEqual(
+            self.collect('/neighbors/requests/me', 'requests', 'from_urlname'),
+            [other.id for other in reversed(self.others)],
+        )
+
+    def test_heart_users(self):
+        post = make_post(self.owner, visibility='everyone')
+        for other in self.others:
+            Heart.objects.create(post=post, user=other)
+        Heart.objects.update(created_at=timezone.now())
+
+        self.assertEqual(
+            self.collect(f'/posts/{post.id}/heart/users/', 'liked_users'),
+            [other.id for other in reversed(self.others)],
+        )
@@ -0,0 +1,51 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+from main.models import ReadReceipt
+from main.utils.bitmap import CHUNK_SIZE
+from main.tests.factories import make_user, make_post
+
+
+class ReadReceiptTests(TestCase):
+    def setUp(self):
+        self.reader = make_user('reader')
+        self.author = make_user('author')
+
+    def test_mark_read_counts_only_new_posts(self):
+        self.assertEqual(ReadReceipt.mark_read(self.reader, [1, 2, 3]), 3)
+        self.assertEqual(ReadReceipt.mark_read(self.reader, [2, 3, 4]), 1)
+        self.assertEqual(ReadReceipt.mark_read(self.reader, []), 0)
+
+        bitmap = ReadReceipt.load(self.reader, [1, 2, 3, 4, 5])
+        self.assertEqual([post_id for post_id in range(1, 6) if post_id in bitmap], [1, 2, 3, 4])
+
+    def test_mark_read_updates_existing_chunk_row(self):
+        ReadReceipt.mark_read(self.reader, [1])
+        ReadReceipt.mark_read(self.reader, [2, CHUNK_SIZE + 1])
+
+        self.assertEqual(ReadReceipt.objects.filter(user=self.reader).count(), 2)
+        bitmap = ReadReceipt.load(self.reader, [1, 2, CHUNK_SIZE + 1])
+        self.assertTrue(all(post_id in bitmap for post_id in [1, 2, CHUNK_SIZE + 1]))
+
+    def test_post_detail_marks_post_read(self):
+        post = make_post(self.author)
+        client = APIClient()
+        client.force_authenticate(self.reader)
+
+        response = client.get(f'/posts/{post.id}/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(post.id, ReadReceipt.load(self.reader, [post.id]))
+
+    def test_read_endpoint_validates_post_ids(self):
+        client = APIClient()
+        client.force_authenticate(self.reader)
+
+        response = client.post('/posts/read/', {'post_ids': [1, 2, 2]}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['marked'], 2)
+
+        for post_ids in ("1", [1, "x"], [0], [-1], [2 ** 31], [10 ** 30], list(range(1, 502))):
+            with self.subTest(post_ids=str(post_ids)[:20]):
+                response = client.post('/posts/read/', {'post_ids': post_ids}, format='json')
+                self.assertEqual(response.status_code, 400)
+        self.assertEqual(ReadReceipt.objects.filter(user=self.reader).count(), 1)
@@ -0,0 +1,117 @@
+from datetime import timedelta
+from unittest import mock
+from django.db.models import Count, Q
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from main.models import Post, PostImage, PostText, SearchPosting, SearchToken
+from main.search.facets import apply_facets, parse_facet_filters
+from main.search.index import index_posts
+from main.search.query import document_frequencies, match_posts
+from main.search.ranking import score_posts, top_page
+from main.search.tokens import query_tokens, tokenize
+from main.tests.factories import make_post, make_user
+
+
+class TokenizeTests(TestCase):
+    def test_bigrams_cross_word_boundaries(self):
+        self.assertEqual(tokenize("제주 여행!"), [" 제", "제주", "주 ", " 여", "여행", "행 "])
+        self.assertEqual(tokenize("a"), [" a", "a "])
+        self.assertEqual(query_tokens("주 여"), ["주 ", " 여"])
+        self.assertEqual(query_tokens("a"), [])
+
+
+class MatchPostsTests(TestCase):
+    def setUp(self):
+        self.author = make_user('author')
+        self.jeju = make_post(self.author, title="제주 여행", texts=("본문",))
+        self.busan = make_post(self.author, title="부산 여행", texts=("본문",))
+
+    def match(self, query):
+        return match_posts(query, Q(post__author=self.author))
+
+    def test_query_spanning_a_space(self):
+        self.assertEqual(self.match('"주 여"'), {self.jeju.id})
+
+    def test_single_character_term_falls_back_to_scan(self):
+        self.assertEqual(self.match("제 여행"), {self.jeju.id})
+        self.assertEqual(self.match("여행 -부"), {self.jeju.id})
+
+    def test_accent_variants_are_separate_tokens(self):
+        """ MySQL에서는 token 열이 utf8mb4_bin이어야 "fe"/"fé"가 unique_together에서 충돌하지 않음 """
+        post = make_post(self.author, title="cafe café")
+        tokens = set(SearchPosting.objects.filter(post=post, field=SearchPosting.FIELD_TITLE).values_list('token', flat=True))
+        self.assertTrue({"fe", "fé"} <= tokens)
+        self.assertEqual(self.match("café"), {post.id})
+
+
+class DocumentFrequencyTests(TestCase):
+    """ ✅ SearchToken.documents는 색인을 고칠 때마다 토큰이 있는 게시물 수와 같아야 함 """
+
+    def assertDocumentsMatchIndex(self):
+        expected = dict(
+            SearchPosting.objects.values('token').annotate(documents=Count('post_id', distinct=True))
+            .values_list('token', 'documents')
+        )
+        actual = dict(SearchToken.objects.exclude(documents=0).values_list('token', 'documents'))
+        self.assertEqual(actual, expected)
+
+    def test_counts_follow_index_changes(self):
+        author = make_user('author')
+        first = make_post(author, title="제주 여행", texts=("제주 맛집",))
+        second = make_post(author, title="부산 여행", texts=())
+        self.assertDocumentsMatchIndex()
+        self.assertEqual(document_frequencies(["여행", "제주", "맛집", "없는말"]),
+                         {"여행": 2, "제주": 1, "맛집": 1, "없는말": 0})
+
+        PostText.objects.create(post=second, content="제주 맛집")
+        text = first.texts.get()
+        text.content = "서울"
+        text.save()
+        PostImage.objects.create(post=second, image="a.jpg", caption="바다")
+        self.assertDocumentsMatchIndex()
+
+        first.title = "서울 산책"
+        first.save()
+        index_posts([first.id, second.id])
+        self.assertDocumentsMatchIndex()
+
+        second.delete()
+        self.assertDocumentsMatchIndex()
+        self.assertEqual(document_frequencies(["제주"]), {"제주": 0})
+
+
+class ScorePostsTests(TestCase):
+    def test_scores_do_not_depend_on_current_time(self):
+        author = make_user('author')
+        older = make_post(author, title="제주 여행")
+        newer = make_post(author, title="제주 맛집")
+        Post.objects.filter(id=older.id).update(created_at=timezone.now() - timedelta(days=365))
+        ranking = score_posts([older.id, newer.id], ["제주"])
+        self.assertGreater(dict((pk, score) for score, pk in ranking)[newer.id],
+                           dict((pk, score) for score, pk in ranking)[older.id])
+
+        # ✅ 시간이 지나도 같은 점수 → 이전 페이지에서 받은 (점수, ID) 커서가 그대로 유효
+        with mock.patch('django.utils.timezone.now', return_value=timezone.now() + timedelta(days=90)):
+            self.assertEqual(sorted(score_posts([older.id, newer.id], ["제주"])), sorted(ranking))
+        self.assertEqual(top_page(ranking, 1, after=max(ranking)), [min(ranking)])
+
+
+class FacetTests(TestCase):
+    def setUp(self):
+        author = make_user('author')
+        self.movie = make_post(author, title="여행 영화", subject="영화")
+        self.book = make_post(author, title="여행 책", subject="문학·책")
+        self.ids = {self.movie.id, self.book.id}
+        self.month = timezone.localtime(self.movie.created_at).strftime("%Y-%m")
+
+    def test_each_facet_ignores_its_own_filter(self):
+        matched, facets = apply_facets(self.ids, {"subject": "영화"})
+        self.assertEqual(matched, {self.movie.id})
+        self.assertEqual({row["value"]: row["count"] for row in facets["subject"]}, {"영화": 1, "문학·책": 1})
+        self.assertEqual(facets["month"], [{"value": self.month, "count": 1}])
+
+    def test_out_of_range_years_are_rejected(self):
+        for params in ({"date_to": "9999-12-31"}, {"month": "9999-12"}, {"date_from": "0001-01-01"}):
+            with self.subTest(params=params), self.assertRaises(ValidationError):
+                parse_facet_filters(params)
@@ -0,0 +1,69 @@
+import json
+from django.test import TestCase
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APIClient
+from main.models import Post, PostTag, Tag
+from main.models.tag import parse_tags
+from main.tests.factories import make_user
+
+
+class ParseTagsTests(TestCase):
+    def test_accepts_json_list_string_and_plain_text(self):
+        self.assertEqual(parse_tags('["#여행", "제주", "여행"]'), ['여행', '제주'])
+        self.assertEqual(parse_tags('"제주"'), ['제주'])
+        self.assertEqual(parse_tags('#여행 #제주,맛집'), ['여행', '제주', '맛집'])
+        self.assertEqual(parse_tags(None), [])
+
+    def test_rejects_other_json_values(self):
+        for value in ('2024', 'true', 'null', '{"a": 1}', '[1, 2]', '[["여행"]]'):
+            with self.subTest(value=value), self.assertRaises(ValidationError):
+                parse_tags(value)
+
+
+class TagPostCountTests(TestCase):
+    """ ✅ Tag.post_count는 작성 완료 + 전체 공개 게시물만 셈 """
+
+    def setUp(self):
+        self.author = make_user('author')
+        self.client = APIClient()
+        self.client.force_authenticate(self.author)
+
+    def create_post(self, **data):
+        data = {'title': '제목', 'texts': json.dumps(['본문']), 'tags': json.dumps(['여행']), **data}
+        response = self.client.post('/posts/me/create/', data, format='multipart')
+        self.assertEqual(response.status_code, 201, response.content)
+        return Post.objects.get(id=response.json()['post']['id'])
+
+    def popular(self):
+        return {row['name']: row['post_count'] for row in self.client.get('/tags/popular/').json()}
+
+    def test_invalid_tags_return_400(self):
+        response = self.client.post('/posts/me/create/', {'title': '제목', 'tags': '2024'}, format='multipart')
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Post.objects.exists())
+
+    def test_drafts_and_non_public_posts_are_not_counted(self):
+        self.create_post(is_complete='false')
+        self.create_post(is_complete='true', visibility='mutual')
+        self.assertEqual(self.popular(), {})
+
+        public = self.create_post(is_complete='true')
+        self.assertEqual(self.popular(), {'여행': 1})
+
+        public.visibility = 'me'
+        public.save()
+        self.assertEqual(Tag.objects.get(name='여행').post_count, 0)
+
+        public.visibility = 'everyone'
+        public.save()
+        self.assertEqual(Tag.objects.get(name='여행').post_count, 1)
+
+        public.delete()
+        self.assertEqual(Tag.objects.get(name='여행').post_count, 0)
+        self.assertEqual(PostTag.objects.count(), 2)
+
+    def test_publishing_draft_counts_tag(self):
+        draft = self.create_post(is_complete='false')
+        draft.is_complete = True
+        draft.save(update_fields=['is_complete'])
+        self.assertEqual(self.popular(), {'여행': 1})
@@ -0,0 +1,90 @@
+"""
+게시물 ID 집합을 압축해서 저장하기 위한 roaring 방식 비트맵
+
+- 게시물 ID의 상위 비트(ID // CHUNK_SIZE)를 청크 번호로, 하위 16비트를 청크 안의 위치로 사용
+- 청크 안에 표시된 ID가 적으면 정렬된 uint16 배열로, 많으면 8KB 비트맵으로 저장
+- 메모리에서는 청크마다 파이썬 int 하나를 비트셋으로 사용 (교집합/개수 계산이 빠름)
+"""
+from array import array
+
+CHUNK_SIZE = 1 << 16  # ✅ 한 청크가 담당하는 게시물 ID 개수
+ARRAY_LIMIT = 4096  # ✅ 이 개수를 넘으면 배열보다 비트맵이 작아짐 (4096 * 2바이트 = 8KB)
+
+ARRAY_CONTAINER = b'A'
+BITMAP_CONTAINER = b'B'
+
+
+def split_id(post_id):
+    """ 게시물 ID → (청크 번호, 청크 안의 위치) """
+    return divmod(post_id, CHUNK_SIZE)
+
+
+def decode_chunk(data):
+    """ 저장된 청크 바이트를 비트셋(int)으로 변환 """
+    if not data:
+        return 0
+    data = bytes(data)
+    kind, payload = data[:1], data[1:]
+
+    if kind == BITMAP_CONTAINER:
+        return int.from_bytes(payload, 'little')
+
+    offsets = array('H')
+    offsets.frombytes(payload)
+    bits = 0
+    for offset in offsets:
+        bits |= 1 << offset
+    return bits
+
+
+def encode_chunk(bits):
+    """ 비트셋(int)을 저장용 바이트로 변환 (표시된 ID 수에 따라 배열/비트맵 중 작은 쪽 선택) """
+    if bits.bit_count() > ARRAY_LIMIT:
+        return BITMAP_CONTAINER + bits.to_bytes(CHUNK_SIZE // 8, 'little')
+
+    offsets = array('H')
+    while bits:
+        low = bits & -bits
+        offsets.append(low.bit_length() - 1)
+        bits ^= low
+    return ARRAY_CONTAINER + offsets.tobytes()
+
+
+def chunk_masks(post_ids):
+    """ 게시물 ID 목록 → {청크 번호: 해당 ID들의 비트셋} """
+    masks = {}
+    for post_id in post_ids:
+        chunk, offset = split_id(post_id)
+        masks[chunk] = masks.get(chunk, 0) | (1 << offset)
+    return masks
+
+
+class PostIdBitmap:
+    """
+    청크별 비트셋을 메모리에 들고 있는 게시물 ID 집합
+    (읽음 처리, 안 읽은 개수 계산을 DB 조회 없이 수행)
+    """
+
+    def __init__(self, chunks=None):
+        self.chunks = dict(chunks or {})
+
+    def __contains__(self, post_id):
+        chunk, offset = split_id(post_id)
+        return bool(self.chunks.get(chunk, 0) >> offset & 1)
+
+    def add_many(self, post_ids):
+        """ ID들을 추가하고, 실제로 값이 바뀐 청크 번호 목록을 반환 """
+        changed = []
+        for chunk, mask in chunk_masks(post_ids).items():
+            old = self.chunks.get(chunk, 0)
+            if old | mask != old:
+                self.chunks[chunk] = old | mask
+                changed.append(chunk)
+        return changed
+
+    def count_missing(self, post_ids):
+        """ 주어진 ID 중 집합에 없는(안 읽은) ID 개수 """
+        missing = 0
+        for chunk, mask in chunk_masks(post_ids).items():
+            missing += (mask & ~self.chunks.get(chunk, 0)).bit_count()
+        return missing
@@ -0,0 +1,54 @@
+import time
+from django.core.cache import cache
+
+
+BLOG_CACHE_TIMEOUT = 60 * 10  # ✅ 블로그 단위 캐시 유지 시간 (10분)
+
+
+def get_generation(name):
+    """
+    이름별 세대(generation) 번호 반환 (캐시 무효화용 카운터)
+    키가 없으면 현재 시각으로 새로 만들어서, 이전에 저장된 값과 절대 겹치지 않게 한다.
+    """
+    key = f"generation:{name}"
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, time.time_ns(), None)
+        generation = cache.get(key)
+    return generation
+
+
+def bump_generation(name):
+    """ ✅ 세대 번호를 올려서 이전 세대로 저장된 캐시를 한 번에 무효화 (올린 뒤의 세대 번호 반환) """
+    key = f"generation:{name}"
+    try:
+        return cache.incr(key)
+    except ValueError:
+        generation = time.time_ns()
+        cache.set(key, generation, None)
+        return generation
+
+
+def get_blog_cache_version(owner_id):
+    """ 블로그 주인별 캐시 버전 반환 """
+    return get_generation(f"blog:{owner_id}")
+
+
+def invalidate_blog_cache(owner_id):
+    """
+    ✅ 블로그 주인의 모든 캐시(카테고리, 아카이브 등)를 한 번에 무효화
+    버전을 올리기만 하므로 등급별 키를 하나씩 지울 필요가 없다.
+    """
+    bump_generation(f"blog:{owner_id}")
+
+
+def get_or_set_blog_cache(owner_id, section, tier, compute, timeout=BLOG_CACHE_TIMEOUT):
+    """
+    (블로그 주인, 구역, 조회자 등급) 단위로 캐시된 값을 반환하고, 없으면 compute()로 계산해서 저장
+    """
+    return cache.get_or_set(
+        f"blog:{owner_id}:{section}:{tier}",
+        compute,
+        timeout,
+        version=get_blog_cache_version(owner_id),
+    )
@@ -0,0 +1,22 @@
+import unicodedata
+
+# ✅ 한글 음절(가~힣)의 초성 19개 (유니코드 순서)
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_SYLLABLE_FIRST, _SYLLABLE_LAST = ord('가'), ord('힣')
+_SYLLABLES_PER_CHOSUNG = 21 * 28  # 중성 21개 × 종성 28개
+
+
+def chosung_key(text):
+    """
+    ✅ 문자열 → 초성 검색 키
+    한글 음절은 초성으로 바꾸고, 나머지 글자(초성 자모, 영문, 숫자 등)는 소문자로 그대로 두며 공백은 제거
+    (예: "홍 길동" → "ㅎㄱㄷ", "Blog홍" → "blogㅎ")
+    """
+    key = []
+    for char in unicodedata.normalize('NFC', text or '').lower():
+        code = ord(char)
+        if _SYLLABLE_FIRST <= code <= _SYLLABLE_LAST:
+            key.append(CHOSUNG[(code - _SYLLABLE_FIRST) // _SYLLABLES_PER_CHOSUNG])
+        elif not char.isspace():
+            key.append(char)
+    return "".join(key)
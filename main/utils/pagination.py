@@ -0,0 +1,68 @@
+import base64
+from datetime import datetime
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+
+
+def parse_limit(value, default=20, maximum=100):
+    """ ✅ limit 쿼리 파라미터 검증 (1 ~ maximum) """
+    if value in (None, ''):
+        return default
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise ValidationError("limit은 정수여야 합니다.")
+    if not 1 <= limit <= maximum:
+        raise ValidationError(f"limit은 1~{maximum} 사이여야 합니다.")
+    return limit
+
+
+def encode_cursor(created_at, pk):
+    """ ✅ (작성일, ID) → 다음 페이지 커서 문자열 """
+    raw = f"{created_at.isoformat()}|{pk}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """ ✅ 커서 문자열 → (작성일, ID), 형식이 잘못되면 ValidationError """
+    try:
+        created_at, pk = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+        return datetime.fromisoformat(created_at), int(pk)
+    except (ValueError, UnicodeError):
+        raise ValidationError("cursor 값이 올바르지 않습니다.")
+
+
+def cursor_filter(cursor, created_field='created_at', pk_field='id'):
+    """
+    ✅ (작성일 내림차순, ID 내림차순) 정렬에서 커서 다음 항목만 고르는 조건
+    커서가 없으면 빈 조건(Q())을 반환
+    """
+    if not cursor:
+        return Q()
+    created_at, pk = decode_cursor(cursor)
+    return Q(**{f"{created_field}__lt": created_at}) | Q(**{created_field: created_at, f"{pk_field}__lt": pk})
+
+
+def cursor_page(rows, cursor, limit, created_field='created_at'):
+    """
+    ✅ values() 쿼리셋을 (created_field, id) 내림차순으로 한 페이지 조회 → (행 목록, 다음 커서)
+    limit + 1개를 읽어서 다음 페이지가 있는지 판단 (COUNT 쿼리 없음), 행에는 created_field와 id가 있어야 함
+    """
+    rows = list(rows.filter(cursor_filter(cursor, created_field)).order_by(f'-{created_field}', '-id')[:limit + 1])
+    next_cursor = encode_cursor(rows[limit - 1][created_field], rows[limit - 1]['id']) if len(rows) > limit else None
+    return rows[:limit], next_cursor
+
+
+def encode_score_cursor(score, pk):
+    """ ✅ (점수, ID) → 다음 페이지 커서 문자열 (점수 순 정렬 목록용) """
+    raw = f"{score!r}|{pk}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_score_cursor(cursor):
+    """ ✅ 커서 문자열 → (점수, ID), 형식이 잘못되면 ValidationError """
+    try:
+        score, pk = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+        return float(score), int(pk)
+    except (ValueError, UnicodeError):
+        raise ValidationError("cursor 값이 올바르지 않습니다.")
@@ -0,0 +1,95 @@
+"""
+게시물 본문 유사도 계산 (관련 글, 블로그 추천 배치 작업용)
+
+- 한국어는 띄어쓰기/조사 때문에 단어 단위 토큰화가 불안정하므로 문자 n-gram을 토큰으로 사용
+- 문서-토큰 행렬을 scipy 희소 행렬(CSR)로 만들고, 행렬 곱으로 코사인 유사도를 배치 단위 계산
+"""
+import re
+import numpy as np
+from scipy import sparse
+
+NGRAM_RANGE = (2, 3)
+_whitespace = re.compile(r"\s+")
+
+
+def char_ngrams(text, ngram_range=NGRAM_RANGE):
+    """ 공백을 하나로 정리한 뒤 문자 n-gram 목록 반환 (단어 경계를 넘는 n-gram도 포함) """
+    text = _whitespace.sub(" ", text.lower()).strip()
+    low, high = ngram_range
+    return [text[i:i + n] for n in range(low, high + 1) for i in range(len(text) - n + 1)]
+
+
+def tfidf_matrix(documents, ngram_range=NGRAM_RANGE, min_df=1):
+    """
+    문서 목록 → 행마다 L2 정규화된 TF-IDF 희소 행렬 (문서 수 x 어휘 수)
+    idf는 smooth idf (log((1 + N) / (1 + df)) + 1), tf는 1 + log(count)
+    """
+    vocabulary = {}
+    rows, cols, counts = [], [], []
+    for row, document in enumerate(documents):
+        grams = {}
+        for gram in char_ngrams(document, ngram_range):
+            grams[gram] = grams.get(gram, 0) + 1
+        for gram, count in grams.items():
+            rows.append(row)
+            cols.append(vocabulary.setdefault(gram, len(vocabulary)))
+            counts.append(count)
+
+    matrix = sparse.csr_matrix(
+        (np.asarray(counts, dtype=np.float32), (rows, cols)),
+        shape=(len(documents), len(vocabulary)),
+    )
+    if min_df > 1:
+        df = np.bincount(matrix.indices, minlength=matrix.shape[1])
+        matrix = matrix[:, np.flatnonzero(df >= min_df)]
+
+    df = np.bincount(matrix.indices, minlength=matrix.shape[1])
+    idf = np.log((1 + matrix.shape[0]) / (1 + df)) + 1
+    matrix.data = (1 + np.log(matrix.data)) * idf[matrix.indices]
+    return normalize_rows(matrix)
+
+
+def normalize_rows(matrix):
+    """ CSR 행렬의 각 행을 L2 norm 1로 정규화 (빈 행은 그대로) """
+    matrix = sparse.csr_matrix(matrix, dtype=np.float32)
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return sparse.diags(1 / norms).astype(np.float32) @ matrix
+
+
+def top_k_rows(scores, k, exclude=None):
+    """
+    희소 점수 행렬의 행마다 점수 상위 k개 (열 번호, 점수) 목록 반환
+    exclude[i]가 주어지면 i번째 행에서 해당 열(자기 자신 등)은 제외
+    """
+    scores = sparse.csr_matrix(scores)
+    results = []
+    for i in range(scores.shape[0]):
+        start, end = scores.indptr[i], scores.indptr[i + 1]
+        cols, values = scores.indices[start:end], scores.data[start:end]
+        keep = values > 0
+        if exclude is not None:
+            keep &= cols != exclude[i]
+        cols, values = cols[keep], values[keep]
+
+        if len(values) > k:
+            top = np.argpartition(-values, k)[:k]
+            cols, values = cols[top], values[top]
+        order = np.argsort(-values, kind='stable')
+        results.append([(int(cols[j]), float(values[j])) for j in order])
+    return results
+
+
+def cosine_top_k(matrix, k, batch_size=256):
+    """
+    정규화된 행렬의 행끼리 코사인 유사도 상위 k개를 batch_size 행씩 계산해서 (행 번호, 결과 목록)으로 반환
+    한 번에 (batch_size x 문서 수) 크기의 희소 행렬만 메모리에 둠
+    """
+    matrix = sparse.csr_matrix(matrix)
+    transposed = matrix.T.tocsr()
+    for start in range(0, matrix.shape[0], batch_size):
+        end = min(start + batch_size, matrix.shape[0])
+        batch_scores = matrix[start:end] @ transposed
+        for offset, neighbors in enumerate(top_k_rows(batch_scores, k, exclude=np.arange(start, end))):
+            yield start + offset, neighbors
+
@@ -0,0 +1,84 @@
+from django.db.models import Q
+from main.models.neighbor import Neighbor
+
+
+# ✅ 블로그를 조회하는 사용자의 등급 (게시물 공개 범위 판단 기준)
+VIEWER_OWNER = 'owner'    # 블로그 주인 본인
+VIEWER_MUTUAL = 'mutual'  # 서로이웃
+VIEWER_PUBLIC = 'public'  # 그 외 (비로그인 포함)
+
+VIEWER_TIERS = (VIEWER_OWNER, VIEWER_MUTUAL, VIEWER_PUBLIC)
+
+
+def is_neighbor(user, other):
+    """
+    두 사용자가 서로이웃(accepted) 관계인지 확인
+    """
+    if user is None or not user.is_authenticated:
+        return False
+
+    # ✅ 서로이웃은 양방향 행으로 저장되므로 (from_user, to_user) 유니크 인덱스 한 번 조회로 충분
+    return Neighbor.objects.filter(from_user=user, to_user=other, status="accepted").exists()
+
+
+def neighbor_ids(user):
+    """
+    사용자의 서로이웃 ID 서브쿼리 (values 쿼리셋, author__in 등에 그대로 넣어 쓸 수 있음)
+    """
+    return Neighbor.objects.filter(from_user=user, status="accepted").values('to_user')
+
+
+def get_viewer_tier(viewer, blog_owner):
+    """
+    조회자와 블로그 주인의 관계를 한 번만 계산해서 등급으로 반환
+    blog_owner는 사용자 객체 또는 사용자 ID(pk) 모두 가능
+    """
+    owner_id = getattr(blog_owner, 'pk', blog_owner)
+    if viewer is not None and viewer.is_authenticated and viewer.pk == owner_id:
+        return VIEWER_OWNER
+    if is_neighbor(viewer, blog_owner):
+        return VIEWER_MUTUAL
+    return VIEWER_PUBLIC
+
+
+def visible_posts_filter(tier, prefix=''):
+    """
+    등급별로 볼 수 있는 게시물 조건(Q) 반환
+    - 본인: 모든 공개 범위
+    - 서로이웃: 전체 공개 + 서로이웃 공개
+    - 그 외: 전체 공개
+    prefix를 주면 다른 모델에서 post__visibility 처럼 조인 조건으로 사용할 수 있다.
+    """
+    if tier == VIEWER_OWNER:
+        return Q()
+    if tier == VIEWER_MUTUAL:
+        return Q(**{f"{prefix}visibility__in": ["everyone", "mutual"]})
+    return Q(**{f"{prefix}visibility": "everyone"})
+
+
+def can_view_visibility(tier, visibility):
+    """
+    visible_posts_filter와 같은 규칙을 이미 읽어 온 게시물의 공개 범위 값에 적용 (추가 쿼리 없음)
+    """
+    if tier == VIEWER_OWNER:
+        return True
+    if tier == VIEWER_MUTUAL:
+        return visibility in ("everyone", "mutual")
+    return visibility == "everyone"
+
+
+def viewer_posts_filter(viewer, prefix=''):
+    """
+    여러 블로그의 게시물을 한 번에 조회할 때 조회자가 볼 수 있는 게시물 조건(Q)
+    - 전체 공개 글 + 본인 글 + 서로이웃의 '서로 이웃 공개' 글
+    서로이웃 목록은 서브쿼리로 넣어서 추가 쿼리 없이 한 번에 조회된다.
+    """
+    public_posts = Q(**{f"{prefix}visibility": "everyone"})
+    if viewer is None or not viewer.is_authenticated:
+        return public_posts
+
+    return (
+        public_posts
+        | Q(**{f"{prefix}author": viewer})
+        | Q(**{f"{prefix}visibility": "mutual", f"{prefix}author__in": neighbor_ids(viewer)})
+    )
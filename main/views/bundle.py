@@ -0,0 +1,193 @@
+from django.db.models import Count, Exists, OuterRef
+from django.core.files.storage import default_storage
+from django.shortcuts import get_object_or_404
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticatedOrReadOnly, AllowAny
+from rest_framework.exceptions import ValidationError
+from rest_framework import status
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+
+from ..models.post import Post
+from ..models.profile import Profile
+from ..models.neighbor import Neighbor
+from ..models.comment import Comment
+from ..models.heart import Heart
+from ..models.readReceipt import ReadReceipt
+from ..serializers.profile import ProfileSerializer
+from ..serializers.fast import serialize_posts, serialize_comments
+from ..utils.visibility import (
+    VIEWER_OWNER, VIEWER_MUTUAL, VIEWER_PUBLIC, get_viewer_tier, can_view_visibility, visible_posts_filter,
+)
+from ..utils.cache import get_or_set_blog_cache
+
+# ✅ 좋아요 수 변경은 블로그 캐시를 무효화하지 않으므로, 홈 캐시는 짧게 유지
+BLOG_HOME_CACHE_TIMEOUT = 60
+BLOG_HOME_RECENT_POSTS = 5
+
+
+class PostPageView(APIView):
+    """
+    게시물 페이지 한 번에 조회 API
+    - 게시물 상세, 댓글 첫 페이지(대댓글 포함), 좋아요 수, 댓글 수, 내가 좋아요 눌렀는지 여부를 함께 반환
+    - 게시물 조회와 공개 범위 확인은 한 번만 수행하고, 나머지는 묶음 쿼리로 가져옴
+    """
+    permission_classes = [IsAuthenticatedOrReadOnly]
+
+    @swagger_auto_schema(
+        operation_summary="게시물 페이지 조회 (상세 + 댓글 + 좋아요)",
+        operation_description="게시물 상세, 댓글 첫 페이지, 좋아요/댓글 개수, 내 좋아요 여부를 한 번에 반환합니다. "
+                              "'서로 이웃 공개' 글은 서로이웃과 작성자만, '나만 보기' 글은 작성자만 조회할 수 있습니다.",
+        manual_parameters=[
+            openapi.Parameter('comment_limit', openapi.IN_QUERY, description="댓글 첫 페이지 크기 (기본 20, 최대 100)",
+                              required=False, type=openapi.TYPE_INTEGER),
+        ],
+        responses={
+            200: openapi.Schema(
+                type=openapi.TYPE_OBJECT,
+                properties={
+                    "post": openapi.Schema(type=openapi.TYPE_OBJECT, description="PostSerializer와 같은 형태"),
+                    "comments": openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Items(type=openapi.TYPE_OBJECT),
+                                               description="CommentSerializer와 같은 형태"),
+                    "comments_has_more": openapi.Schema(type=openapi.TYPE_BOOLEAN, description="다음 댓글이 더 있는지 여부"),
+                    "like_count": openapi.Schema(type=openapi.TYPE_INTEGER, description="좋아요 개수"),
+                    "comment_count": openapi.Schema(type=openapi.TYPE_INTEGER, description="댓글 + 대댓글 개수"),
+                    "liked_by_me": openapi.Schema(type=openapi.TYPE_BOOLEAN, description="내가 좋아요를 눌렀는지 여부"),
+                }
+            ),
+            403: openapi.Response(description="조회 권한이 없습니다."),
+            404: openapi.Response(description="게시글을 찾을 수 없습니다."),
+        }
+    )
+    def get(self, request, post_id, *args, **kwargs):
+        try:
+            comment_limit = int(request.query_params.get('comment_limit', 20))
+        except ValueError:
+            raise ValidationError("comment_limit은 정수여야 합니다.")
+        if not 1 <= comment_limit <= 100:
+            raise ValidationError("comment_limit은 1~100 사이여야 합니다.")
+
+        user = request.user
+
+        # ✅ 1. 게시물 + 댓글 수 + 내 좋아요 여부를 한 쿼리로
+        queryset = Post.objects.filter(is_complete=True).annotate(total_comments=Count('comments'))
+        if user.is_authenticated:
+            queryset = queryset.annotate(liked_by_me=Exists(Heart.objects.filter(post=OuterRef('pk'), user=user)))
+        post = get_object_or_404(queryset.only('id', 'author_id', 'visibility', 'like_count'), id=post_id)
+
+        # ✅ 2. 공개 범위 확인 (전체 공개 글이면 서로이웃 조회도 생략)
+        tier = VIEWER_PUBLIC if post.visibility == 'everyone' else get_viewer_tier(user, post.author_id)
+        if not can_view_visibility(tier, post.visibility):
+            return Response({"error": "이 게시글을 조회할 권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
+
+        # ✅ 3. 본문/이미지, 댓글 첫 페이지 (limit + 1개를 읽어서 다음 페이지 여부 판단)
+        post_data = serialize_posts(Post.objects.filter(id=post.id), request)[0]
+
+        comments = serialize_comments(
+            Comment.objects.filter(post_id=post.id, parent__isnull=True).order_by('created_at', 'id')[:comment_limit + 1],
+            user,
+        )
+
+        if user.is_authenticated:
+            ReadReceipt.mark_read(user, [post.id])
+
+        return Response({
+            "post": post_data,
+            "comments": comments[:comment_limit],
+            "comments_has_more": len(comments) > comment_limit,
+            "like_count": post.like_count,
+            "comment_count": post.total_comments,
+            "liked_by_me": getattr(post, 'liked_by_me', False),
+        }, status=status.HTTP_200_OK)
+
+
+def blog_home_sections(profile, tier, include_neighbors, request):
+    """
+    블로그 홈의 각 구역을 조회자 등급(tier) 기준으로 계산 (조회자 개인 정보는 포함하지 않음 → 등급별 캐시 가능)
+    쿼리: 글 개수 1번 + 서로이웃 수 1번 + 최근 글 2~3번 (+ 서로이웃 목록 1번)
+    """
+    owner = profile.user
+
+    profile_data = ProfileSerializer(profile, context={"request": request}).data
+    profile_data["is_neighbor"] = tier == VIEWER_MUTUAL
+
+    posts = Post.objects.filter(visible_posts_filter(tier), author=owner, is_complete=True)
+
+    # ✅ 서로이웃 수: 비공개 설정이어도 본인은 조회 가능 (NeighborNumberView와 동일)
+    neighbor_count = None
+    if profile.neighbor_visibility or tier == VIEWER_OWNER:
+        neighbor_count = Neighbor.objects.filter(from_user=owner, status="accepted").count()
+
+    # ✅ 서로이웃 목록: 비공개 설정이면 본인도 숨김 (PublicNeighborListView와 동일)
+    neighbors = None
+    if include_neighbors and profile.neighbor_visibility:
+        rows = Neighbor.objects.filter(from_user=owner, status="accepted").values(
+            'to_user__profile__urlname', 'to_user__profile__user_pic',
+        )
+        neighbors = [
+            {
+                "urlname": row['to_user__profile__urlname'],
+                "user_pic": default_storage.url(row['to_user__profile__user_pic']) if row['to_user__profile__user_pic'] else None,
+            }
+            for row in rows
+        ]
+
+    return {
+        "profile": profile_data,
+        "post_count": posts.count(),
+        "neighbor_count": neighbor_count,
+        "recent_posts": serialize_posts(posts.order_by("-created_at")[:BLOG_HOME_RECENT_POSTS], request),
+        "neighbors": neighbors,
+    }
+
+
+class BlogHomeView(APIView):
+    """
+    블로그 홈 한 번에 조회 API
+    - 프로필(+서로이웃 여부), 글 개수, 서로이웃 수, 최근 글 5개, (선택) 서로이웃 목록을 함께 반환
+    - urlname → 프로필 조회와 조회자 등급(본인/서로이웃/그 외) 판단은 한 번만 수행
+    - 결과는 블로그 주인 + 조회자 등급 단위로 캐시 (게시물/프로필/서로이웃 변경 시 무효화)
+    - 쿼리 수: 캐시 적중 시 2번 이하(프로필 1번 + 서로이웃 여부 1번), 미적중 시 최대 8번
+    """
+    permission_classes = [AllowAny]
+
+    @swagger_auto_schema(
+        operation_summary="블로그 홈 조회 (프로필 + 글 개수 + 서로이웃 수 + 최근 글)",
+        operation_description="블로그 홈에 필요한 정보를 한 번에 반환합니다. 서로이웃 수/목록이 비공개면 null을 반환합니다 "
+                              "(서로이웃 수는 본인에게는 항상 공개).",
+        manual_parameters=[
+            openapi.Parameter('urlname', openapi.IN_PATH, description="조회할 사용자의 URL 이름",
+                              type=openapi.TYPE_STRING, required=True),
+            openapi.Parameter('include_neighbors', openapi.IN_QUERY, description="서로이웃 목록 포함 여부 (기본 false)",
+                              required=False, type=openapi.TYPE_BOOLEAN),
+        ],
+        responses={
+            200: openapi.Schema(
+                type=openapi.TYPE_OBJECT,
+                properties={
+                    "profile": openapi.Schema(type=openapi.TYPE_OBJECT, description="ProfileSerializer + is_neighbor"),
+                    "post_count": openapi.Schema(type=openapi.TYPE_INTEGER, description="조회자가 볼 수 있는 글 개수"),
+                    "neighbor_count": openapi.Schema(type=openapi.TYPE_INTEGER, description="서로이웃 수 (비공개면 null)"),
+                    "recent_posts": openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Items(type=openapi.TYPE_OBJECT),
+                                                   description="최근 글 5개 (PostSerializer와 같은 형태)"),
+                    "neighbors": openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Items(type=openapi.TYPE_OBJECT),
+                                                description="서로이웃 목록 [{urlname, user_pic}] (요청하지 않았거나 비공개면 null)"),
+                }
+            ),
+            404: openapi.Response(description="사용자를 찾을 수 없음"),
+        }
+    )
+    def get(self, request, urlname, *args, **kwargs):
+        include_neighbors = request.query_params.get('include_neighbors', '').lower() in ('1', 'true')
+
+        profile = get_object_or_404(Profile.objects.select_related('user'), urlname=urlname)
+        tier = get_viewer_tier(request.user, profile.user)
+
+        section = 'home_neighbors' if include_neighbors else 'home'
+        data = get_or_set_blog_cache(
+            profile.user_id, section, tier,
+            lambda: blog_home_sections(profile, tier, include_neighbors, request),
+            timeout=BLOG_HOME_CACHE_TIMEOUT,
+        )
+        return Response(data, status=status.HTTP_200_OK)
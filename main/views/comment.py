@@ -10,7 +10,9 @@ from drf_yasg import openapi
 from main.models.comment import Comment
 from main.models.post import Post
 from main.serializers.comment import CommentSerializer
+from main.serializers.fast import serialize_comments
 from main.models.profile import Profile  # ✅ Profile 모델 임포트
+from main.utils.visibility import is_neighbor
 from django.contrib.auth import get_user_model
 from rest_framework.response import Response
 from django.http import Http404
@@ -36,8 +38,7 @@ class CommentListView(ListCreateAPIView):
         if not queryset.exists():
             return Response({"error": "이 게시글의 댓글을 조회할 권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
 
-        self.queryset = queryset
-        return super().get(request, *args, **kwargs)
+        return Response(serialize_comments(queryset, request.user), status=status.HTTP_200_OK)
 
     def get_queryset(self):
         """
@@ -58,7 +59,7 @@ class CommentListView(ListCreateAPIView):
         if post.visibility == 'me' and (not user.is_authenticated or post.author.profile != user.profile):
             return Comment.objects.none()
 
-        if post.visibility == 'mutual' and not post.author.profile.neighbors.filter(id=user.profile.id).exists():
+        if post.visibility == 'mutual' and not is_neighbor(user, post.author_id):
             return Comment.objects.none()
 
         # ✅ 댓글과 대댓글을 계층적으로 가져오기
@@ -96,7 +97,7 @@ class CommentListView(ListCreateAPIView):
             return Response({"error": "이 게시글에는 작성자 본인만 댓글을 작성할 수 있습니다."}, status=403)
 
         # ✅ '서로 이웃 공개' 게시글 → 서로 이웃인지 체크
-        if post.visibility == 'mutual' and not post.author.profile.neighbors.filter(id=user.profile.id).exists():
+        if post.visibility == 'mutual' and not is_neighbor(user, post.author_id):
             return Response({"error": "서로 이웃 관계인 사용자만 댓글을 작성할 수 있습니다."}, status=403)
 
         # ✅ 댓글 저장
@@ -143,7 +144,7 @@ class CommentDetailView(RetrieveUpdateDestroyAPIView):
         if post.visibility == 'me' and (not user.is_authenticated or post.author.profile != user.profile):
             return Comment.objects.none()
 
-        if post.visibility == 'mutual' and not post.author.profile.neighbors.filter(id=user.profile.id).exists():
+        if post.visibility == 'mutual' and not is_neighbor(user, post.author_id):
             return Comment.objects.none()
 
         return Comment.objects.filter(post_id=post_id)
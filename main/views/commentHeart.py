@@ -5,6 +5,7 @@ from django.shortcuts import get_object_or_404
 from main.models.comment import Comment
 from main.models.commentHeart import CommentHeart
 from main.serializers.commentHeart import CommentHeartSerializer
+from main.utils.visibility import is_neighbor
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
@@ -46,7 +47,7 @@ class ToggleCommentHeartView(generics.GenericAPIView):
             return Response({"error": "이 게시글의 댓글에는 좋아요를 누를 수 없습니다."}, status=status.HTTP_403_FORBIDDEN)
 
         # ✅ '서로 이웃 공개' 게시글이면 서로 이웃만 댓글 좋아요 가능
-        if comment.post.visibility == 'mutual' and not comment.post.author.profile.neighbors.filter(id=user.profile.id).exists():
+        if comment.post.visibility == 'mutual' and not is_neighbor(user, comment.post.author_id):
             return Response({"error": "서로 이웃만 이 게시글의 댓글에 좋아요를 누를 수 있습니다."}, status=status.HTTP_403_FORBIDDEN)
 
         # ✅ 비밀 댓글/대댓글은 좋아요 기능 없음
@@ -101,7 +102,7 @@ class CommentHeartCountView(generics.RetrieveAPIView):
             return Response({"error": "이 게시글의 댓글 좋아요 개수를 조회할 수 없습니다."}, status=status.HTTP_403_FORBIDDEN)
 
         # ✅ '서로 이웃 공개' 게시글이면 서로 이웃만 좋아요 개수 조회 가능
-        if comment.post.visibility == 'mutual' and not comment.post.author.profile.neighbors.filter(id=user.profile.id).exists():
+        if comment.post.visibility == 'mutual' and not is_neighbor(user, comment.post.author_id):
             return Response({"error": "서로 이웃만 이 게시글의 댓글 좋아요 개수를 조회할 수 있습니다."}, status=status.HTTP_403_FORBIDDEN)
 
         # ✅ 최신 좋아요 개수 동기화
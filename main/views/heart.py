@@ -8,6 +8,9 @@ from django.contrib.auth import get_user_model
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from main.serializers.heart import HeartSerializer
+from main.serializers.fast import file_url
+from main.utils.visibility import is_neighbor
+from main.utils.pagination import parse_limit, cursor_page
 
 User = get_user_model()  # ✅ Django의 사용자 모델 가져오기
 
@@ -47,8 +50,8 @@ class ToggleHeartView(generics.GenericAPIView):
         if post.visibility == 'me':
             return Response({"error": "이 게시글에서는 좋아요를 누를 수 없습니다."}, status=status.HTTP_403_FORBIDDEN)
 
-        # ✅ '서로 이웃 공개' 게시글이면 서로 이웃만 하트 가능 (is_mutual 대신 neighbors 사용)
-        if post.visibility == 'mutual' and not post.author.profile.neighbors.filter(id=user.profile.id).exists():
+        # ✅ '서로 이웃 공개' 게시글이면 서로 이웃만 하트 가능
+        if post.visibility == 'mutual' and not is_neighbor(user, post.author_id):
             return Response({"error": "서로 이웃만 이 게시글에 좋아요를 누를 수 있습니다."}, status=status.HTTP_403_FORBIDDEN)
 
         # ✅ 현재 유저가 이미 하트를 눌렀는지 확인하고 최적화
@@ -57,12 +60,12 @@ class ToggleHeartView(generics.GenericAPIView):
         if heart:
             heart.delete()
             post.like_count = max(0, post.like_count - 1)  # ✅ like_count 감소
-            post.save()
+            post.save(update_fields=["like_count"])
             return Response({"message": "하트 취소", "like_count": post.like_count}, status=status.HTTP_200_OK)
 
         Heart.objects.create(post=post, user=user)
         post.like_count += 1
-        post.save()
+        post.save(update_fields=["like_count"])
 
         return Response({"message": "하트 추가", "like_count": post.like_count}, status=status.HTTP_201_CREATED)
 
@@ -73,7 +76,13 @@ class PostHeartUsersView(generics.RetrieveAPIView):
 
     @swagger_auto_schema(
         operation_summary="게시글을 좋아요한 유저 목록 조회",
-        operation_description="게시글을 좋아요한(하트를 누른) 유저 목록을 반환합니다.",
+        operation_description="게시글을 좋아요한(하트를 누른) 유저 목록을 최근 좋아요 순으로 반환합니다. 다음 페이지는 next_cursor를 cursor로 넘겨서 조회합니다.",
+        manual_parameters=[
+            openapi.Parameter('cursor', openapi.IN_QUERY, description="이전 응답의 next_cursor", required=False,
+                              type=openapi.TYPE_STRING),
+            openapi.Parameter('limit', openapi.IN_QUERY, description="페이지 크기 (기본 20, 최대 100)", required=False,
+                              type=openapi.TYPE_INTEGER),
+        ],
         responses={
             200: openapi.Response(description="유저 목록 반환", schema=openapi.Schema(
                 type=openapi.TYPE_OBJECT,
@@ -83,11 +92,15 @@ class PostHeartUsersView(generics.RetrieveAPIView):
                         items=openapi.Schema(
                             type=openapi.TYPE_OBJECT,
                             properties={
-                                "username": openapi.Schema(type=openapi.TYPE_STRING, description="유저 이름")
+                                "urlname": openapi.Schema(type=openapi.TYPE_STRING, description="유저 URL 이름"),
+                                "username": openapi.Schema(type=openapi.TYPE_STRING, description="유저 이름"),
+                                "user_pic": openapi.Schema(type=openapi.TYPE_STRING, format="url", description="프로필 이미지 URL"),
                             }
                         ),
                         description="좋아요(하트)를 누른 유저 목록"
-                    )
+                    ),
+                    "next_cursor": openapi.Schema(type=openapi.TYPE_STRING, x_nullable=True,
+                                                  description="다음 페이지 커서 (마지막이면 null)"),
                 }
             )),
         }
@@ -100,14 +113,28 @@ class PostHeartUsersView(generics.RetrieveAPIView):
         if post.visibility == 'me' and post.author != user:
             return Response({"error": "이 게시글의 좋아요 유저 목록을 조회할 권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
 
-        # ✅ '서로 이웃 공개' 게시글이면 서로 이웃만 하트 목록 조회 가능 (is_mutual 대신 neighbors 사용)
-        if post.visibility == 'mutual' and not post.author.profile.neighbors.filter(id=user.profile.id).exists():
+        # ✅ '서로 이웃 공개' 게시글이면 서로 이웃만 하트 목록 조회 가능
+        if post.visibility == 'mutual' and not is_neighbor(user, post.author_id):
             return Response({"error": "서로 이웃만 이 게시글의 좋아요 유저 목록을 조회할 수 있습니다."}, status=status.HTTP_403_FORBIDDEN)
 
-        hearts = Heart.objects.filter(post=post).select_related('user__profile')  # ✅ profile까지 join
-        liked_users = [{"username": heart.user.profile.username} for heart in hearts]  # ✅ 프로필의 username 사용
-
-        return Response({"liked_users": liked_users}, status=status.HTTP_200_OK)
+        # ✅ (post, created_at) 인덱스로 한 페이지만 읽고, 프로필은 조인 1번으로 함께 조회
+        rows, next_cursor = cursor_page(
+            Heart.objects.filter(post=post).values(
+                'id', 'created_at', 'user__profile__urlname', 'user__profile__username', 'user__profile__user_pic',
+            ),
+            request.query_params.get('cursor'),
+            parse_limit(request.query_params.get('limit')),
+        )
+        liked_users = [
+            {
+                "urlname": row['user__profile__urlname'],
+                "username": row['user__profile__username'],  # ✅ 프로필의 username 사용
+                "user_pic": file_url(row['user__profile__user_pic']),
+            }
+            for row in rows
+        ]
+
+        return Response({"liked_users": liked_users, "next_cursor": next_cursor}, status=status.HTTP_200_OK)
 
 
 class PostHeartCountView(generics.RetrieveAPIView):
@@ -134,8 +161,8 @@ class PostHeartCountView(generics.RetrieveAPIView):
         if post.visibility == 'me' and post.author != user:
             return Response({"error": "이 게시글의 하트 개수를 조회할 권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
 
-        # ✅ '서로 이웃 공개' 게시글이면 서로 이웃만 하트 개수 조회 가능 (is_mutual 대신 neighbors 사용)
-        if post.visibility == 'mutual' and not post.author.profile.neighbors.filter(id=user.profile.id).exists():
+        # ✅ '서로 이웃 공개' 게시글이면 서로 이웃만 하트 개수 조회 가능
+        if post.visibility == 'mutual' and not is_neighbor(user, post.author_id):
             return Response({"error": "서로 이웃만 이 게시글의 하트 개수를 조회할 수 있습니다."}, status=status.HTTP_403_FORBIDDEN)
 
         return Response({"like_count": post.like_count}, status=status.HTTP_200_OK)
@@ -12,10 +12,43 @@ from django.shortcuts import get_object_or_404
 from ..models.neighbor import Neighbor
 from ..models.profile import Profile
 from ..serializers.neighbor import NeighborSerializer
+from ..serializers.fast import file_url
+from ..utils.pagination import parse_limit, cursor_page
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from django.db import models
-from django.db.models import Q
+
+# ✅ 목록 커서 페이지네이션 파라미터 (서로이웃 / 받은 신청 목록 공통)
+PAGE_PARAMETERS = [
+    openapi.Parameter('cursor', openapi.IN_QUERY, description="이전 응답의 next_cursor", required=False,
+                      type=openapi.TYPE_STRING),
+    openapi.Parameter('limit', openapi.IN_QUERY, description="페이지 크기 (기본 20, 최대 100)", required=False,
+                      type=openapi.TYPE_INTEGER),
+]
+
+
+def neighbor_page(request, user):
+    """
+    ✅ 사용자의 서로이웃 한 페이지 (최근 수락 순) → (목록, 다음 커서)
+    양방향 행 중 from_user=user 쪽만 (from_user, status, accepted_at) 인덱스로 읽고, 프로필은 조인 1번으로 함께 조회
+    """
+    rows, next_cursor = cursor_page(
+        Neighbor.objects.filter(from_user=user, status="accepted").values(
+            'id', 'accepted_at', 'to_user__profile__urlname', 'to_user__profile__username', 'to_user__profile__user_pic',
+        ),
+        request.query_params.get('cursor'),
+        parse_limit(request.query_params.get('limit')),
+        created_field='accepted_at',
+    )
+    neighbor_list = [
+        {
+            "urlname": row['to_user__profile__urlname'],
+            "username": row['to_user__profile__username'],
+            "user_pic": file_url(row['to_user__profile__user_pic']),
+        }
+        for row in rows
+    ]
+    return neighbor_list, next_cursor
 
 
 class NeighborView(APIView):
@@ -91,7 +124,8 @@ class NeighborRequestListView(ListAPIView):
 
     @swagger_auto_schema(
         operation_summary="받은 서로이웃 요청 목록 조회",
-        operation_description="현재 로그인한 사용자가 받은 서로이웃 요청 목록을 조회합니다.",
+        operation_description="현재 로그인한 사용자가 받은 서로이웃 요청 목록을 최근 신청 순으로 조회합니다. 다음 페이지는 next_cursor를 cursor로 넘겨서 조회합니다.",
+        manual_parameters=PAGE_PARAMETERS,
         responses={
             200: openapi.Response(
                 description="서로이웃 요청 목록 반환",
@@ -111,7 +145,9 @@ class NeighborRequestListView(ListAPIView):
                                                                        description="서로이웃 신청 메시지")
                                 }
                             )
-                        )
+                        ),
+                        "next_cursor": openapi.Schema(type=openapi.TYPE_STRING, x_nullable=True,
+                                                      description="다음 페이지 커서 (마지막이면 null)"),
                     }
                 )
             ),
@@ -122,29 +158,37 @@ class NeighborRequestListView(ListAPIView):
         """
         ✅ 받은 서로이웃 요청이 없는 경우 적절한 메시지를 반환
         """
-        queryset = self.get_queryset()
-
-        if not queryset.exists():
-            return Response({"message": "받은 서로이웃 요청이 없습니다.", "requests": []}, status=200)
+        cursor = request.query_params.get('cursor')
+        rows, next_cursor = cursor_page(
+            self.get_queryset().values(
+                'id', 'created_at', 'request_message', 'from_user__profile__urlname',
+                'from_user__profile__username', 'from_user__profile__user_pic',
+            ),
+            cursor,
+            parse_limit(request.query_params.get('limit')),
+        )
 
         request_list = [
             {
-                "from_username": neighbor.from_user.profile.username,  # ✅ 사용자에게 username을 보여줌
-                "from_urlname": neighbor.from_user.profile.urlname,  # ✅ 내부 처리용 urlname
-                "from_user_pic": neighbor.from_user.profile.user_pic.url if neighbor.from_user.profile.user_pic else None,
-                "request_message": neighbor.request_message  # ✅ 신청 메시지 추가
+                "from_username": row['from_user__profile__username'],  # ✅ 사용자에게 username을 보여줌
+                "from_urlname": row['from_user__profile__urlname'],  # ✅ 내부 처리용 urlname
+                "from_user_pic": file_url(row['from_user__profile__user_pic']),
+                "request_message": row['request_message']  # ✅ 신청 메시지 추가
             }
-            for neighbor in queryset
+            for row in rows
         ]
 
-        return Response({"requests": request_list}, status=200)
+        response_data = {"requests": request_list, "next_cursor": next_cursor}
+        if not request_list and not cursor:
+            response_data["message"] = "받은 서로이웃 요청이 없습니다."
+        return Response(response_data, status=200)
 
     def get_queryset(self):
         """
         ✅ 자신에게 서로이웃 요청을 보낸 사람들(QuerySet) 반환
         """
         user = self.request.user
-        return Neighbor.objects.filter(to_user=user, status="pending").select_related("from_user__profile")
+        return Neighbor.objects.filter(to_user=user, status="pending")
 
 class NeighborAcceptView(APIView):
     """
@@ -159,32 +203,16 @@ class NeighborAcceptView(APIView):
         to_user = request.user  # 현재 로그인한 사용자
         from_user_profile = get_object_or_404(Profile, urlname=from_urlname)
         from_user = from_user_profile.user
-        to_user_profile, _ = Profile.objects.get_or_create(user=to_user)
-
-        # ✅ 서로이웃 관계가 이미 존재하는 경우
-        if Neighbor.objects.filter(
-            (Q(from_user=from_user, to_user=to_user) | Q(from_user=to_user, to_user=from_user)),
-            status="accepted"
-        ).exists():
-            return Response({"message": "이미 서로이웃 상태입니다."}, status=status.HTTP_400_BAD_REQUEST)
-
-        # ✅ 서로이웃 요청 찾기 (A → B)
-        neighbor_requests = Neighbor.objects.filter(from_user=from_user, to_user=to_user, status="pending")
-
-        # ✅ 반대 방향의 서로이웃 요청 찾기 (B → A)
-        reverse_neighbor_requests = Neighbor.objects.filter(from_user=to_user, to_user=from_user, status="pending")
 
-        # ✅ 둘 다 없으면 에러
-        if not neighbor_requests.exists() and not reverse_neighbor_requests.exists():
+        # ✅ 받은 요청(from_user → 나)을 양방향 accepted로 한 트랜잭션에서 변경 (내가 보낸 요청은 수락 불가)
+        try:
+            accepted = Neighbor.accept(to_user, from_user)
+        except Neighbor.DoesNotExist:
             return Response({"message": "서로이웃 요청이 존재하지 않습니다."}, status=status.HTTP_404_NOT_FOUND)
 
-        # ✅ 모든 `pending` 요청을 `accepted`로 변경 (A → B & B → A)
-        neighbor_requests.update(status="accepted")
-        reverse_neighbor_requests.update(status="accepted")
-
-        # ✅ Profile의 `neighbors`에도 서로 추가 (양방향)
-        from_user_profile.neighbors.add(to_user_profile)
-        to_user_profile.neighbors.add(from_user_profile)
+        # ✅ 서로이웃 관계가 이미 존재하는 경우 (중복 수락은 아무것도 바꾸지 않음)
+        if not accepted:
+            return Response({"message": "이미 서로이웃 상태입니다."}, status=status.HTTP_400_BAD_REQUEST)
 
         return Response({"message": "서로이웃 요청이 수락되었습니다."}, status=status.HTTP_200_OK)
 
@@ -236,12 +264,13 @@ class PublicNeighborListView(APIView):
 
     @swagger_auto_schema(
         operation_summary="타인의 서로이웃 목록 조회",
-        operation_description="특정 사용자의 서로이웃 목록을 `urlname`으로 조회합니다.",
+        operation_description="특정 사용자의 서로이웃 목록을 `urlname`으로 최근 수락 순으로 조회합니다. 다음 페이지는 next_cursor를 cursor로 넘겨서 조회합니다.",
         manual_parameters=[
             openapi.Parameter(
                 'urlname', openapi.IN_PATH, description="조회할 사용자의 URL 이름",
                 type=openapi.TYPE_STRING, required=True
-            )
+            ),
+            *PAGE_PARAMETERS,
         ],
         responses={
             200: openapi.Response(
@@ -256,10 +285,13 @@ class PublicNeighborListView(APIView):
                                 type=openapi.TYPE_OBJECT,
                                 properties={
                                     "urlname": openapi.Schema(type=openapi.TYPE_STRING, description="서로이웃 사용자의 URL 이름"),
+                                    "username": openapi.Schema(type=openapi.TYPE_STRING, description="서로이웃 사용자의 닉네임"),
                                     "user_pic": openapi.Schema(type=openapi.TYPE_STRING, format="url", description="프로필 이미지 URL"),
                                 }
                             )
-                        )
+                        ),
+                        "next_cursor": openapi.Schema(type=openapi.TYPE_STRING, x_nullable=True,
+                                                      description="다음 페이지 커서 (마지막이면 null)"),
                     }
                 )
             ),
@@ -274,23 +306,12 @@ class PublicNeighborListView(APIView):
         if not profile.neighbor_visibility:
             return Response({"message": "비공개입니다."}, status=status.HTTP_403_FORBIDDEN)
 
-        # ✅ `Neighbor` 모델을 사용하여 서로이웃 관계 조회
-        neighbors = Neighbor.objects.filter(
-            Q(from_user=profile.user) | Q(to_user=profile.user),
-            status="accepted"
-        ).select_related("from_user__profile", "to_user__profile")
-
-        neighbor_list = [
-            {
-                "urlname": (neighbor.to_user.profile if neighbor.from_user == profile.user else neighbor.from_user.profile).urlname,
-                "user_pic": (neighbor.to_user.profile if neighbor.from_user == profile.user else neighbor.from_user.profile).user_pic.url if (neighbor.to_user.profile if neighbor.from_user == profile.user else neighbor.from_user.profile).user_pic else None
-            }
-            for neighbor in neighbors
-        ]
+        neighbor_list, next_cursor = neighbor_page(request, profile.user_id)
 
         return Response({
             "urlname": profile.urlname,
-            "neighbors": neighbor_list
+            "neighbors": neighbor_list,
+            "next_cursor": next_cursor,
         }, status=status.HTTP_200_OK)
 
 
@@ -302,7 +323,8 @@ class MyNeighborListView(ListAPIView):
 
     @swagger_auto_schema(
         operation_summary="내 서로이웃 목록 조회",
-        operation_description="로그인한 사용자의 서로이웃 목록을 조회합니다.",
+        operation_description="로그인한 사용자의 서로이웃 목록을 최근 수락 순으로 조회합니다. 다음 페이지는 next_cursor를 cursor로 넘겨서 조회합니다.",
+        manual_parameters=PAGE_PARAMETERS,
         responses={
             200: openapi.Response(
                 description="서로이웃 목록 반환",
@@ -320,40 +342,22 @@ class MyNeighborListView(ListAPIView):
                                 }
                             )
                         ),
+                        "next_cursor": openapi.Schema(type=openapi.TYPE_STRING, x_nullable=True,
+                                                      description="다음 페이지 커서 (마지막이면 null)"),
                         "message": openapi.Schema(type=openapi.TYPE_STRING, description="서로이웃이 없는 경우의 메시지")
                     }
                 )
             ),
-            404: openapi.Response(description="사용자를 찾을 수 없음"),
         }
     )
     def get(self, request):
         """
         ✅ 로그인한 사용자의 서로이웃 목록을 조회합니다.
         """
-        profile = get_object_or_404(Profile, user=request.user)
-
-        # ✅ `Neighbor` 모델을 사용하여 서로이웃 관계 조회
-        neighbors = Neighbor.objects.filter(
-            Q(from_user=request.user) | Q(to_user=request.user),
-            status="accepted"
-        ).select_related("from_user__profile", "to_user__profile")
-
-        neighbor_list = []
-        for neighbor in neighbors:
-            if neighbor.from_user == request.user:
-                neighbor_profile = neighbor.to_user.profile  # ✅ `to_user`의 Profile 가져오기
-            else:
-                neighbor_profile = neighbor.from_user.profile  # ✅ `from_user`의 Profile 가져오기
-
-            neighbor_list.append({
-                "urlname": neighbor_profile.urlname,  # ✅ 반환 값에 `urlname` 포함
-                "username": neighbor_profile.username,  # ✅ 사용자가 볼 수 있도록 `username` 포함
-                "user_pic": neighbor_profile.user_pic.url if neighbor_profile.user_pic else None
-            })
-
-        response_data = {"neighbors": neighbor_list}
-        if not neighbor_list:
+        neighbor_list, next_cursor = neighbor_page(request, request.user)
+
+        response_data = {"neighbors": neighbor_list, "next_cursor": next_cursor}
+        if not neighbor_list and not request.query_params.get('cursor'):
             response_data["message"] = "서로이웃이 없습니다."
 
         return Response(response_data, status=status.HTTP_200_OK)
@@ -369,26 +373,12 @@ class MyNeighborDeleteView(APIView):
         """
         ✅ 로그인한 사용자의 서로이웃 관계를 삭제합니다.
         """
-        profile = get_object_or_404(Profile, user=request.user)
         neighbor_profile = get_object_or_404(Profile, urlname=neighbor_urlname)
 
-        # ✅ 서로이웃 관계 확인 (모든 해당 관계 삭제)
-        neighbor_relations = Neighbor.objects.filter(
-            Q(from_user=request.user, to_user=neighbor_profile.user) |
-            Q(from_user=neighbor_profile.user, to_user=request.user),
-            status="accepted"
-        )
-
-        if not neighbor_relations.exists():
+        # ✅ 서로이웃 관계 삭제 (양방향 행을 한 번의 DELETE로)
+        if not Neighbor.remove(request.user, neighbor_profile.user):
             return Response({"message": "서로이웃 관계가 존재하지 않습니다."}, status=status.HTTP_404_NOT_FOUND)
 
-        # ✅ 서로이웃 관계 삭제
-        neighbor_relations.delete()
-
-        # ✅ Profile의 neighbors에서도 제거
-        profile.neighbors.remove(neighbor_profile)
-        neighbor_profile.neighbors.remove(profile)
-
         return Response({"message": "서로이웃 관계가 삭제되었습니다."}, status=status.HTTP_200_OK)
 
 
@@ -412,6 +402,6 @@ class NeighborNumberView(APIView):
         if not profile.neighbor_visibility and not is_own_profile:
             raise PermissionDenied("이 사용자는 서로이웃 정보를 공개하지 않습니다.")
 
-        neighbor_count = profile.neighbors.count()
+        neighbor_count = Neighbor.objects.filter(from_user=profile.user, status="accepted").count()
 
         return Response({"urlname": urlname, "neighbor_count": neighbor_count})
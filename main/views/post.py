@@ -8,13 +8,26 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from ..models import Post, PostText, PostImage,CustomUser,Profile
 from ..models.neighbor import Neighbor
-from django.db.models import Q
+from ..models.readReceipt import ReadReceipt
+from ..models.topicFeed import TopicFeedEntry
+from ..models.relatedPost import RelatedPost
+from ..models.tag import PostTag, parse_tags, MAX_TAGS_PER_POST
+from django.db.models import Q, Count, F, Window
+from django.db.models.functions import RowNumber
 from ..serializers import PostSerializer
+from ..serializers.fast import serialize_posts, format_datetime
+from ..utils.visibility import (
+    VIEWER_PUBLIC, get_viewer_tier, visible_posts_filter, can_view_visibility, viewer_posts_filter, is_neighbor,
+)
+from ..utils.cache import get_or_set_blog_cache
+from ..utils.pagination import parse_limit, encode_cursor, cursor_filter
 import json
 import os
+from collections import Counter
 import shutil
 from rest_framework.exceptions import MethodNotAllowed, ValidationError
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from django.utils.timezone import now, timedelta
 from pickle import FALSE
 
@@ -70,13 +83,9 @@ class PostListView(ListAPIView):
                 author=user)  # ❌ 본인 게시물 제외
 
         # ❌ 자신의 게시물(my_posts) 제외
-        from_neighbors = list(
+        neighbor_ids = set(
             Neighbor.objects.filter(from_user=user, status="accepted").values_list('to_user', flat=True)
         )
-        to_neighbors = list(
-            Neighbor.objects.filter(to_user=user, status="accepted").values_list('from_user', flat=True)
-        )
-        neighbor_ids = set(from_neighbors + to_neighbors)
         neighbor_ids.discard(user.id)  # ❌ 자신의 ID 제거
 
         mutual_neighbor_posts = Q(visibility='mutual', author_id__in=neighbor_ids)  # ✅ 서로 이웃의 'mutual' 공개 글
@@ -116,8 +125,7 @@ class PostListView(ListAPIView):
             serializer = self.get_serializer(post)
             return Response(serializer.data, status=status.HTTP_200_OK)
 
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(serialize_posts(queryset, request), status=status.HTTP_200_OK)
 
 class PostCreateView(CreateAPIView):
     permission_classes = [IsAuthenticated]
@@ -133,6 +141,7 @@ class PostCreateView(CreateAPIView):
             openapi.Parameter('subject', openapi.IN_FORM, description='주제 (네이버 제공 소주제)', type=openapi.TYPE_STRING, enum=[choice[0] for choice in Post.SUBJECT_CHOICES], required=False),
             openapi.Parameter('visibility', openapi.IN_FORM, description='공개 범위', type=openapi.TYPE_STRING, enum=['everyone', 'mutual', 'me'], required=False),
             openapi.Parameter('is_complete', openapi.IN_FORM, description='작성 상태', type=openapi.TYPE_BOOLEAN, enum=['true', 'false'], required=False),
+            openapi.Parameter('tags', openapi.IN_FORM, description=f'태그 배열 (JSON 형식 문자열 또는 "#여행 #제주", 최대 {MAX_TAGS_PER_POST}개)', type=openapi.TYPE_STRING, required=False),
             openapi.Parameter('texts', openapi.IN_FORM, description='텍스트 배열 (JSON 형식 문자열)', type=openapi.TYPE_STRING, required=False),
             openapi.Parameter('fonts', openapi.IN_FORM, description='글씨체 배열 (JSON 형식 문자열)', type=openapi.TYPE_STRING, required=False),
             openapi.Parameter('font_sizes', openapi.IN_FORM, description='글씨 크기 배열 (JSON 형식 문자열)',
@@ -168,9 +177,12 @@ class PostCreateView(CreateAPIView):
         captions = parse_json_field(request.data.get('captions'))
         is_representative_flags = parse_json_field(request.data.get('is_representative'))
         images = request.FILES.getlist('images', [])
+        tags = parse_tags(request.data.get('tags'))
 
         if not title:  # title만 필수 항목으로 유지
             return Response({"error": "title은 필수 항목입니다."}, status=400)
+        if len(tags) > MAX_TAGS_PER_POST:
+            return Response({"error": f"태그는 최대 {MAX_TAGS_PER_POST}개까지 달 수 있습니다."}, status=400)
 
         post = Post.objects.create(
             author=request.user,
@@ -182,11 +194,21 @@ class PostCreateView(CreateAPIView):
         )
 
         # 텍스트 저장 (글씨체, 크기, 굵기 포함)
+        created_texts = []
         for idx, text in enumerate(texts):
             font = fonts[idx] if idx < len(fonts) else "nanum_gothic"
             font_size = font_sizes[idx] if idx < len(font_sizes) else 15
             is_bold = is_bolds[idx] if idx < len(is_bolds) else False
-            PostText.objects.create(post=post, content=text, font=font, font_size=font_size, is_bold=is_bold)
+            created_texts.append(
+                PostText.objects.create(post=post, content=text, font=font, font_size=font_size, is_bold=is_bold)
+            )
+
+        # ✅ body 문서 동기화 (방금 만든 행으로 구성하므로 추가 조회 없음)
+        post.sync_body(texts=created_texts)
+
+        # ✅ 태그 저장
+        if tags:
+            PostTag.set_for_post(post, tags)
 
         # 이미지 저장
         created_images = []
@@ -261,8 +283,7 @@ class PostMyView(ListAPIView):
     )
     def get(self, request, *args, **kwargs):
         queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(serialize_posts(queryset, request), status=status.HTTP_200_OK)
 
 class PostMyDetailView(RetrieveAPIView):
     """
@@ -319,13 +340,9 @@ class PostMutualView(ListAPIView):
         user = self.request.user
 
         # ✅ 서로이웃 ID 리스트 가져오기
-        from_neighbors = list(
+        neighbor_ids = set(
             Neighbor.objects.filter(from_user=user, status="accepted").values_list('to_user', flat=True)
         )
-        to_neighbors = list(
-            Neighbor.objects.filter(to_user=user, status="accepted").values_list('from_user', flat=True)
-        )
-        neighbor_ids = set(from_neighbors + to_neighbors)
         neighbor_ids.discard(user.id)
 
         mutual_neighbor_posts = Q(author_id__in=neighbor_ids) & (Q(visibility='mutual') | Q(visibility='everyone'))
@@ -337,17 +354,127 @@ class PostMutualView(ListAPIView):
             mutual_neighbor_posts & Q(is_complete=True) & Q(created_at__gte=one_week_ago)
         )
 
+        per_author = self.request.query_params.get('per_author', None)
+        if per_author:
+            queryset = self.cap_per_author(queryset, per_author, self.request.query_params.get('limit', None))
+
         return queryset
 
+    @staticmethod
+    def cap_per_author(queryset, per_author, limit):
+        """
+        ✅ 작성자별 최신 per_author개까지만 남기고, 작성자들을 최신순으로 번갈아 배치
+        ROW_NUMBER() OVER (PARTITION BY author_id ORDER BY created_at DESC) 로 작성자별 순번을 매긴 뒤
+        (순번, 작성일 역순)으로 정렬 → 각 작성자의 1번째 글들이 먼저, 그다음 2번째 글들... 순서
+        """
+        try:
+            per_author = int(per_author)
+            limit = int(limit) if limit else 20
+        except ValueError:
+            raise ValidationError("per_author와 limit은 정수여야 합니다.")
+
+        if per_author < 1 or not 1 <= limit <= 100:
+            raise ValidationError("per_author는 1 이상, limit은 1~100 사이여야 합니다.")
+
+        return queryset.annotate(
+            author_rank=Window(
+                expression=RowNumber(),
+                partition_by=[F('author_id')],
+                order_by=F('created_at').desc(),
+            )
+        ).filter(author_rank__lte=per_author).order_by('author_rank', '-created_at')[:limit]
+
     @swagger_auto_schema(
         operation_summary="서로 이웃 게시물 목록",
-        operation_description="최근 1주일 내 작성된 서로 이웃 공개 게시물을 조회합니다.",
+        operation_description="최근 1주일 내 작성된 서로 이웃 공개 게시물을 조회합니다. "
+                              "각 게시물에는 내가 아직 읽지 않았는지 여부(is_new)가 포함됩니다. "
+                              "per_author를 주면 작성자별 최대 per_author개까지만, 작성자를 번갈아 최신순으로 limit개 반환합니다.",
+        manual_parameters=[
+            openapi.Parameter('per_author', openapi.IN_QUERY, description="작성자별 최대 게시물 수", required=False, type=openapi.TYPE_INTEGER),
+            openapi.Parameter('limit', openapi.IN_QUERY, description="반환할 게시물 수 (per_author 사용 시, 기본 20, 최대 100)", required=False, type=openapi.TYPE_INTEGER),
+        ],
         responses={200: PostSerializer(many=True)}
     )
     def list(self, request, *args, **kwargs):
         queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        data = serialize_posts(queryset, request)
+
+        # ✅ 읽음 비트맵을 한 번만 불러와서 메모리에서 "새 글" 여부 판단
+        read_bitmap = ReadReceipt.load(request.user, [post['id'] for post in data])
+        for post in data:
+            post['is_new'] = post['id'] not in read_bitmap
+
+        return Response(data, status=status.HTTP_200_OK)
+
+
+class PostMutualUnreadCountView(PostMutualView):
+    """
+    서로 이웃 새글 목록 중 아직 읽지 않은 게시물 개수
+    """
+
+    @swagger_auto_schema(
+        operation_summary="서로 이웃 새글 중 안 읽은 개수",
+        operation_description="최근 1주일 내 서로 이웃 게시물 중 아직 읽지 않은 게시물 개수를 반환합니다.",
+        responses={200: openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "unread_count": openapi.Schema(type=openapi.TYPE_INTEGER, description="안 읽은 게시물 개수"),
+            }
+        )}
+    )
+    def list(self, request, *args, **kwargs):
+        post_ids = list(self.get_queryset().values_list('id', flat=True))
+        unread_count = ReadReceipt.load(request.user, post_ids).count_missing(post_ids)
+        return Response({"unread_count": unread_count}, status=status.HTTP_200_OK)
+
+
+MAX_READ_POST_IDS = 500  # ✅ 한 번에 읽음 처리할 수 있는 게시물 수
+MAX_POST_ID = 2 ** 31 - 1  # ✅ 읽음 기록 청크 번호(PositiveIntegerField)에 들어갈 수 있는 게시물 ID 상한
+
+
+def parse_post_ids(value):
+    """ ✅ post_ids 요청 값 검증 (1 ~ MAX_POST_ID 정수 배열, 최대 MAX_READ_POST_IDS개), 잘못되면 ValidationError """
+    if not isinstance(value, list):
+        raise ValidationError("post_ids는 게시물 ID 배열이어야 합니다.")
+    if len(value) > MAX_READ_POST_IDS:
+        raise ValidationError(f"post_ids는 한 번에 {MAX_READ_POST_IDS}개까지 보낼 수 있습니다.")
+    try:
+        post_ids = [int(post_id) for post_id in value]
+    except (TypeError, ValueError):
+        raise ValidationError("post_ids는 게시물 ID 배열이어야 합니다.")
+    if any(not 1 <= post_id <= MAX_POST_ID for post_id in post_ids):
+        raise ValidationError(f"게시물 ID는 1~{MAX_POST_ID} 사이여야 합니다.")
+    return post_ids
+
+
+class PostReadView(APIView):
+    """
+    여러 게시물을 한 번에 읽음 처리하는 API
+    """
+    permission_classes = [IsAuthenticated]
+    parser_classes = [JSONParser]
+
+    @swagger_auto_schema(
+        operation_summary="게시물 읽음 처리 (여러 개)",
+        operation_description=f"post_ids 목록(최대 {MAX_READ_POST_IDS}개)의 게시물을 현재 사용자 기준으로 읽음 처리합니다.",
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "post_ids": openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Items(type=openapi.TYPE_INTEGER)),
+            },
+            required=["post_ids"]
+        ),
+        responses={200: openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "marked": openapi.Schema(type=openapi.TYPE_INTEGER, description="새로 읽음 처리된 게시물 개수"),
+            }
+        )}
+    )
+    def post(self, request, *args, **kwargs):
+        post_ids = parse_post_ids(request.data.get('post_ids'))
+        marked = ReadReceipt.mark_read(request.user, post_ids)
+        return Response({"marked": marked}, status=status.HTTP_200_OK)
 
 class PostDetailView(RetrieveAPIView):
     """
@@ -362,14 +489,9 @@ class PostDetailView(RetrieveAPIView):
         user = self.request.user
 
         # ✅ 서로이웃 ID 리스트 가져오기
-        from_neighbors = list(
+        neighbor_ids = set(
             Neighbor.objects.filter(from_user=user, status="accepted").values_list('to_user', flat=True)
         )
-        to_neighbors = list(
-            Neighbor.objects.filter(to_user=user, status="accepted").values_list('from_user', flat=True)
-        )
-
-        neighbor_ids = set(from_neighbors + to_neighbors)
         neighbor_ids.discard(user.id)  # ❌ 본인 ID 제외
 
         mutual_neighbor_posts = Q(visibility='mutual', author_id__in=neighbor_ids)  # ✅ 서로 이웃 게시물
@@ -388,7 +510,10 @@ class PostDetailView(RetrieveAPIView):
         responses={200: PostSerializer()},
     )
     def get(self, request, *args, **kwargs):
-        return super().get(request, *args, **kwargs)
+        response = super().get(request, *args, **kwargs)
+        if request.user.is_authenticated:
+            ReadReceipt.mark_read(request.user, [response.data['id']])  # ✅ 상세 조회한 게시물은 읽음 처리
+        return response
 
 class PostManageView(UpdateAPIView, DestroyAPIView):
     permission_classes = [IsAuthenticated]
@@ -422,6 +547,8 @@ class PostManageView(UpdateAPIView, DestroyAPIView):
             openapi.Parameter('is_complete', openapi.IN_FORM,
                               description='작성 상태 (true: 작성 완료, false: 임시 저장 → 변경 가능, 단 true → false 변경 불가)',
                               type=openapi.TYPE_BOOLEAN, required=False),
+            openapi.Parameter('tags', openapi.IN_FORM, description=f'태그 배열 (보내면 기존 태그를 교체, 최대 {MAX_TAGS_PER_POST}개)',
+                              type=openapi.TYPE_STRING, required=False),
             openapi.Parameter('update_texts', openapi.IN_FORM, description='수정할 텍스트 ID 목록 (JSON 형식)',
                               type=openapi.TYPE_STRING, required=False),
             openapi.Parameter('remove_texts', openapi.IN_FORM, description='삭제할 텍스트 ID 목록 (JSON 형식)',
@@ -460,6 +587,11 @@ class PostManageView(UpdateAPIView, DestroyAPIView):
                 return Response({"error": "작성 완료된 게시물은 다시 임시 저장 상태로 변경할 수 없습니다."}, status=400)
             instance.is_complete = new_is_complete  # ✅ Boolean 값 저장
 
+        # ✅ 태그는 보낸 경우에만 교체
+        tags = parse_tags(request.data.get('tags')) if 'tags' in request.data else None
+        if tags is not None and len(tags) > MAX_TAGS_PER_POST:
+            return Response({"error": f"태그는 최대 {MAX_TAGS_PER_POST}개까지 달 수 있습니다."}, status=400)
+
         # ✅ visibility 검증도 serializer에서 자동으로 처리됨 → 별도 검증 삭제
         instance.visibility = request.data.get('visibility', instance.visibility)
 
@@ -520,6 +652,13 @@ class PostManageView(UpdateAPIView, DestroyAPIView):
                     is_bold=updated_is_bolds[idx] if idx < len(updated_is_bolds) else False,  # 기본값: False
                 )
 
+        # ✅ 텍스트 변경 사항을 body 문서에 반영
+        if remove_text_ids or update_text_ids or updated_contents:
+            instance.sync_body()
+
+        if tags is not None:
+            PostTag.set_for_post(instance, tags)
+
         # ✅ 이미지 관련 데이터 가져오기
         images = request.FILES.getlist('images')  # 새로 업로드된 이미지 파일 리스트
         captions = parse_json_data('captions')  # 캡션 배열 (id 없음)
@@ -668,8 +807,7 @@ class PostMyCurrentView(ListAPIView):
     )
     def get(self, request, *args, **kwargs):
         queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(serialize_posts(queryset, request), status=status.HTTP_200_OK)
 
 class PostPublicCurrentView(ListAPIView):
     """
@@ -694,10 +832,7 @@ class PostPublicCurrentView(ListAPIView):
             return Post.objects.filter(author=blog_owner, is_complete=True).order_by("-created_at")[:5]
 
         # ✅ 서로이웃 여부 확인
-        is_mutual = Neighbor.objects.filter(
-            (Q(from_user=viewer, to_user=blog_owner) | Q(from_user=blog_owner, to_user=viewer)),
-            status="accepted"
-        ).exists()
+        is_mutual = is_neighbor(viewer, blog_owner)
 
         # ✅ 공개 범위 조건 설정
         if is_mutual:
@@ -720,8 +855,7 @@ class PostPublicCurrentView(ListAPIView):
     )
     def get(self, request, *args, **kwargs):
         queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(serialize_posts(queryset, request), status=status.HTTP_200_OK)
 
 
 class PostCountView(APIView):
@@ -764,14 +898,10 @@ class PostCountView(APIView):
             return Response({"urlname": urlname, "post_count": post_count})
 
         # ✅ 서로이웃 관계 확인
-        is_neighbor = Neighbor.objects.filter(
-            (Q(from_user=current_user, to_user=blog_owner) |
-             Q(from_user=blog_owner, to_user=current_user)),
-            status="accepted"
-        ).exists()
+        is_mutual = is_neighbor(current_user, blog_owner)
 
         # ✅ 서로이웃이면 '전체 공개 + 서로이웃 공개' 게시물 개수 반환
-        if is_neighbor:
+        if is_mutual:
             post_count = Post.objects.filter(
                 author=blog_owner,
                 is_complete=True,
@@ -786,3 +916,241 @@ class PostCountView(APIView):
             ).count()
 
         return Response({"urlname": urlname, "post_count": post_count})
+
+
+class PostCategoryListView(APIView):
+    """
+    특정 사용자의 블로그 카테고리 목록과 카테고리별 게시물 개수를 반환하는 API (사이드바용)
+    ✅ 조회자 등급(본인 / 서로이웃 / 그 외)에 맞는 게시물만 GROUP BY 한 번으로 집계
+    ✅ 결과는 (블로그, 등급) 단위로 캐시되고, 게시물 생성/수정/삭제 시 무효화됨
+    """
+    permission_classes = [AllowAny]
+
+    @swagger_auto_schema(
+        operation_summary="블로그 카테고리 목록 조회",
+        operation_description="특정 사용자의 블로그에서 카테고리별 게시물 개수를 반환합니다. "
+                              "조회자가 본인인지, 서로이웃인지에 따라 집계 대상 공개 범위가 달라집니다.",
+        responses={200: openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "urlname": openapi.Schema(type=openapi.TYPE_STRING),
+                "categories": openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Schema(
+                        type=openapi.TYPE_OBJECT,
+                        properties={
+                            "category": openapi.Schema(type=openapi.TYPE_STRING, description="카테고리"),
+                            "post_count": openapi.Schema(type=openapi.TYPE_INTEGER, description="게시물 개수"),
+                        }
+                    )
+                ),
+            }
+        )}
+    )
+    def get(self, request, urlname, *args, **kwargs):
+        profile = get_object_or_404(Profile.objects.select_related('user'), urlname=urlname)
+        blog_owner_id = profile.user_id
+        tier = get_viewer_tier(request.user, profile.user)
+
+        def count_categories():
+            return list(
+                Post.objects.filter(visible_posts_filter(tier), author_id=blog_owner_id, is_complete=True)
+                .values('category')
+                .annotate(post_count=Count('id'))
+                .order_by('category')
+            )
+
+        categories = get_or_set_blog_cache(blog_owner_id, 'categories', tier, count_categories)
+        return Response({"urlname": urlname, "categories": categories})
+
+
+class PostArchiveView(APIView):
+    """
+    특정 사용자의 블로그 월별 아카이브(연/월별 게시물 개수)를 반환하는 API
+    ✅ (author, is_complete, created_at) 인덱스로 작성일만 읽고, 월은 현재 시간대로 변환해서 메모리에서 집계
+       (MySQL에 시간대 테이블이 없으면 USE_TZ에서 TruncMonth(CONVERT_TZ)가 NULL이 되므로 DB 변환을 쓰지 않음)
+    ✅ 결과는 (블로그, 조회자 등급) 단위로 캐시되고, 게시물 생성/수정/삭제 시 무효화됨
+    """
+    permission_classes = [AllowAny]
+
+    @swagger_auto_schema(
+        operation_summary="블로그 월별 아카이브 조회",
+        operation_description="특정 사용자의 블로그에서 연도/월별 게시물 개수를 최신순으로 반환합니다. "
+                              "조회자가 본인인지, 서로이웃인지에 따라 집계 대상 공개 범위가 달라집니다.",
+        responses={200: openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "urlname": openapi.Schema(type=openapi.TYPE_STRING),
+                "archive": openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Schema(
+                        type=openapi.TYPE_OBJECT,
+                        properties={
+                            "year": openapi.Schema(type=openapi.TYPE_INTEGER, description="연도"),
+                            "month": openapi.Schema(type=openapi.TYPE_INTEGER, description="월"),
+                            "post_count": openapi.Schema(type=openapi.TYPE_INTEGER, description="게시물 개수"),
+                        }
+                    )
+                ),
+            }
+        )}
+    )
+    def get(self, request, urlname, *args, **kwargs):
+        profile = get_object_or_404(Profile.objects.select_related('user'), urlname=urlname)
+        blog_owner_id = profile.user_id
+        tier = get_viewer_tier(request.user, profile.user)
+
+        def count_by_month():
+            created = (
+                Post.objects.filter(visible_posts_filter(tier), author_id=blog_owner_id, is_complete=True)
+                .values_list('created_at', flat=True)
+            )
+            counts = Counter()
+            for created_at in created.iterator():
+                local = timezone.localtime(created_at)
+                counts[(local.year, local.month)] += 1
+            return [
+                {"year": year, "month": month, "post_count": post_count}
+                for (year, month), post_count in sorted(counts.items(), reverse=True)
+            ]
+
+        archive = get_or_set_blog_cache(blog_owner_id, 'archive', tier, count_by_month)
+        return Response({"urlname": urlname, "archive": archive})
+
+
+class PostTopicFeedView(APIView):
+    """
+    주제(keyword 또는 subject)별 최신 글 피드 API
+    ✅ 미리 계산해 둔 TopicFeedEntry에서 (작성일, ID) 내림차순으로 커서 페이지네이션
+    ✅ 작성 완료된 '전체 공개' 글만 포함, 로그인한 경우 본인 글은 제외
+    ✅ 쿼리: 피드 1번 + 게시물 직렬화 2~3번
+    """
+    permission_classes = [AllowAny]
+
+    @swagger_auto_schema(
+        operation_summary="주제별 최신 글 피드",
+        operation_description="keyword 또는 subject 중 하나로 주제를 지정하면 해당 주제의 전체 공개 글을 최신순으로 반환합니다. "
+                              "다음 페이지는 응답의 next_cursor를 cursor로 넘겨 조회합니다.",
+        manual_parameters=[
+            openapi.Parameter('keyword', openapi.IN_QUERY, description="주제 키워드", required=False,
+                              type=openapi.TYPE_STRING, enum=[choice[0] for choice in Post.KEYWORD_CHOICES]),
+            openapi.Parameter('subject', openapi.IN_QUERY, description="소주제", required=False,
+                              type=openapi.TYPE_STRING, enum=[choice[0] for choice in Post.SUBJECT_CHOICES]),
+            openapi.Parameter('cursor', openapi.IN_QUERY, description="이전 응답의 next_cursor", required=False,
+                              type=openapi.TYPE_STRING),
+            openapi.Parameter('limit', openapi.IN_QUERY, description="페이지 크기 (기본 20, 최대 50)", required=False,
+                              type=openapi.TYPE_INTEGER),
+        ],
+        responses={200: openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "results": openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Items(type=openapi.TYPE_OBJECT),
+                                          description="PostSerializer와 같은 형태"),
+                "next_cursor": openapi.Schema(type=openapi.TYPE_STRING, description="다음 페이지 커서 (마지막이면 null)"),
+            }
+        )}
+    )
+    def get(self, request, *args, **kwargs):
+        keyword = request.query_params.get('keyword')
+        subject = request.query_params.get('subject')
+
+        # ✅ keyword, subject 중 정확히 하나만 허용
+        if bool(keyword) == bool(subject):
+            raise ValidationError("keyword 또는 subject 중 하나만 입력해야 합니다.")
+        if keyword:
+            kind, topic, choices = TopicFeedEntry.KIND_KEYWORD, keyword, Post.KEYWORD_CHOICES
+        else:
+            kind, topic, choices = TopicFeedEntry.KIND_SUBJECT, subject, Post.SUBJECT_CHOICES
+        if topic not in dict(choices):
+            raise ValidationError(f"'{topic}'은(는) 유효하지 않은 {kind} 값입니다.")
+
+        limit = parse_limit(request.query_params.get('limit'), maximum=50)
+
+        entries = TopicFeedEntry.objects.filter(
+            cursor_filter(request.query_params.get('cursor'), pk_field='post_id'), kind=kind, topic=topic,
+        )
+        if request.user.is_authenticated:
+            entries = entries.exclude(author=request.user)  # ❌ 본인 게시물 제외
+        entries = list(entries.order_by('-created_at', '-post_id').values_list('post_id', 'created_at')[:limit + 1])
+
+        page = entries[:limit]
+        posts = Post.objects.filter(id__in=[post_id for post_id, _ in page])
+        posts = {post['id']: post for post in serialize_posts(posts, request)}
+        next_cursor = encode_cursor(page[-1][1], page[-1][0]) if len(entries) > limit else None
+
+        return Response({
+            "results": [posts[post_id] for post_id, _ in page if post_id in posts],
+            "next_cursor": next_cursor,
+        }, status=status.HTTP_200_OK)
+
+
+class PostRelatedView(APIView):
+    """
+    관련 글 조회 API
+    ✅ build_related_posts 배치 작업이 미리 계산한 RelatedPost를 (post, rank) 인덱스로 한 번에 조회
+    ✅ 관련 글은 조회자가 볼 수 있는 글만 반환 (전체 공개 + 본인 글 + 서로이웃의 '서로 이웃 공개' 글)
+    """
+    permission_classes = [AllowAny]
+
+    @swagger_auto_schema(
+        operation_summary="관련 글 조회",
+        operation_description="게시물 제목/본문이 비슷한 글을 유사도 순으로 반환합니다. 관련 글은 주기적인 배치 작업으로 갱신됩니다.",
+        manual_parameters=[
+            openapi.Parameter('limit', openapi.IN_QUERY, description="반환할 관련 글 수 (기본 5, 최대 10)",
+                              required=False, type=openapi.TYPE_INTEGER),
+        ],
+        responses={
+            200: openapi.Schema(
+                type=openapi.TYPE_OBJECT,
+                properties={
+                    "post_id": openapi.Schema(type=openapi.TYPE_INTEGER),
+                    "related": openapi.Schema(
+                        type=openapi.TYPE_ARRAY,
+                        items=openapi.Schema(
+                            type=openapi.TYPE_OBJECT,
+                            properties={
+                                "id": openapi.Schema(type=openapi.TYPE_INTEGER, description="게시물 ID"),
+                                "title": openapi.Schema(type=openapi.TYPE_STRING, description="제목"),
+                                "author_name": openapi.Schema(type=openapi.TYPE_STRING, description="작성자 이름"),
+                                "urlname": openapi.Schema(type=openapi.TYPE_STRING, description="작성자 URL 이름"),
+                                "subject": openapi.Schema(type=openapi.TYPE_STRING, description="주제"),
+                                "created_at": openapi.Schema(type=openapi.TYPE_STRING, format="date-time"),
+                                "score": openapi.Schema(type=openapi.TYPE_NUMBER, description="유사도 (0~1)"),
+                            }
+                        )
+                    ),
+                }
+            ),
+            403: openapi.Response(description="조회 권한이 없습니다."),
+            404: openapi.Response(description="게시글을 찾을 수 없습니다."),
+        }
+    )
+    def get(self, request, post_id, *args, **kwargs):
+        limit = parse_limit(request.query_params.get('limit'), default=5, maximum=10)
+
+        post = get_object_or_404(Post.objects.only('id', 'author_id', 'visibility'), id=post_id, is_complete=True)
+        tier = VIEWER_PUBLIC if post.visibility == 'everyone' else get_viewer_tier(request.user, post.author_id)
+        if not can_view_visibility(tier, post.visibility):
+            return Response({"error": "이 게시글을 조회할 권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
+
+        rows = RelatedPost.objects.filter(
+            viewer_posts_filter(request.user, prefix='related__'),
+            post_id=post.id, related__is_complete=True,
+        ).order_by('rank').values(
+            'related_id', 'related__title', 'related__author__profile__username',
+            'related__author__profile__urlname', 'related__subject', 'related__created_at', 'score',
+        )[:limit]
+
+        related = [
+            {
+                "id": row['related_id'],
+                "title": row['related__title'],
+                "author_name": row['related__author__profile__username'],
+                "urlname": row['related__author__profile__urlname'],
+                "subject": row['related__subject'],
+                "created_at": format_datetime(row['related__created_at']),
+                "score": round(row['score'], 4),
+            }
+            for row in rows
+        ]
+        return Response({"post_id": post.id, "related": related}, status=status.HTTP_200_OK)
@@ -13,7 +13,6 @@ from rest_framework.response import Response
 from ..models.profile import Profile
 from main.models.neighbor import Neighbor
 from ..serializers.profile import ProfileSerializer,UrlnameUpdateSerializer
-from django.db.models import Q
 from rest_framework.exceptions import ValidationError
 
 
@@ -201,11 +200,7 @@ class ProfilePublicView(RetrieveAPIView):
         # ✅ 현재 로그인한 사용자가 서로이웃인지 확인 (status="accepted"인 경우만 체크)
         is_neighbor = False
         if request.user.is_authenticated:
-            is_neighbor = Neighbor.objects.filter(
-                (Q(from_user=request.user, to_user=profile.user) |
-                 Q(from_user=profile.user, to_user=request.user)),
-                status="accepted"
-            ).exists()
+            is_neighbor = Neighbor.objects.filter(from_user=request.user, to_user=profile.user, status="accepted").exists()
 
         response_data = serializer.data
         response_data["is_neighbor"] = is_neighbor  # ✅ 서로이웃 여부 추가
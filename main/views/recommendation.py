@@ -0,0 +1,65 @@
+from django.db.models import Exists, OuterRef
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from rest_framework import status
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+
+from ..models.blogRecommendation import BlogRecommendation
+from ..models.neighbor import Neighbor
+from ..utils.pagination import parse_limit
+from ..serializers.fast import file_url
+
+
+class BlogRecommendationView(APIView):
+    """
+    추천 블로그 조회 API
+    - build_blog_recommendations 배치 작업이 미리 계산한 결과를 (user, rank) 인덱스로 한 번에 조회
+    - 배치 이후 서로이웃이 된 블로그는 같은 쿼리 안에서 제외
+    """
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_summary="추천 블로그 조회",
+        operation_description="함께 아는 서로이웃과 관심 주제를 기준으로 계산한 추천 블로그를 점수 순으로 반환합니다.",
+        manual_parameters=[
+            openapi.Parameter('limit', openapi.IN_QUERY, description="반환할 블로그 수 (기본 10, 최대 20)",
+                              required=False, type=openapi.TYPE_INTEGER),
+        ],
+        responses={200: openapi.Schema(
+            type=openapi.TYPE_ARRAY,
+            items=openapi.Schema(
+                type=openapi.TYPE_OBJECT,
+                properties={
+                    "urlname": openapi.Schema(type=openapi.TYPE_STRING, description="블로그 URL 이름"),
+                    "blog_name": openapi.Schema(type=openapi.TYPE_STRING, description="블로그 이름"),
+                    "username": openapi.Schema(type=openapi.TYPE_STRING, description="사용자 이름"),
+                    "user_pic": openapi.Schema(type=openapi.TYPE_STRING, format="url", description="프로필 사진 URL"),
+                    "mutual_count": openapi.Schema(type=openapi.TYPE_INTEGER, description="함께 아는 서로이웃 수"),
+                    "score": openapi.Schema(type=openapi.TYPE_NUMBER, description="추천 점수 (0~1)"),
+                }
+            )
+        )}
+    )
+    def get(self, request, *args, **kwargs):
+        limit = parse_limit(request.query_params.get('limit'), default=10, maximum=20)
+        user = request.user
+
+        already_neighbor = Neighbor.objects.filter(from_user=user, to_user=OuterRef('recommended'), status="accepted")
+        rows = BlogRecommendation.objects.filter(user=user).exclude(Exists(already_neighbor)).order_by('rank').values(
+            'recommended__profile__urlname', 'recommended__profile__blog_name', 'recommended__profile__username',
+            'recommended__profile__user_pic', 'mutual_count', 'score',
+        )[:limit]
+
+        return Response([
+            {
+                "urlname": row['recommended__profile__urlname'],
+                "blog_name": row['recommended__profile__blog_name'],
+                "username": row['recommended__profile__username'],
+                "user_pic": file_url(row['recommended__profile__user_pic'], request),
+                "mutual_count": row['mutual_count'],
+                "score": round(row['score'], 4),
+            }
+            for row in rows
+        ], status=status.HTTP_200_OK)
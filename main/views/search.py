@@ -8,31 +8,35 @@ from drf_yasg import openapi
 from ..models.post import Post, PostText, PostImage  # 🔹 PostImage 추가
 from ..models.profile import Profile
 from ..serializers.search import PostSearchSerializer
-
-
-def is_mutual_friend(user, author):
-    """
-    사용자가 게시글 작성자와 서로 이웃인지 확인하는 함수.
-    소셜 관계 구현 방식에 따라 이 부분을 수정해야 할 수도 있음.
-    """
-    if not user.is_authenticated:
-        return False  # 로그인하지 않은 사용자는 서로 이웃이 아님
-
-    return user.following.filter(id=author.id).exists()  # 'following' 필드는 예시
-
-
-def get_excerpt(text, keyword, context_length=30):
-    """
-    본문에서 키워드 앞뒤 지정된 길이(context_length)만큼을 포함한 발췌(excerpt) 반환
-    """
-    keyword_index = text.lower().find(keyword.lower())
-    if keyword_index == -1:
-        return text[:context_length * 2]  # 키워드가 없으면 앞부분 일부 반환
-
-    start = max(0, keyword_index - context_length)
-    end = min(len(text), keyword_index + len(keyword) + context_length)
-
-    return text[start:end] + ("..." if end < len(text) else "")
+from ..search.query import match_posts, parse_query
+from ..search.ranking import score_posts, top_page
+from ..search.facets import parse_facet_filters, date_filter, apply_facets, filters_key
+from ..search.snippets import build_snippets
+from ..search.autocomplete import autocomplete
+from ..search.trigrams import similar_profiles
+from ..search.cache import get_or_set_search_cache, POSTS, PROFILES
+from ..serializers.fast import file_url
+from ..utils.pagination import parse_limit, encode_score_cursor, decode_score_cursor
+from ..utils.visibility import get_viewer_tier, visible_posts_filter
+from ..utils.hangul import chosung_key
+
+SEARCH_QUERY_DESCRIPTION = '검색어 (공백: AND, OR 또는 |: OR, "구문": 구문 그대로, -검색어: 제외)'
+FACET_PARAMETERS = [
+    openapi.Parameter('keyword', openapi.IN_QUERY, description="주제 키워드 필터", type=openapi.TYPE_STRING,
+                      enum=[choice[0] for choice in Post.KEYWORD_CHOICES]),
+    openapi.Parameter('subject', openapi.IN_QUERY, description="주제 필터", type=openapi.TYPE_STRING,
+                      enum=[choice[0] for choice in Post.SUBJECT_CHOICES]),
+    openapi.Parameter('month', openapi.IN_QUERY, description="작성 월 필터 (YYYY-MM)", type=openapi.TYPE_STRING),
+    openapi.Parameter('date_from', openapi.IN_QUERY, description="작성일 시작 (YYYY-MM-DD, 포함)", type=openapi.TYPE_STRING),
+    openapi.Parameter('date_to', openapi.IN_QUERY, description="작성일 끝 (YYYY-MM-DD, 포함)", type=openapi.TYPE_STRING),
+]
+FACETS_SCHEMA = openapi.Schema(type=openapi.TYPE_OBJECT, description="keyword / subject / month별 [{value, count}] (각 패싯은 자기 필터만 빼고 계산)")
+
+
+def in_id_order(queryset, ids):
+    """ ✅ 캐시된 ID 목록 → 같은 순서의 객체 목록 (조회 1번, 그 사이 삭제된 객체는 제외) """
+    objects = queryset.in_bulk(ids)
+    return [objects[object_id] for object_id in ids if object_id in objects]
 
 
 class BlogPostSearchView(APIView):
@@ -47,7 +51,8 @@ class BlogPostSearchView(APIView):
         manual_parameters=[
             openapi.Parameter('urlname', openapi.IN_QUERY, description="블로그 식별자 (사용자 프로필 URL 식별자)",
                               type=openapi.TYPE_STRING, required=True),
-            openapi.Parameter('q', openapi.IN_QUERY, description="검색어", type=openapi.TYPE_STRING, required=True),
+            openapi.Parameter('q', openapi.IN_QUERY, description=SEARCH_QUERY_DESCRIPTION, type=openapi.TYPE_STRING, required=True),
+            *FACET_PARAMETERS,
         ],
         responses={200: PostSearchSerializer(many=True)}
     )
@@ -61,61 +66,44 @@ class BlogPostSearchView(APIView):
         if not search_keyword or len(search_keyword) < 2:
             return Response({"error": "검색어는 2글자 이상 입력해주세요."}, status=400)
 
-        # 🔹 urlname을 통해 해당 블로그(사용자) 찾기
-        try:
-            blog_owner = Profile.objects.get(urlname=urlname).user  # Profile 모델에서 사용자 찾기
-        except Profile.DoesNotExist:
+        # 🔹 urlname을 통해 해당 블로그 주인 ID 찾기
+        blog_owner_id = Profile.objects.filter(urlname=urlname).values_list('user_id', flat=True).first()
+        if blog_owner_id is None:
             return Response({"error": "해당 urlname에 해당하는 블로그가 없습니다."}, status=404)
 
-        user = request.user  # 현재 검색을 요청한 사용자
-
-        # 🔹 제목 검색 (나만 보기, 서로 이웃 필터링)
-        title_matches = Post.objects.filter(
-            Q(title__icontains=search_keyword) & Q(author=blog_owner) & ~Q(visibility='me')
+        # 🔹 검색한 사용자와 블로그 주인의 관계는 한 번만 계산해서, 볼 수 있는 공개 범위를 SQL 조건으로 적용
+        tier = get_viewer_tier(request.user, blog_owner_id)
+        post_filter = Q(post__author_id=blog_owner_id) & ~Q(post__visibility='me') & visible_posts_filter(tier, 'post__')
+        filters = parse_facet_filters(request.GET)
+        post_filter &= date_filter(filters, 'post__')
+
+        # 🔹 제목/본문/이미지 캡션 검색 (검색어 조합은 가장 드문 검색어부터 평가, 검색 색인 후보 안에서만 원문 확인)
+        # 🔹 주제 키워드/주제/작성 월 필터와 패싯 개수는 검색 결과에 한 번에 적용 (패싯마다 자기 필터는 빼고 셈)
+        matched_post_ids, facets = apply_facets(match_posts(search_keyword, post_filter), filters)
+
+        # 🔹 검색된 게시물 / 대표 이미지는 각각 한 번에 조회 (결과 수와 관계없이 쿼리 수 일정)
+        posts = Post.objects.filter(id__in=matched_post_ids).values('id', 'title', 'created_at')
+        thumbnails = dict(
+            PostImage.objects.filter(post_id__in=matched_post_ids, is_representative=True)
+            .order_by('-id').values_list('post_id', 'image')
         )
 
-        # 🔹 본문 검색 (나만 보기, 서로 이웃 필터링)
-        content_matches = PostText.objects.filter(
-            Q(content__icontains=search_keyword) & Q(post__author=blog_owner) & ~Q(post__visibility='me')
-        ).select_related('post')
-
-        # 🔹 이미지 캡션 검색 (나만 보기, 서로 이웃 필터링)
-        caption_matches = PostImage.objects.filter(
-            Q(caption__icontains=search_keyword) & Q(post__author=blog_owner) & ~Q(post__visibility='me')
-        ).select_related('post')
-
-        # 🔹 검색된 게시물 ID 저장 (중복 제거)
-        matched_post_ids = (
-            set(title_matches.values_list('id', flat=True))
-            | set(content_matches.values_list('post_id', flat=True))
-            | set(caption_matches.values_list('post_id', flat=True))  # 🔹 이미지 설명 포함
-        )
-
-        # 🔹 검색된 게시물 조회 (서로 이웃 필터링 적용)
-        posts = Post.objects.filter(id__in=matched_post_ids).prefetch_related('texts', 'images', 'author')
+        # 🔹 게시물별 미리보기는 검색어가 처음 나오는 블록의 주변만 한 번에 조회
+        snippets = build_snippets(matched_post_ids, search_keyword)
 
         results = []
         for post in posts:
-            if post.visibility == 'mutual' and not is_mutual_friend(user, post.author):
-                continue  # 서로 이웃이 아닐 경우 검색 결과에서 제외
-
-            thumbnail = post.images.filter(is_representative=True).first()
-            thumbnail_url = thumbnail.image.url if thumbnail else None
-
-            excerpt = ""
-            for text in post.texts.all():
-                if search_keyword.lower() in text.content.lower():
-                    excerpt = get_excerpt(text.content, search_keyword)
-                    break
+            snippet = snippets.get(post['id'], {})
 
             results.append({
-                "title": post.title,
-                "created_at": post.created_at.strftime("%Y-%m-%d %H:%M"),
-                "thumbnail": thumbnail_url,
-                "excerpt": excerpt,
+                "title": post['title'],
+                "created_at": post['created_at'].strftime("%Y-%m-%d %H:%M"),
+                "thumbnail": file_url(thumbnails.get(post['id'])),
+                "excerpt": snippet.get("excerpt", ""),
+                "highlights": snippet.get("highlights", []),
             })
 
-        return Response({"results": results})
+        return Response({"results": results, "facets": facets})
 
 class GlobalBlogSearchView(APIView):
     """
@@ -145,8 +133,11 @@ class GlobalBlogSearchView(APIView):
         if not search_keyword or len(search_keyword) < 2:
             return Response({"error": "검색어는 2글자 이상 입력해주세요."}, status=400)
 
-        # 🔹 `blog_name`을 기준으로 검색
-        blog_matches = Profile.objects.filter(Q(blog_name__icontains=search_keyword))
+        # 🔹 `blog_name`을 기준으로 검색 (결과 ID 목록은 검색어별로 캐시)
+        blog_ids = get_or_set_search_cache(PROFILES, 'blog', search_keyword, lambda: list(
+            Profile.objects.filter(Q(blog_name__icontains=search_keyword)).order_by('id').values_list('id', flat=True)
+        ))
+        blog_matches = in_id_order(Profile.objects.select_related('user'), blog_ids)
 
         results = [
             {
@@ -167,14 +158,21 @@ class GlobalNickAndIdSearchView(APIView):
     - urlname이 정확히 일치하는 사용자가 있다면 최상단에 위치
     - username이 검색어를 포함하는 사용자는 그 아래에 리스트 형태로 제공
     - urlname과 username이 같은 경우 중복 방지
+    - mode=fuzzy: trigram 색인으로 오타/띄어쓰기가 다른 사용자명, 블로그 이름, 블로그 ID까지 유사도 순으로 검색 (페이지 단위)
+    - mode=chosung: 초성("ㅎㄱㄷ" → 홍길동)으로 사용자명, 블로그 이름을 접두어 검색 (페이지 단위)
     """
     permission_classes = [IsAuthenticatedOrReadOnly]
 
     @swagger_auto_schema(
         operation_summary="사용자명, 블로그 url 검색(전체)",
-        operation_description="사용자명(username) 또는 블로그 ID(urlname)을 검색합니다.",
+        operation_description="사용자명(username) 또는 블로그 ID(urlname)을 검색합니다. mode=fuzzy이면 오타를 허용해서 유사도 순으로, "
+                              "mode=chosung이면 초성으로 시작하는 사용자명/블로그 이름을 검색합니다.",
         manual_parameters=[
             openapi.Parameter('q', openapi.IN_QUERY, description="검색할 사용자명 또는 블로그 ID", type=openapi.TYPE_STRING, required=True),
+            openapi.Parameter('mode', openapi.IN_QUERY, description="exact(기본), fuzzy 또는 chosung", type=openapi.TYPE_STRING,
+                              enum=['exact', 'fuzzy', 'chosung']),
+            openapi.Parameter('page', openapi.IN_QUERY, description="fuzzy/chosung 모드 페이지 번호 (기본 1)", type=openapi.TYPE_INTEGER),
+            openapi.Parameter('limit', openapi.IN_QUERY, description="fuzzy/chosung 모드 페이지 크기 (기본 20, 최대 50)", type=openapi.TYPE_INTEGER),
         ],
         responses={200: openapi.Schema(
             type=openapi.TYPE_OBJECT,
@@ -192,42 +190,155 @@ class GlobalNickAndIdSearchView(APIView):
         if not search_keyword or len(search_keyword) < 2:
             return Response({"error": "검색어는 2글자 이상 입력해주세요."}, status=400)
 
-        results = []
-        urlname_matched_user_id = None  # 중복 방지용 변수
+        mode = request.GET.get('mode', 'exact')
+        if mode in ('fuzzy', 'chosung'):
+            try:
+                page = int(request.GET.get('page', 1))
+            except ValueError:
+                page = 0
+            if page < 1:
+                return Response({"error": "page는 1 이상의 정수여야 합니다."}, status=400)
+            limit = parse_limit(request.GET.get('limit'), default=20, maximum=50)
+            search = self.fuzzy_search if mode == 'fuzzy' else self.chosung_search
+            return search(search_keyword, page, limit)
+        if mode != 'exact':
+            return Response({"error": "mode는 exact, fuzzy, chosung 중 하나여야 합니다."}, status=400)
+
+        # 🔹 결과 ID 목록(urlname 일치 → username 포함 순)은 검색어별로 캐시, 프로필은 한 번에 조회
+        profile_ids = get_or_set_search_cache(
+            PROFILES, 'nickandid', search_keyword, lambda: self.matching_profile_ids(search_keyword))
 
-        # 🔹 1. `urlname`이 정확히 일치하는 사용자 찾기 (중복 불가)
-        try:
-            exact_match = Profile.objects.get(urlname=search_keyword)
-            results.append({
-                "username": exact_match.username,  # ✅ Profile.username 사용
-                "urlname": exact_match.urlname,
-                "blog_name": exact_match.blog_name,
-                "intro": exact_match.intro,
-                "user_pic": exact_match.user_pic.url if exact_match.user_pic else None
-            })
-            urlname_matched_user_id = exact_match.id  # 🔹 해당 사용자의 ID 저장 (중복 방지)
-        except Profile.DoesNotExist:
-            pass  # 정확히 일치하는 `urlname`이 없을 경우 아무것도 하지 않음
+        results = [
+            {
+                "username": profile.username,  # ✅ Profile.username 사용
+                "urlname": profile.urlname,
+                "blog_name": profile.blog_name,
+                "intro": profile.intro,
+                "user_pic": profile.user_pic.url if profile.user_pic else None
+            }
+            for profile in in_id_order(Profile.objects.all(), profile_ids)
+        ]
+
+        return Response({"users": results})
+
+    @staticmethod
+    def matching_profile_ids(search_keyword):
+        profile_ids = []
+
+        # 🔹 1. `urlname`이 정확히 일치하는 사용자 (중복 불가)
+        exact_match_id = Profile.objects.filter(urlname=search_keyword).values_list('id', flat=True).first()
+        if exact_match_id is not None:
+            profile_ids.append(exact_match_id)
 
-        # 🔹 2. `username`이 포함된 사용자 검색 (중복 가능) → `urlname`과 중복되는 사용자는 제외
+        # 🔹 2. `username`이 포함된 사용자 (중복 가능) → `urlname`과 중복되는 사용자는 제외
         username_matches = Profile.objects.filter(
             Q(username__icontains=search_keyword)
-        ).exclude(id=urlname_matched_user_id)
+        ).exclude(id=exact_match_id).order_by('id')
+        profile_ids += username_matches.values_list('id', flat=True)
+        return profile_ids
+
+    @staticmethod
+    def fuzzy_search(search_keyword, page, limit):
+        """ ✅ 유사도 순 후보 ID 목록에서 요청한 페이지만 잘라서 프로필 조회 1번 """
+        matches = get_or_set_search_cache(
+            PROFILES, 'nickandid-fuzzy', search_keyword, lambda: similar_profiles(search_keyword))
+        page_matches = matches[(page - 1) * limit:page * limit]
+        profiles = Profile.objects.in_bulk([profile_id for profile_id, _ in page_matches])
 
-        results += [
+        results = []
+        for profile_id, similarity in page_matches:
+            profile = profiles.get(profile_id)
+            if profile is None:
+                continue
+            results.append({
+                "username": profile.username,
+                "urlname": profile.urlname,
+                "blog_name": profile.blog_name,
+                "intro": profile.intro,
+                "user_pic": profile.user_pic.url if profile.user_pic else None,
+                "similarity": round(similarity, 3),  # ✅ 0~1, 클수록 비슷함
+            })
+        next_page = page + 1 if len(matches) > page * limit else None
+        return Response({"users": results, "next_page": next_page})
+
+    @staticmethod
+    def chosung_search(search_keyword, page, limit):
+        """
+        ✅ 초성 키 접두어 검색 (검색어에 완성된 글자가 섞여 있어도 초성으로 바꿔서 비교)
+        대소문자 구분 없는 LIKE 'ㅎㄱ%' 조건이라 username_chosung / blog_name_chosung 인덱스 범위 조회로 처리
+        - 두 조건을 OR로 묶으면 ID 순 정렬 때문에 기본 키 전체 스캔을 고를 수 있으므로, 인덱스마다 따로
+          (offset + limit + 1)개까지의 ID만 조회해서 메모리에서 합친 뒤 이번 페이지 프로필만 조회
+        """
+        key = chosung_key(search_keyword)
+        if not key:
+            return Response({"users": [], "next_page": None})
+
+        offset = (page - 1) * limit
+        id_lists = [
+            Profile.objects.filter(**{f"{field}__istartswith": key})
+            .order_by('id').values_list('id', flat=True)[:offset + limit + 1]
+            for field in ('username_chosung', 'blog_name_chosung')
+        ]
+        page_ids = sorted(set().union(*id_lists))[offset:offset + limit + 1]
+        profiles = in_id_order(Profile.objects.all(), page_ids)
+        results = [
             {
-                "username": profile.username,  # ✅ Profile.username 사용
+                "username": profile.username,
                 "urlname": profile.urlname,
                 "blog_name": profile.blog_name,
                 "intro": profile.intro,
-                "user_pic": profile.user_pic.url if profile.user_pic else None
+                "user_pic": profile.user_pic.url if profile.user_pic else None,
             }
-            for profile in username_matches
+            for profile in profiles[:limit]
         ]
+        next_page = page + 1 if len(profiles) > limit else None
+        return Response({"users": results, "next_page": next_page})
 
-        return Response({"users": results})
 
 
+class SearchAutocompleteView(APIView):
+    """
+    블로그 이름 / 사용자명 / 블로그 ID(urlname) 자동완성 API
+    - 서버 메모리의 정렬된 색인에서 조회하므로 DB 쿼리 없음 (색인을 처음 만들거나 다시 만들 때만 조회)
+    - 순서: urlname 정확히 일치 → 접두어 일치 → 부분 문자열 일치
+    """
+    permission_classes = [IsAuthenticatedOrReadOnly]
+
+    @swagger_auto_schema(
+        operation_summary="블로그 자동완성(전체)",
+        operation_description="입력 중인 검색어로 시작하거나 포함하는 블로그 이름, 사용자명, 블로그 ID를 추천합니다.",
+        manual_parameters=[
+            openapi.Parameter('q', openapi.IN_QUERY, description="입력 중인 검색어", type=openapi.TYPE_STRING, required=True),
+            openapi.Parameter('limit', openapi.IN_QUERY, description="최대 개수 (기본 10, 최대 20)", type=openapi.TYPE_INTEGER),
+        ],
+        responses={200: openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "results": openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Items(type=openapi.TYPE_OBJECT)
+                )
+            }
+        )}
+    )
+    def get(self, request):
+        search_keyword = request.GET.get('q', '').strip()
+        if not search_keyword:
+            return Response({"results": []})
+        limit = parse_limit(request.GET.get('limit'), default=10, maximum=20)
+
+        results = [
+            {
+                "urlname": profile['urlname'],
+                "username": profile['username'],
+                "blog_name": profile['blog_name'],
+                "user_pic": file_url(profile['user_pic'], request),
+                "match": match,  # ✅ exact / prefix / substring
+            }
+            for profile, match in autocomplete(search_keyword, limit)
+        ]
+        return Response({"results": results})
+
 
 class GlobalPostSearchView(APIView):
     """
@@ -236,15 +347,19 @@ class GlobalPostSearchView(APIView):
     - 같은 게시물이 중복으로 반환되지 않도록 처리
     - 전체 공개(visibility='everyone') 게시글만 포함
     - 검색된 키워드 주변 텍스트를 포함한 미리보기(excerpt) 제공
+    - 관련도(제목 > 본문 > 이미지 설명 + 최신 글 가산점) 순으로 정렬, 커서 기반 페이지네이션
     """
     permission_classes = [IsAuthenticatedOrReadOnly]
 
     @swagger_auto_schema(
         operation_summary="블로그 글 검색 (전체)",
-        operation_description="전체 블로그에서 게시글을 검색합니다.",
+        operation_description="전체 블로그에서 게시글을 관련도 순으로 검색합니다. 다음 페이지는 next_cursor를 cursor로 넘겨서 조회합니다.",
         manual_parameters=[
-            openapi.Parameter('q', openapi.IN_QUERY, description="검색할 키워드", type=openapi.TYPE_STRING,
+            openapi.Parameter('q', openapi.IN_QUERY, description=SEARCH_QUERY_DESCRIPTION, type=openapi.TYPE_STRING,
                               required=True),
+            openapi.Parameter('cursor', openapi.IN_QUERY, description="이전 응답의 next_cursor", type=openapi.TYPE_STRING),
+            openapi.Parameter('limit', openapi.IN_QUERY, description="페이지 크기 (기본 20, 최대 50)", type=openapi.TYPE_INTEGER),
+            *FACET_PARAMETERS,
         ],
         responses={200: openapi.Schema(
             type=openapi.TYPE_OBJECT,
@@ -252,7 +367,9 @@ class GlobalPostSearchView(APIView):
                 "posts": openapi.Schema(
                     type=openapi.TYPE_ARRAY,
                     items=openapi.Items(type=openapi.TYPE_OBJECT)
-                )
+                ),
+                "next_cursor": openapi.Schema(type=openapi.TYPE_STRING, x_nullable=True),
+                "facets": FACETS_SCHEMA,
             }
         )}
     )
@@ -262,39 +379,29 @@ class GlobalPostSearchView(APIView):
         if not search_keyword or len(search_keyword) < 2:
             return Response({"error": "검색어는 2글자 이상 입력해주세요."}, status=400)
 
-        matched_post_ids = set()
-        excerpts = {}  # 🔹 post_id 별 excerpt 저장
+        cursor = request.GET.get('cursor')
+        after = decode_score_cursor(cursor) if cursor else None
+        limit = parse_limit(request.GET.get('limit'), default=20, maximum=50)
+        filters = parse_facet_filters(request.GET)
 
-        # 🔹 1. 제목에서 검색 (중복 방지 & 전체 공개 필터링)
-        title_matches = Post.objects.filter(
-            Q(title__icontains=search_keyword) & Q(visibility='everyone')
+        # 🔹 0~3. 검색 결과 (점수, ID) 목록과 패싯 개수는 (검색어, 필터)별로 캐시 (게시물이 바뀌면 세대 번호로 무효화)
+        cached = get_or_set_search_cache(
+            POSTS, 'global-post', search_keyword,
+            lambda: self.search(search_keyword, filters), variant=filters_key(filters),
+        )
+        ranking = cached["ranking"]
+
+        # 🔹 4. 커서 다음 상위 limit개만 힙으로 선택 (전체 정렬 없음)
+        page = top_page(ranking, limit, after)
+        next_cursor = encode_score_cursor(*page[limit - 1]) if len(page) > limit else None
+        page_ids = [post_id for _, post_id in page[:limit]]
+
+        # 🔹 5. 이번 페이지의 게시물(작성자 프로필 포함)과 미리보기만 조회 (미리보기는 페이지별로 캐시)
+        posts = in_id_order(Post.objects.select_related('author__profile'), page_ids)
+        snippets = get_or_set_search_cache(
+            POSTS, 'global-post-snippets', search_keyword,
+            lambda: build_snippets(page_ids, search_keyword), variant=str(page_ids),
         )
-        matched_post_ids.update(title_matches.values_list('id', flat=True))
-
-        # 🔹 2. 본문에서 검색 (중복 방지 & 전체 공개 필터링)
-        content_matches = PostText.objects.filter(
-            Q(content__icontains=search_keyword) & Q(post__visibility='everyone')
-        ).select_related('post')
-
-        for text in content_matches:
-            post_id = text.post.id
-            matched_post_ids.add(post_id)
-            if post_id not in excerpts:
-                excerpts[post_id] = get_excerpt(text.content, search_keyword)  # ✅ 기존 함수 사용
-
-        # 🔹 3. 이미지 캡션에서 검색 (중복 방지 & 전체 공개 필터링)
-        caption_matches = PostImage.objects.filter(
-            Q(caption__icontains=search_keyword) & Q(post__visibility='everyone')
-        ).select_related('post')
-
-        for image in caption_matches:
-            post_id = image.post.id
-            matched_post_ids.add(post_id)
-            if post_id not in excerpts:
-                excerpts[post_id] = get_excerpt(image.caption, search_keyword)  # ✅ 기존 함수 사용
-
-        # 🔹 4. 검색된 게시물 조회 (중복 제거됨)
-        posts = Post.objects.filter(id__in=matched_post_ids).select_related('author__profile')
 
         results = []
         for post in posts:
@@ -304,7 +411,20 @@ class GlobalPostSearchView(APIView):
                 "username": post.author.username,
                 "blog_name": profile.blog_name,
                 "created_at": post.created_at.strftime("%Y-%m-%d %H:%M"),
-                "excerpt": excerpts.get(post.id, post.title)  # 🔹 기본값: 제목
+                "excerpt": snippets[post.id]["excerpt"] if post.id in snippets else post.title,  # 🔹 기본값: 제목
+                "highlights": snippets[post.id]["highlights"] if post.id in snippets else [],
             })
 
-        return Response({"posts": results})
+        return Response({"posts": results, "next_cursor": next_cursor, "facets": cached["facets"]})
+
+    @staticmethod
+    def search(search_keyword, filters):
+        # 🔹 0~3. 전체 공개 게시물의 제목/본문/이미지 캡션 검색 (검색어 조합은 가장 드문 검색어부터 평가)
+        post_filter = Q(post__visibility='everyone') & date_filter(filters, 'post__')
+        matched_post_ids, facets = apply_facets(match_posts(search_keyword, post_filter), filters)
+
+        # 🔹 관련도 점수 (제목 > 본문 > 이미지 설명 + 최신 글 가산점) + 주제 키워드/주제/작성 월별 개수
+        return {
+            "ranking": score_posts(matched_post_ids, parse_query(search_keyword).terms),
+            "facets": facets,
+        }
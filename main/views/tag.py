@@ -0,0 +1,99 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import AllowAny
+from rest_framework import status
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+
+from ..models.post import Post
+from ..models.tag import Tag, PostTag, normalize_tag
+from ..serializers.fast import serialize_posts
+from ..utils.pagination import parse_limit, encode_cursor, cursor_filter
+from ..utils.visibility import viewer_posts_filter
+
+
+class TagPostListView(APIView):
+    """
+    태그별 최신 글 피드 API
+    ✅ PostTag (tag, created_at, post) 인덱스 범위 조회 + 커서 페이지네이션 (본문 텍스트 검색 없음)
+    ✅ 조회자가 볼 수 있는 글만 반환 (전체 공개 + 본인 글 + 서로이웃의 '서로 이웃 공개' 글)
+    """
+    permission_classes = [AllowAny]
+
+    @swagger_auto_schema(
+        operation_summary="태그별 글 목록",
+        operation_description="해당 태그가 달린 글을 최신순으로 반환합니다. 다음 페이지는 응답의 next_cursor를 cursor로 넘겨 조회합니다.",
+        manual_parameters=[
+            openapi.Parameter('name', openapi.IN_PATH, description="태그 이름 ('#' 없이)", type=openapi.TYPE_STRING, required=True),
+            openapi.Parameter('cursor', openapi.IN_QUERY, description="이전 응답의 next_cursor", required=False,
+                              type=openapi.TYPE_STRING),
+            openapi.Parameter('limit', openapi.IN_QUERY, description="페이지 크기 (기본 20, 최대 50)", required=False,
+                              type=openapi.TYPE_INTEGER),
+        ],
+        responses={200: openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "tag": openapi.Schema(type=openapi.TYPE_STRING, description="정규화된 태그 이름"),
+                "post_count": openapi.Schema(type=openapi.TYPE_INTEGER, description="태그가 달린 게시물 수"),
+                "results": openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Items(type=openapi.TYPE_OBJECT),
+                                          description="PostSerializer와 같은 형태"),
+                "next_cursor": openapi.Schema(type=openapi.TYPE_STRING, description="다음 페이지 커서 (마지막이면 null)"),
+            }
+        )}
+    )
+    def get(self, request, name, *args, **kwargs):
+        limit = parse_limit(request.query_params.get('limit'), maximum=50)
+        tag = Tag.objects.filter(name=normalize_tag(name)).values('id', 'name', 'post_count').first()
+        if tag is None:
+            return Response({"tag": normalize_tag(name), "post_count": 0, "results": [], "next_cursor": None})
+
+        entries = list(
+            PostTag.objects.filter(
+                viewer_posts_filter(request.user, prefix='post__'),
+                cursor_filter(request.query_params.get('cursor'), pk_field='post_id'),
+                tag_id=tag['id'], post__is_complete=True,
+            ).order_by('-created_at', '-post_id').values_list('post_id', 'created_at')[:limit + 1]
+        )
+
+        page = entries[:limit]
+        posts = Post.objects.filter(id__in=[post_id for post_id, _ in page])
+        posts = {post['id']: post for post in serialize_posts(posts, request)}
+        next_cursor = encode_cursor(page[-1][1], page[-1][0]) if len(entries) > limit else None
+
+        return Response({
+            "tag": tag['name'],
+            "post_count": tag['post_count'],
+            "results": [posts[post_id] for post_id, _ in page if post_id in posts],
+            "next_cursor": next_cursor,
+        }, status=status.HTTP_200_OK)
+
+
+class PopularTagListView(APIView):
+    """
+    인기 태그 목록 API
+    ✅ 태그를 달고 뗄 때 증감해 둔 post_count 인덱스로 바로 정렬 (집계 쿼리 없음)
+    """
+    permission_classes = [AllowAny]
+
+    @swagger_auto_schema(
+        operation_summary="인기 태그 목록",
+        operation_description="게시물이 많이 달린 태그를 순서대로 반환합니다.",
+        manual_parameters=[
+            openapi.Parameter('limit', openapi.IN_QUERY, description="반환할 태그 수 (기본 20, 최대 100)", required=False,
+                              type=openapi.TYPE_INTEGER),
+        ],
+        responses={200: openapi.Schema(
+            type=openapi.TYPE_ARRAY,
+            items=openapi.Schema(
+                type=openapi.TYPE_OBJECT,
+                properties={
+                    "name": openapi.Schema(type=openapi.TYPE_STRING, description="태그 이름"),
+                    "post_count": openapi.Schema(type=openapi.TYPE_INTEGER, description="태그가 달린 게시물 수"),
+                }
+            )
+        )}
+    )
+    def get(self, request, *args, **kwargs):
+        limit = parse_limit(request.query_params.get('limit'))
+        tags = Tag.objects.filter(post_count__gt=0).order_by('-post_count', 'name').values('name', 'post_count')[:limit]
+        return Response(list(tags), status=status.HTTP_200_OK)
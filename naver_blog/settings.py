@@ -195,3 +195,17 @@ SWAGGER_SETTINGS = {
         'BearerAuth': []
     }],
 }
+
+# ✅ 캐시 설정
+# 블로그 캐시 / 검색 결과 캐시 / 자동완성 색인은 세대 번호(main.utils.cache)를 캐시에 두고 프로세스끼리 변경을 알린다.
+# 프로세스 메모리 캐시(LocMemCache)는 프로세스마다 따로라서, 여러 프로세스로 운영할 때는 공유 캐시로 바꿔야 한다.
+# 예) 'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': 'redis://127.0.0.1:6379/1'
+# (배포 전 manage.py check --deploy에서 프로세스 메모리 캐시면 main.E001 오류 → main/checks.py)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# ✅ 게시물 본문을 Post.body 문서에서 먼저 읽을지 여부 (False면 PostText 행만 사용)
+POST_BODY_DOCUMENT_READ = True
@@ -23,14 +23,17 @@ from main.views.login import LoginView
 from main.views.logout import LogoutView
 from main.views.account import PasswordUpdateView
 from main.views.profile import ProfileDetailView, ProfilePublicView, ProfileUrlnameUpdateView
-from main.views.post import PostDetailView,PostMyView,PostMyDetailView,PostMutualView,PostManageView,PostListView,PostCreateView,DraftPostListView,DraftPostDetailView, PostMyCurrentView, PostPublicCurrentView, PostCountView
+from main.views.post import PostDetailView,PostMyView,PostMyDetailView,PostMutualView,PostManageView,PostListView,PostCreateView,DraftPostListView,DraftPostDetailView, PostMyCurrentView, PostPublicCurrentView, PostCountView, PostCategoryListView, PostArchiveView, PostMutualUnreadCountView, PostReadView, PostTopicFeedView, PostRelatedView
 from main.views.comment import CommentListView, CommentDetailView
 from main.views.heart import ToggleHeartView, PostHeartUsersView, PostHeartCountView
 from main.views.commentHeart import ToggleCommentHeartView, CommentHeartCountView
 from main.views.neighbor import NeighborView,NeighborAcceptView,NeighborRejectView,NeighborRequestListView,PublicNeighborListView, MyNeighborListView, MyNeighborDeleteView, NeighborNumberView
 from main.views.news import MyNewsListView
 from main.views.activity import MyActivityListView
-from main.views.search import BlogPostSearchView, GlobalBlogSearchView, GlobalNickAndIdSearchView, GlobalPostSearchView
+from main.views.bundle import PostPageView, BlogHomeView
+from main.views.recommendation import BlogRecommendationView
+from main.views.tag import TagPostListView, PopularTagListView
+from main.views.search import BlogPostSearchView, GlobalBlogSearchView, GlobalNickAndIdSearchView, GlobalPostSearchView, SearchAutocompleteView
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 from rest_framework.permissions import AllowAny
@@ -83,6 +86,7 @@ urlpatterns = [
     path('search/global-blog/', GlobalBlogSearchView.as_view(), name='global-blog-search'),
     path('search/global-nickandid/', GlobalNickAndIdSearchView.as_view(), name='global-nickandid-search'),
     path('search/global-post/', GlobalPostSearchView.as_view(), name='global-post-search'),
+    path('search/autocomplete/', SearchAutocompleteView.as_view(), name='search-autocomplete'),
 
     # ✅ 게시물 관련 API
 
@@ -95,15 +99,30 @@ urlpatterns = [
 
     # 게시물 개수 세기
     path('posts/count/<str:urlname>/', PostCountView.as_view(), name='post-count'),
+    # 블로그 카테고리 목록 (카테고리별 게시물 개수)
+    path('posts/categories/<str:urlname>/', PostCategoryListView.as_view(), name='post-category-list'),
+    # 블로그 월별 아카이브 (연/월별 게시물 개수)
+    path('posts/archive/<str:urlname>/', PostArchiveView.as_view(), name='post-archive'),
 
     #타인 게시물 관련 API
 
+    path('posts/topics/', PostTopicFeedView.as_view(), name='post-topic-feed'),  # 주제(keyword/subject)별 최신 글 피드 (커서 페이지네이션)
     path('posts/', PostListView.as_view(), name='post-list'),  # 타인 게시물 목록 조회 (GET, 쿼리 파라미터 활용)
     path('posts/<int:pk>/', PostDetailView.as_view(), name='post-detail'),  # 타인 게시물 상세 조회 (GET)
+    path('posts/<int:post_id>/page/', PostPageView.as_view(), name='post-page'),  # 게시물 페이지 (상세 + 댓글 + 좋아요) 한 번에 조회
+    path('posts/<int:post_id>/related/', PostRelatedView.as_view(), name='post-related'),  # 관련 글 (본문 유사도 기준)
+    path('blog/<str:urlname>/home/', BlogHomeView.as_view(), name='blog-home'),  # 블로그 홈 (프로필 + 글 개수 + 서로이웃 수 + 최근 글) 한 번에 조회
+    path('tags/popular/', PopularTagListView.as_view(), name='tag-popular'),  # 인기 태그 목록
+    path('tags/<str:name>/posts/', TagPostListView.as_view(), name='tag-post-list'),  # 태그별 글 목록 (커서 페이지네이션)
+    path('blogs/recommendations/', BlogRecommendationView.as_view(), name='blog-recommendations'),  # 추천 블로그 (함께 아는 서로이웃 + 관심 주제)
     path('posts/<str:urlname>/current/', PostPublicCurrentView.as_view(), name='post-public-recent'),
 
     #서로 이웃 새글 API
     path('posts/mutual/recentweekly', PostMutualView.as_view(), name='post-mutual'),
+    path('posts/mutual/recentweekly/unread-count', PostMutualUnreadCountView.as_view(), name='post-mutual-unread-count'),
+
+    # 게시물 읽음 처리 (여러 개)
+    path('posts/read/', PostReadView.as_view(), name='post-read'),
 
     #임시 저장된 게시물 관련 API
     path('posts/drafts/', DraftPostListView.as_view(), name='draft_post_list'),  # 임시 저장된 게시물 목록 조회